@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, File, UploadFile, Form, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
+from app.api.learning_path_routes import encode_ndjson, encode_sse
+from app.domain.models import SummaryOptions
+from app.domain.exercises_models import ExerciseType
+from app.services.bundle_service import ARTIFACTS, generate_bundle, stream_bundle
+from app.services.document_service import resolve_content
+
+router = APIRouter(prefix="/bundle", tags=["Bundle"])
+
+def bundle_options(
+    artifacts: str = Form(",".join(ARTIFACTS), description="Comma-separated artifacts: summary, flashcards, exercises"),
+    # Summary
+    character: str = Form("review"),
+    language_register: str = Form("formal"),
+    language: str = Form("English"),
+    extension: str = Form("medium"),
+    include_references: bool = Form(False),
+    include_examples: bool = Form(False),
+    include_conclusions: bool = Form(False),
+    # Flashcards
+    flashcards_count: int = Form(default=5),
+    difficulty_level: str = Form(default="medium"),
+    focus_area: str = Form(default="key concepts"),
+    # Exercises
+    exercises_count: int = Form(5, description="Number of exercises to generate"),
+    exercises_difficulty: str = Form("medium", description="Difficulty level of the exercises"),
+    exercises_types: ExerciseType = Form(ExerciseType.multiple_choice, description="Types of exercises to generate"),
+) -> dict:
+    requested = [name.strip() for name in artifacts.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in ARTIFACTS]
+    if unknown or not requested:
+        raise HTTPException(status_code=422, detail=f"artifacts must be a subset of {', '.join(ARTIFACTS)}")
+
+    return {
+        "artifacts": requested,
+        "summary_options": SummaryOptions(
+            character=character,
+            language_register=language_register,
+            language=language,
+            extension=extension,
+            include_references=include_references,
+            include_examples=include_examples,
+            include_conclusions=include_conclusions
+        ),
+        "flashcards_count": flashcards_count,
+        "difficulty_level": difficulty_level,
+        "focus_area": focus_area,
+        "exercises_count": exercises_count,
+        "exercises_difficulty": exercises_difficulty,
+        "exercises_types": exercises_types,
+    }
+
+@router.post(
+    "/",
+    response_model=dict,
+    description="""
+Generate a summary, flashcards and exercises from the same files in one request.
+
+The files are uploaded and extracted once, and the artifacts are generated concurrently.
+Takes the same form fields as /summarize, /flashcard and /generate-exercises, plus
+`artifacts` to choose which ones to generate. An artifact that fails is returned as
+{"error": ...} next to the others.
+""",
+)
+async def bundle(
+    files: List[UploadFile] = File(default=[], description="PDF or DOCX files"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
+    options: dict = Depends(bundle_options),
+):
+    joined_content = await resolve_content(files, document_id)
+
+    return await generate_bundle(joined_content, **options)
+
+@router.post(
+    "/stream",
+    description="""
+Same as /bundle, but sends each artifact as soon as it is ready.
+
+The response is NDJSON (one JSON event per line), or Server-Sent Events when the
+request sends `Accept: text/event-stream`. Events:
+- summary / flashcards / exercises: the artifact, in the order they finish
+- error: {"artifact", "detail"} for an artifact that failed
+- done: {"artifacts"} with the artifacts that were requested
+""",
+)
+async def stream_bundle_endpoint(
+    request: Request,
+    files: List[UploadFile] = File(default=[], description="PDF or DOCX files"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
+    options: dict = Depends(bundle_options),
+):
+    joined_content = await resolve_content(files, document_id)
+
+    events = jsonable_events(stream_bundle(joined_content, **options))
+
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(encode_sse(events), media_type="text/event-stream")
+    return StreamingResponse(encode_ndjson(events), media_type="application/x-ndjson")
+
+
+async def jsonable_events(events: AsyncIterator[dict]) -> AsyncIterator[dict]:
+    # Flashcards come back as pydantic models
+    async for event in events:
+        yield jsonable_encoder(event)
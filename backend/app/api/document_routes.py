@@ -0,0 +1,31 @@
+from fastapi import APIRouter, File, UploadFile, HTTPException
+from typing import List
+from app.services.document_service import create_document, describe_document
+
+router = APIRouter(prefix="/documents", tags=["Documents"])
+
+@router.post(
+    "/",
+    response_model=dict,
+    status_code=201,
+    description="""
+Upload files once and get a document_id to use in place of files.
+
+The files are extracted and normalized, and stored under a hash of their content,
+so uploading the same files again returns the same document_id. Every endpoint
+that takes files also takes a `document_id` form field. Documents that have not
+been used for a while may be removed when the store is full; endpoints then
+answer 404 and the files have to be uploaded again.
+""",
+)
+async def upload_document(
+    files: List[UploadFile] = File(..., description="PDF or DOCX files"),
+):
+    return await create_document(files)
+
+@router.get("/{document_id}", response_model=dict)
+async def get_document(document_id: str):
+    document = await describe_document(document_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return document
@@ -1,28 +1,50 @@
-from fastapi import APIRouter, File, UploadFile, Form
-from typing import List
-from app.services.exercise_generation_service import generate_exercises
-from app.infrastructure.files.file_manager import extract_file_contents
+from fastapi import APIRouter, File, UploadFile, Form, HTTPException
+from typing import Dict, List, Optional
+import json
+from app.services.exercise_generation_service import generate_exercises, generate_mixed_exercises
+from app.services.document_service import resolve_content
 from app.domain.exercises_models import ExercisesByTopicRequest, ExerciseType
 
 router = APIRouter(prefix="/generate-exercises", tags=["Generate Exercises"])
 
+def parse_distribution(distribution) -> Dict[ExerciseType, int]:
+    """Validate an exercises distribution given as a dict or a JSON object string"""
+    try:
+        if isinstance(distribution, str):
+            distribution = json.loads(distribution)
+        parsed = {ExerciseType(kind): int(count) for kind, count in distribution.items()}
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(
+            status_code=422,
+            detail="exercises_distribution must map exercise types to counts, e.g. {\"multiple_choice\": 5, \"true_false\": 3}"
+        )
+    if any(count < 0 for count in parsed.values()) or not any(parsed.values()):
+        raise HTTPException(status_code=422, detail="exercises_distribution counts must be non-negative and not all zero")
+    return parsed
+
 
 @router.post("/", response_model=dict)
 async def exercises(
     files: List[UploadFile] = File(default=[], description="Files to be summarized"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
     exercises_count: int = Form(5, description="Number of exercises to generate"),
     exercises_difficulty: str = Form("medium", description="Difficulty level of the exercises"),
     exercises_types: ExerciseType = Form(ExerciseType.multiple_choice, description="Types of exercises to generate"),
+    exercises_distribution: Optional[str] = Form(None, description='JSON object of counts per type, e.g. {"multiple_choice": 5, "true_false": 3}. Overrides exercises_count and exercises_types'),
+    topic: Optional[str] = Form(None, description="Topic to focus on; large documents are narrowed to the parts about it"),
 ):
+    distribution = parse_distribution(exercises_distribution) if exercises_distribution else None
+
     # Content extraction
-    data = await extract_file_contents(files)
-    joined_content = "\n\n".join(
-        "\n\n".join(page for page in file_content) for file_content in data
-    )
+    joined_content = await resolve_content(files, document_id, required=False)
+
+    if distribution:
+        exercises = await generate_mixed_exercises(joined_content, distribution, exercises_difficulty, topic)
+        return {"exercises": exercises}
 
     # Exercises Generation
     exercises = await generate_exercises(
-        joined_content, exercises_count, exercises_difficulty, exercises_types
+        joined_content, exercises_count, exercises_difficulty, exercises_types, topic
     )
 
     return {"exercises": exercises}
@@ -44,9 +66,21 @@ Parameters:
     - true_false
     - short_answer
     - matching
+- exercises_distribution: Optional counts per type to mix several types in one set,
+  e.g. {"multiple_choice": 5, "true_false": 3}. Overrides exercises_count and exercises_types.
+  The types are generated concurrently and merged in the given order, each exercise
+  tagged with its exercise_type.
 """,
 )
 async def exercises_by_topic(request: ExercisesByTopicRequest):
+    if request.exercises_distribution:
+        exercises = await generate_mixed_exercises(
+            request.topic,
+            parse_distribution(request.exercises_distribution),
+            request.exercises_difficulty
+        )
+        return {"exercises": exercises}
+
     # Exercises Generation
     exercises = await generate_exercises(
         request.topic,
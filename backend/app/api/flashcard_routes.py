@@ -1,8 +1,8 @@
 from fastapi import APIRouter, File, Form, UploadFile
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 from app.services.flashcar_generation_service import generate_flashcards
-from app.infrastructure.files.file_manager import extract_file_contents
+from app.services.document_service import resolve_content
 from app.domain.models import FlashcardRequest
 
 
@@ -17,14 +17,14 @@ class FlashcardByTopicRequest(BaseModel):
 @router.post("/", response_model=dict)
 async def flashcard(
     files: List[UploadFile] = File(default=[], description="Files to be summarized"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
     flashcards_count: int = Form(default=5),
     difficulty_level: str = Form(default="medium"),
     focus_area: str = Form(default="key concepts")
 ):
 
     # Content extraction
-    data = await extract_file_contents(files)
-    joined_content = "\n\n".join("\n\n".join(page for page in file_content) for file_content in data)
+    joined_content = await resolve_content(files, document_id, required=False)
 
     #Flashcard Request Construction
     flashcard_request = FlashcardRequest(
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
-from app.domain.games_models import GameOptions
-from app.services.game_generation_service import generate_game
+from app.domain.games_models import GameOptions, WordSearchBatchRequest
+from app.services.game_generation_service import generate_game, generate_word_search_batch, get_game_pool
 
 router = APIRouter(prefix="/games", tags=["Games"])
 
@@ -14,8 +14,37 @@ Parameters:
 - topic: The topic for the game (default: "any topic").
 - game_type: The type of game to generate, either "word_search" or "crossword" (default: "word_search").
 - language: The language for the game (default: "English").
+- difficulty: "easy", "medium" or "hard" (default: "medium"). For word searches, easy words run
+  right or down, medium adds forward diagonals, and hard uses all 8 directions, backwards included.
+
+Word searches come with a ready-to-render `grid` and the `placements` (cells) of every word.
+Crosswords come with a `grid` and numbered `placements` with their clues.
 """
 )
 async def create_game(options: GameOptions):
     result = await generate_game(options)
     return result
+
+
+@router.post(
+        "/word-search/batch",
+        response_model=dict,
+        description="""
+Build several distinct word-search puzzles from one word list (e.g. printable sets).
+Parameters:
+- words: The words to hide (1-50).
+- count: Number of puzzles (1-100, default: 10).
+- difficulty: "easy", "medium" or "hard" (default: "medium").
+- language: Language of the filler letters (default: "Spanish").
+- size: Minimum grid size (5-50); the grid grows if the words do not fit.
+- seed: Optional seed to get the same puzzles again.
+"""
+)
+async def word_search_batch(request: WordSearchBatchRequest):
+    puzzles = await generate_word_search_batch(request)
+    return {"puzzles": puzzles}
+
+
+@router.get("/pool/stats", response_model=dict)
+async def game_pool_stats():
+    return get_game_pool().stats()
@@ -0,0 +1,125 @@
+from fastapi import APIRouter, File, UploadFile, Form, HTTPException
+from typing import List, Optional
+import asyncio
+from app.core.settings import get_settings
+from app.domain.models import SummaryOptions
+from app.services.job_service import get_job_manager, keep_job_input
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+def check_jobs_enabled() -> None:
+    # Checked before get_job_manager(), which would create the job database
+    if not get_settings().JOBS_ENABLED or not get_job_manager().running:
+        raise HTTPException(status_code=503, detail="Background jobs are disabled")
+
+def job_store():
+    check_jobs_enabled()
+    return get_job_manager().store
+
+def submit_job(kind: str, params: dict) -> dict:
+    job_id = get_job_manager().submit(kind, params)
+    return {"job_id": job_id, "status": "queued", "status_url": f"/api/jobs/{job_id}"}
+
+async def get_job_or_404(read, job_id: str) -> dict:
+    # Polled often: read on a thread, and only the columns the endpoint needs
+    job = await asyncio.to_thread(read, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+@router.post(
+    "/summarize",
+    status_code=202,
+    response_model=dict,
+    description="Same as /summarize, but returns a job id right away. Poll /jobs/{job_id} for the result.",
+)
+async def summarize_job(
+    files: List[UploadFile] = File(default=[], description="PDFs to be summarized"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
+    character: str = Form("review"),
+    language_register: str = Form("formal"),
+    language: str = Form("English"),
+    extension: str = Form("medium"),
+    include_references: bool = Form(False),
+    include_examples: bool = Form(False),
+    include_conclusions: bool = Form(False)
+):
+    options = SummaryOptions(
+        character=character,
+        language_register=language_register,
+        language=language,
+        extension=extension,
+        include_references=include_references,
+        include_examples=include_examples,
+        include_conclusions=include_conclusions
+    )
+
+    check_jobs_enabled()
+    # The uploads are extracted by the job, so the job id is returned right away
+    job_input = await keep_job_input(files, document_id)
+
+    return submit_job("summarize", {**job_input, "options": options.model_dump()})
+
+@router.post(
+    "/learning-path",
+    status_code=202,
+    response_model=dict,
+    description="Same as /learning-path/generate, but returns a job id right away. Poll /jobs/{job_id} for progress and the result.",
+)
+async def learning_path_job(
+    files: List[UploadFile] = File(default=[], description="PDF or DOCX files"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
+    difficulty: str = Form("intermediate"),
+    total_duration: str = Form("4 weeks"),
+    modules_count: int = Form(2, ge=1, le=10),
+    sessions_per_module: int = Form(2, ge=1, le=8),
+    topics_per_session: int = Form(2, ge=1, le=5),
+    flashcards_per_topic: int = Form(3, ge=2, le=10),
+    questions_per_topic: int = Form(3, ge=2, le=10),
+    include_theory: bool = Form(True),
+    language: str = Form("Spanish"),
+    auto_structure: bool = Form(False, description="Let AI decide optimal structure"),
+    learning_approach: str = Form("balanced", description="theoretical/practical/balanced/project-based/fast"),
+    language_register: str = Form("neutral", description="formal/neutral/informal/technical/beginner/advanced"),
+    detail_level: str = Form("intermediate", description="basic/intermediate/advanced/expert/master"),
+    generate_full_content: bool = Form(False, description="Generate complete content for all sessions")
+):
+    check_jobs_enabled()
+    job_input = await keep_job_input(files, document_id)
+
+    return submit_job("learning_path", {
+        **job_input,
+        "options": {
+            "difficulty": difficulty,
+            "total_duration": total_duration,
+            "modules_count": modules_count,
+            "sessions_per_module": sessions_per_module,
+            "topics_per_session": topics_per_session,
+            "flashcards_per_topic": flashcards_per_topic,
+            "questions_per_topic": questions_per_topic,
+            "include_theory": include_theory,
+            "language": language,
+            "auto_structure": auto_structure,
+            "learning_approach": learning_approach,
+            "language_register": language_register,
+            "detail_level": detail_level,
+            "generate_full_content": generate_full_content,
+        },
+    })
+
+@router.get("/{job_id}", response_model=dict)
+async def job_status(job_id: str):
+    return await get_job_or_404(job_store().get_status, job_id)
+
+@router.get("/{job_id}/partial", response_model=dict)
+async def job_partial(job_id: str):
+    return await get_job_or_404(job_store().get_partial, job_id)
+
+@router.get("/{job_id}/result", response_model=dict)
+async def job_result(job_id: str):
+    job = await get_job_or_404(job_store().get, job_id)
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    if job["status"] != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+    return job["result"]
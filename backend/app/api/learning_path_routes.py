@@ -1,13 +1,16 @@
-from fastapi import APIRouter, File, UploadFile, Form
-from typing import List
-from app.services.learning_path_service import generate_learning_path
-from app.infrastructure.files.file_manager import extract_file_contents
+from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
+import json
+from app.services.learning_path_service import generate_learning_path, stream_learning_path
+from app.services.document_service import resolve_content
 
 router = APIRouter(prefix="/learning-path", tags=["Learning Path"])
 
 @router.post("/generate", response_model=dict)
 async def generate_learning_path_endpoint(
-    files: List[UploadFile] = File(..., description="PDF or DOCX files"),
+    files: List[UploadFile] = File(default=[], description="PDF or DOCX files"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
     difficulty: str = Form("intermediate"),
     total_duration: str = Form("4 weeks"),
     modules_count: int = Form(2, ge=1, le=10),
@@ -28,8 +31,7 @@ async def generate_learning_path_endpoint(
     
     try:
         # Extract content (same as Summarizer)
-        data = await extract_file_contents(files)
-        joined_content = "\n\n".join("\n\n".join(page for page in file_content) for file_content in data)
+        joined_content = await resolve_content(files, document_id)
         
         # Generate learning path
         learning_path = await generate_learning_path(
@@ -51,18 +53,89 @@ async def generate_learning_path_endpoint(
         )
         
         if "error" in learning_path:
-            from fastapi import HTTPException
             raise HTTPException(status_code=500, detail=learning_path["error"])
         
         return {"learning_path": learning_path}
         
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
-        from fastapi import HTTPException
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+@router.post(
+    "/generate/stream",
+    description="""
+Same as /generate, but streams the learning path while it is generated.
+
+The response is NDJSON (one JSON event per line), or Server-Sent Events when the
+request sends `Accept: text/event-stream`. Events:
+- path: the learning path header (id, title, description, totalDuration, difficulty, createdAt)
+- module: a module with its id and the headers of its sessions
+- session: {"moduleId", "session"} with the full session content
+- done: {"modules", "sessions"} counts
+- error: {"detail"}
+
+IDs are the same ones /generate returns.
+""",
+)
+async def stream_learning_path_endpoint(
+    request: Request,
+    files: List[UploadFile] = File(default=[], description="PDF or DOCX files"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
+    difficulty: str = Form("intermediate"),
+    total_duration: str = Form("4 weeks"),
+    modules_count: int = Form(2, ge=1, le=10),
+    sessions_per_module: int = Form(2, ge=1, le=8),
+    topics_per_session: int = Form(2, ge=1, le=5),
+    flashcards_per_topic: int = Form(3, ge=2, le=10),
+    questions_per_topic: int = Form(3, ge=2, le=10),
+    include_theory: bool = Form(True),
+    language: str = Form("Spanish"),
+    auto_structure: bool = Form(False, description="Let AI decide optimal structure"),
+    learning_approach: str = Form("balanced", description="theoretical/practical/balanced/project-based/fast"),
+    language_register: str = Form("neutral", description="formal/neutral/informal/technical/beginner/advanced"),
+    detail_level: str = Form("intermediate", description="basic/intermediate/advanced/expert/master"),
+    generate_full_content: bool = Form(False, description="Generate complete content for all sessions")
+):
+    # Extraction errors are still reported with a regular status code
+    joined_content = await resolve_content(files, document_id)
+
+    events = stream_learning_path(
+        content=joined_content,
+        difficulty=difficulty,
+        total_duration=total_duration,
+        modules_count=modules_count,
+        sessions_per_module=sessions_per_module,
+        topics_per_session=topics_per_session,
+        flashcards_per_topic=flashcards_per_topic,
+        questions_per_topic=questions_per_topic,
+        include_theory=include_theory,
+        language=language,
+        auto_structure=auto_structure,
+        learning_approach=learning_approach,
+        language_register=language_register,
+        detail_level=detail_level,
+        generate_full_content=generate_full_content
+    )
+
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(encode_sse(events), media_type="text/event-stream")
+    return StreamingResponse(encode_ndjson(events), media_type="application/x-ndjson")
+
+
+async def encode_ndjson(events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    async for event in events:
+        yield json.dumps(event, ensure_ascii=False) + "\n"
+
+
+async def encode_sse(events: AsyncIterator[dict]) -> AsyncIterator[str]:
+    async for event in events:
+        yield f"event: {event['event']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+
+
 @router.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "learning-path"}
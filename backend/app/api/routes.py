@@ -5,6 +5,9 @@ from app.api.flashcard_routes import router as flashcard_router
 from app.api.roadmap_routes import router as roadmap_router
 from app.api.game_routes import router as game_router
 from app.api.learning_path_routes import router as learning_path_router
+from app.api.job_routes import router as job_router
+from app.api.bundle_routes import router as bundle_router
+from app.api.document_routes import router as document_router
 
 router = APIRouter()
 router.include_router(summarize_router)
@@ -12,4 +15,7 @@ router.include_router(exercise_router)
 router.include_router(flashcard_router)
 router.include_router(roadmap_router)
 router.include_router(game_router)
-router.include_router(learning_path_router)
\ No newline at end of file
+router.include_router(learning_path_router)
+router.include_router(job_router)
+router.include_router(bundle_router)
+router.include_router(document_router)
\ No newline at end of file
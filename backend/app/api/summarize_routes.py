@@ -1,15 +1,16 @@
 from fastapi import APIRouter, File, UploadFile, Form
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 from app.services.summarize_service import summarize_content
-from app.infrastructure.files.file_manager import extract_file_contents
+from app.services.document_service import resolve_content
 from app.domain.models import SummaryOptions
 
 router = APIRouter(prefix="/summarize", tags=["Summaries"])
 
 @router.post("/", response_model=dict)
 async def summarize(
-    files: List[UploadFile] = File(..., description="PDFs to be summarized"),
+    files: List[UploadFile] = File(default=[], description="PDFs to be summarized"),
+    document_id: Optional[str] = Form(None, description="Id from /documents, in place of files"),
     character: str = Form("review"),
     language_register: str = Form("formal"),
     language: str = Form("English"),
@@ -29,8 +30,7 @@ async def summarize(
     )
 
     # Content extraction
-    data = await extract_file_contents(files)    
-    joined_content = "\n\n".join("\n\n".join(page for page in file_content) for file_content in data)
+    joined_content = await resolve_content(files, document_id)
 
     # Summary generation
     summary = await summarize_content(joined_content, options)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import List, Optional
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file='.env', env_file_encoding='utf-8', extra='ignore')
@@ -9,7 +10,93 @@ class Settings(BaseSettings):
     GEMINI_MODEL: str
     GEMINI_MODEL_PRO: str
 
+    # Outbound Gemini calls per model: max concurrent calls and requests per minute.
+    # Both are halved on 429/503 responses and recover gradually.
+    GEMINI_MODEL_MAX_CONCURRENCY: int = 8
+    GEMINI_MODEL_RPM: int = 300
+    GEMINI_MODEL_PRO_MAX_CONCURRENCY: int = 4
+    GEMINI_MODEL_PRO_RPM: int = 60
+
+    # Reuse model clients (and their connections) across requests
+    MODEL_POOL_ENABLED: bool = True
+
+    # Model response cache (set RESPONSE_CACHE_DIR to enable the on-disk tier)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 60 * 60
+    RESPONSE_CACHE_DIR: Optional[str] = None
+    RESPONSE_CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024
+
+    # Extracted document text cache, keyed by file hash (set EXTRACTION_CACHE_DIR to persist it)
+    EXTRACTION_CACHE_ENABLED: bool = True
+    EXTRACTION_CACHE_MAX_ENTRIES: int = 256
+    EXTRACTION_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
+    EXTRACTION_CACHE_DIR: Optional[str] = None
+    EXTRACTION_CACHE_DISK_MAX_BYTES: int = 1024 * 1024 * 1024
+
+    # Document extraction process pool (None = min(4, cpu count), 0 = use threads)
+    EXTRACTION_WORKERS: Optional[int] = None
+    # Jobs a single request may run at once (None = half of the workers)
+    EXTRACTION_MAX_JOBS_PER_REQUEST: Optional[int] = None
+
+    # PDFs above this page count are split into page ranges extracted in parallel
+    # (at most EXTRACTION_MAX_JOBS_PER_REQUEST ranges of at least PDF_MIN_PAGES_PER_JOB pages)
+    PDF_PARALLEL_ENABLED: bool = True
+    PDF_PARALLEL_PAGE_THRESHOLD: int = 100
+    PDF_MIN_PAGES_PER_JOB: int = 25
+
+    # Uploads are copied in chunks to temporary files (UPLOAD_TMP_DIR, default: system temp dir)
+    # for extraction. The request body has already been received by then, so the limits
+    # protect the copies and extraction: requests above the per-request limit get 413, and
+    # uploads that would exceed the bytes held by all requests at once get 503.
+    UPLOAD_TMP_DIR: Optional[str] = None
+    MAX_UPLOAD_BYTES_PER_REQUEST: int = 100 * 1024 * 1024
+    MAX_INFLIGHT_UPLOAD_BYTES: int = 1024 * 1024 * 1024
+
+    # Documents uploaded to /api/documents, reusable by document_id in place of files.
+    # The least recently used documents are removed once the store exceeds DOCUMENT_STORE_MAX_BYTES.
+    DOCUMENT_STORE_DIR: str = "data/documents"
+    DOCUMENT_STORE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024
+    DOCUMENT_STORE_MEMORY_MAX_ENTRIES: int = 64
+    DOCUMENT_STORE_MEMORY_MAX_BYTES: int = 128 * 1024 * 1024
+
+    # Content above this estimated token count is summarized in chunks (map-reduce)
+    SUMMARY_CHUNKING_THRESHOLD_TOKENS: int = 60_000
+    SUMMARY_CHUNK_TOKENS: int = 12_000
+    SUMMARY_MAP_CONCURRENCY: int = 4
+
+    # Content above this estimated token count is narrowed (BM25) to the chunks relevant to
+    # the flashcard focus area, exercise topic or learning path session
+    RETRIEVAL_ENABLED: bool = True
+    RETRIEVAL_CONTENT_BUDGET_TOKENS: int = 12_000
+    RETRIEVAL_CHUNK_TOKENS: int = 250
+
+    # Full-content learning paths: outline first, then sessions generated concurrently
+    LEARNING_PATH_FANOUT_ENABLED: bool = True
+    LEARNING_PATH_SESSION_CONCURRENCY: int = 4
+
+    # Background jobs (/api/jobs), persisted in SQLite; finished jobs expire after the TTL.
+    # Uploads are kept in JOBS_UPLOAD_DIR until their job has extracted them, and partial
+    # output is saved at most every JOBS_PARTIAL_INTERVAL_SECONDS.
+    JOBS_ENABLED: bool = True
+    JOBS_DB_PATH: str = "data/jobs.sqlite3"
+    JOBS_UPLOAD_DIR: str = "data/job_uploads"
+    JOBS_PARTIAL_INTERVAL_SECONDS: float = 1.0
+    JOBS_MAX_WORKERS: int = 2
+    JOBS_TTL_SECONDS: int = 24 * 60 * 60
+    JOBS_CLEANUP_INTERVAL_SECONDS: int = 5 * 60
+
+    # Pre-generated /games results for popular keys, given as "topic|game_type|language"
+    # (JSON list in the environment, e.g. GAME_POOL_KEYS='["python|crossword|Spanish"]')
+    GAME_POOL_ENABLED: bool = True
+    GAME_POOL_KEYS: List[str] = []
+    GAME_POOL_SIZE: int = 10
+    GAME_POOL_LOW_WATER: int = 3
+    GAME_POOL_REFILL_CONCURRENCY: int = 2
+    GAME_POOL_REFILL_INTERVAL_SECONDS: float = 60
+
 # avoid reloading settings
 @lru_cache()
 def get_settings():
-    return Settings()
\ No newline at end of file
+    return Settings()
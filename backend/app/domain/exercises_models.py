@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from enum import Enum
-from typing import List
+from typing import Dict, List, Optional
 
 from app.integrations.exercises.structures import MultipleChoiceExercise
 
@@ -16,6 +16,8 @@ class ExercisesByTopicRequest(BaseModel):
     exercises_count: int = 5
     exercises_difficulty: str = "medium"
     exercises_types: ExerciseType = ExerciseType.multiple_choice
+    # Mix several types, e.g. {"multiple_choice": 5, "true_false": 3}; overrides exercises_count/exercises_types
+    exercises_distribution: Optional[Dict[ExerciseType, int]] = None
 
 class MultipleChoiceExerciseSet(BaseModel):
     """Un contenedor para una lista de ejercicios de opción múltiple."""
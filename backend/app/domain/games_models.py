@@ -1,7 +1,16 @@
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import List, Literal, Optional
 
 class GameOptions(BaseModel):
     topic: str = "any topic"
     game_type: Literal["word_search", "crossword"] = "word_search"
     language: str = "Spanish"
+    difficulty: Literal["easy", "medium", "hard"] = "medium"
+
+class WordSearchBatchRequest(BaseModel):
+    words: List[str] = Field(min_length=1, max_length=50)
+    count: int = Field(10, ge=1, le=100)
+    difficulty: Literal["easy", "medium", "hard"] = "medium"
+    language: str = "Spanish"
+    size: Optional[int] = Field(None, ge=5, le=50)
+    seed: Optional[int] = None
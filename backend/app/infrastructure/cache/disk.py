@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import Optional
+import os
+import tempfile
+import threading
+import time
+
+
+class DiskStore:
+    """Key/value store backed by one file per key under `directory`.
+
+    Files are sharded by the first two characters of the key (keys are
+    expected to be hex digests). Entries older than `ttl_seconds` are
+    treated as missing, and the oldest files are removed once the store
+    grows beyond `max_bytes`.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # Running size estimate, so the directory is only scanned when it may be over budget
+        self._total_bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            stat = path.stat()
+            if self.ttl_seconds is not None and time.time() - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            data = path.read_bytes()
+            # Touch the file so eviction keeps recently used entries
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += len(data)
+        if self._total_bytes is None or self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def touch(self, key: str) -> bool:
+        """Mark an entry as recently used without reading it; False if it is missing."""
+        try:
+            os.utime(self._path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Remove the least recently used files until the store fits in `max_bytes`."""
+        with self._lock:
+            files = []
+            total = 0
+            for path in self.directory.glob("*/*"):
+                if path.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if self.max_bytes is not None and total > self.max_bytes:
+                files.sort()
+                for _, size, path in files:
+                    path.unlink(missing_ok=True)
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+
+            self._total_bytes = total
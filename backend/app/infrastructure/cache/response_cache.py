@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import Any, Optional
+import hashlib
+import json
+
+from app.core.settings import get_settings
+from app.infrastructure.cache.disk import DiskStore
+from app.infrastructure.cache.lru import LRUCache
+
+
+@lru_cache(maxsize=None)
+def _structure_fingerprint(structure) -> str:
+    """Identify an output structure by name and JSON schema, so schema changes invalidate old entries."""
+    if structure is None:
+        return "text"
+    schema = structure.model_json_schema() if hasattr(structure, "model_json_schema") else {}
+    return f"{structure.__module__}.{structure.__qualname__}:{json.dumps(schema, sort_keys=True)}"
+
+
+class ResponseCache:
+    """Content-addressed cache of model responses.
+
+    Responses are stored as JSON text in an in-memory LRU tier and, when a
+    `DiskStore` is configured, in an on-disk tier that survives restarts.
+    """
+
+    def __init__(self, memory: LRUCache, disk: Optional[DiskStore] = None, enabled: bool = True):
+        self.memory = memory
+        self.disk = disk
+        self.enabled = enabled
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model_name: str, template: Any, structure: Any, payload: dict, variant: str = "") -> str:
+        template_text = getattr(template, "template", None) or repr(template)
+        parts = [
+            model_name,
+            variant,
+            template_text,
+            _structure_fingerprint(structure),
+            json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str),
+        ]
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        if self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                value = data.decode("utf-8")
+                # Promote to the memory tier for the next lookup
+                self.memory.set(key, value)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        if not self.enabled:
+            return
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value.encode("utf-8"))
+
+    def stats(self) -> dict:
+        memory = self.memory.stats()
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": memory["entries"],
+            "bytes": memory["bytes"],
+            "evictions": memory["evictions"],
+        }
+
+
+# shared by every AIClient subclass
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    settings = get_settings()
+    memory = LRUCache(
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+    disk = None
+    if settings.RESPONSE_CACHE_DIR:
+        disk = DiskStore(
+            settings.RESPONSE_CACHE_DIR,
+            max_bytes=settings.RESPONSE_CACHE_DISK_MAX_BYTES,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+    return ResponseCache(memory, disk, enabled=settings.RESPONSE_CACHE_ENABLED)
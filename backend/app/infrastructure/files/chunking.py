@@ -0,0 +1,60 @@
+from typing import Iterable, List
+import math
+import re
+
+# Rough chars-per-token ratio for Latin-script text; good enough for budgeting prompts
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_oversized(paragraph: str, max_chars: int) -> Iterable[str]:
+    """Split a paragraph longer than `max_chars` on lines, then sentences, then hard boundaries."""
+    lines = paragraph.split("\n")
+    if len(lines) > 1:
+        yield from pack(lines, max_chars, "\n")
+        return
+    sentences = _SENTENCE_END.split(paragraph)
+    if len(sentences) > 1:
+        yield from pack(sentences, max_chars, " ")
+        return
+    for start in range(0, len(paragraph), max_chars):
+        yield paragraph[start:start + max_chars]
+
+
+def pack(pieces: Iterable[str], max_chars: int, joiner: str = "\n\n") -> List[str]:
+    """Greedily pack pieces, in order, into chunks of at most `max_chars` characters."""
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+
+    for piece in pieces:
+        if not piece.strip():
+            continue
+        if len(piece) > max_chars:
+            if current:
+                chunks.append(joiner.join(current))
+                current, size = [], 0
+            chunks.extend(_split_oversized(piece, max_chars))
+            continue
+
+        added = len(piece) + (len(joiner) if current else 0)
+        if current and size + added > max_chars:
+            chunks.append(joiner.join(current))
+            current, size = [], 0
+            added = len(piece)
+        current.append(piece)
+        size += added
+
+    if current:
+        chunks.append(joiner.join(current))
+    return chunks
+
+
+def split_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """Split text into chunks of roughly `max_tokens` tokens, keeping paragraphs whole when possible."""
+    return pack(text.split("\n\n"), max(1, max_tokens) * CHARS_PER_TOKEN)
@@ -0,0 +1,83 @@
+from functools import lru_cache
+from typing import List, Optional
+import hashlib
+import json
+import re
+
+from app.core.settings import get_settings
+from app.infrastructure.cache.disk import DiskStore
+from app.infrastructure.cache.lru import LRUCache
+from app.infrastructure.files.file_manager import join_pages
+
+_DOCUMENT_ID = re.compile(r"[0-9a-f]{64}")
+
+
+class DocumentStore:
+    """Normalized documents stored under a content-hash document_id.
+
+    Documents are kept as JSON files ({"filenames", "files"}) in a
+    `DiskStore`, which removes the least recently used ones once the store
+    grows beyond its byte budget. The joined content of recently used
+    documents is also kept in an in-memory LRU tier; the disk is the source
+    of truth, so memory hits still mark the file as used and documents
+    evicted from disk are dropped from memory too.
+    """
+
+    def __init__(self, memory: LRUCache, disk: DiskStore):
+        self.memory = memory
+        self.disk = disk
+
+    @staticmethod
+    def make_id(files: List[List[str]]) -> str:
+        # Same normalized pages -> same id. PDFs start with a metadata page holding the
+        # file name, so the same PDF uploaded under another name gets another id
+        data = json.dumps(files, ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_valid_id(document_id: str) -> bool:
+        # Ids become file names, so anything but a hex digest is rejected
+        return bool(_DOCUMENT_ID.fullmatch(document_id))
+
+    def put(self, document_id: str, filenames: List[str], files: List[List[str]]) -> None:
+        data = json.dumps({"filenames": filenames, "files": files}, ensure_ascii=False)
+        self.disk.set(document_id, data.encode("utf-8"))
+
+    def load(self, document_id: str) -> Optional[dict]:
+        """The stored document ({"filenames", "files"}), or None if it is unknown or was evicted"""
+        if not self.is_valid_id(document_id):
+            return None
+        data = self.disk.get(document_id)
+        return json.loads(data) if data is not None else None
+
+    def get(self, document_id: str) -> Optional[str]:
+        """The joined content of a stored document, or None if it is unknown or was evicted"""
+        content = self.memory.get(document_id)
+        if content is not None:
+            # Keep documents in active use from being evicted from disk
+            if self.disk.touch(document_id):
+                return content
+            self.memory.delete(document_id)
+            return None
+
+        document = self.load(document_id)
+        if document is None:
+            return None
+        content = join_pages(document["files"])
+        self.memory.set(document_id, content)
+        return content
+
+    def stats(self) -> dict:
+        return self.memory.stats()
+
+
+@lru_cache()
+def get_document_store() -> DocumentStore:
+    settings = get_settings()
+    memory = LRUCache(
+        max_entries=settings.DOCUMENT_STORE_MEMORY_MAX_ENTRIES,
+        max_bytes=settings.DOCUMENT_STORE_MEMORY_MAX_BYTES,
+        sizeof=lambda content: len(content.encode("utf-8")),
+    )
+    disk = DiskStore(settings.DOCUMENT_STORE_DIR, max_bytes=settings.DOCUMENT_STORE_MAX_BYTES)
+    return DocumentStore(memory, disk)
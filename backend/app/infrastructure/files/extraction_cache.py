@@ -0,0 +1,83 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import json
+
+from app.core.settings import get_settings
+from app.infrastructure.cache.disk import DiskStore
+from app.infrastructure.cache.lru import LRUCache
+
+
+def _entry_size(entry: Tuple[str, List[str]]) -> int:
+    filename, pages = entry
+    return len(filename.encode("utf-8")) + sum(len(page.encode("utf-8")) for page in pages)
+
+
+class ExtractionCache:
+    """Cache of extracted pages keyed by the SHA-256 of the uploaded file bytes.
+
+    The memory tier is an LRU bounded by bytes; a `DiskStore` can be added
+    to keep extractions across restarts.
+    """
+
+    def __init__(self, memory: LRUCache, disk: Optional[DiskStore] = None, enabled: bool = True):
+        self.memory = memory
+        self.disk = disk
+        self.enabled = enabled
+
+    @staticmethod
+    def make_key(digest: str, filename: str) -> str:
+        # The extension picks the extractor, so it is part of the key
+        extension = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
+        return f"{digest}.{extension}"
+
+    def get(self, digest: str, filename: str) -> Optional[List[str]]:
+        if not self.enabled:
+            return None
+
+        key = self.make_key(digest, filename)
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                stored = json.loads(data)
+                entry = (stored["filename"], stored["pages"])
+                self.memory.set(key, entry)
+        if entry is None:
+            return None
+
+        cached_filename, pages = entry
+        pages = list(pages)
+        # PDF metadata starts with the original filename; show the one uploaded now
+        if pages and cached_filename != filename:
+            pages[0] = pages[0].replace(f"Filename: {cached_filename}", f"Filename: {filename}", 1)
+        return pages
+
+    def set(self, digest: str, filename: str, pages: List[str]) -> None:
+        if not self.enabled:
+            return
+        # Extraction errors are returned as message pages; retry those next time
+        if any(page.startswith("Error processing") for page in pages):
+            return
+
+        key = self.make_key(digest, filename)
+        self.memory.set(key, (filename, list(pages)))
+        if self.disk is not None:
+            data = json.dumps({"filename": filename, "pages": pages}, ensure_ascii=False)
+            self.disk.set(key, data.encode("utf-8"))
+
+    def stats(self) -> dict:
+        return {"enabled": self.enabled, **self.memory.stats()}
+
+
+@lru_cache()
+def get_extraction_cache() -> ExtractionCache:
+    settings = get_settings()
+    memory = LRUCache(
+        max_entries=settings.EXTRACTION_CACHE_MAX_ENTRIES,
+        max_bytes=settings.EXTRACTION_CACHE_MAX_BYTES,
+        sizeof=_entry_size,
+    )
+    disk = None
+    if settings.EXTRACTION_CACHE_DIR:
+        disk = DiskStore(settings.EXTRACTION_CACHE_DIR, max_bytes=settings.EXTRACTION_CACHE_DISK_MAX_BYTES)
+    return ExtractionCache(memory, disk, enabled=settings.EXTRACTION_CACHE_ENABLED)
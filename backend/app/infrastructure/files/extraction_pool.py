@@ -0,0 +1,92 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Callable, Optional
+import asyncio
+import multiprocessing
+import os
+
+import anyio
+
+from app.core.settings import get_settings
+
+
+class ExtractionPool:
+    """Bounded process pool for CPU-bound document parsing.
+
+    pdfplumber is pure Python, so running it on threads serialises on the
+    GIL. Jobs run in worker processes instead, with two limits:
+
+    - a global slot count equal to the number of workers, so queued jobs
+      wait in the event loop (FIFO) rather than inside the executor, and
+    - a per-request limit (see `request_limiter`), so one large upload
+      cannot take every slot while other requests wait.
+
+    With `max_workers=0` jobs fall back to anyio's thread pool.
+    """
+
+    def __init__(self, max_workers: int, per_request_limit: int):
+        self.max_workers = max_workers
+        self.per_request_limit = max(1, per_request_limit)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn avoids forking a process that already runs an event loop and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # Semaphores are bound to the loop that first uses them (serverless runtimes may create a new one)
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(max(1, self.max_workers))
+            self._loop = loop
+        return self._slots
+
+    def request_limiter(self) -> asyncio.Semaphore:
+        """Semaphore bounding how many jobs a single request may run at once."""
+        return asyncio.Semaphore(self.per_request_limit)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.max_workers <= 0:
+            return await anyio.to_thread.run_sync(fn, *args)
+
+        async with self._get_slots():
+            loop = asyncio.get_running_loop()
+            # A worker dying (e.g. killed for memory) breaks the pool for every job on it,
+            # so the job is retried once on a fresh pool before giving up
+            for attempt in range(2):
+                executor = self._get_executor()
+                try:
+                    return await loop.run_in_executor(executor, fn, *args)
+                except BrokenProcessPool:
+                    self._discard(executor)
+                    if attempt:
+                        raise
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        # Jobs that failed with the same broken pool must not shut down the fresh one
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+@lru_cache()
+def get_extraction_pool() -> ExtractionPool:
+    settings = get_settings()
+    workers = settings.EXTRACTION_WORKERS
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
+    per_request = settings.EXTRACTION_MAX_JOBS_PER_REQUEST or max(1, workers // 2)
+    return ExtractionPool(workers, per_request)
@@ -1,54 +1,212 @@
-from typing import List
+from typing import List, Optional, Tuple, Union
+import asyncio
 import io
-import anyio
+import logging
+import math
 
-import pdfplumber
-import docx 
+from app.core.settings import get_settings
+from app.infrastructure.files.extraction_cache import get_extraction_cache
+from app.infrastructure.files.extraction_pool import ExtractionPool, get_extraction_pool
+from app.infrastructure.files.normalizer import normalize_contents
+from app.infrastructure.files.uploads import SUPPORTED_EXTENSIONS, StagedUpload, stage_uploads
+from app.infrastructure.metrics import observe_chars, stage
 
-def extract_pdf_content(file_bytes: bytes, filename: str) -> List[str]:
+logger = logging.getLogger(__name__)
+
+# Extractors take a file path (uploads staged on disk, cheap to send to worker processes) or raw bytes
+Source = Union[str, bytes]
+
+UNSUPPORTED_FILE_TYPE = "Unsupported file type."
+
+def _open_source(source: Source):
+    return io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+def _open_pdf(source: Source):
+    # Parsers are imported where they run (usually the extraction workers), keeping them out of startup
+    import pdfplumber
+
+    return pdfplumber.open(_open_source(source))
+
+def _pdf_metadata_page(pdf, filename: str) -> str:
+    metadata = pdf.metadata or {}
+    meta_text = [f"Filename: {filename}"]
+    for key in ("Title", "Author", "Subject", "Creator", "Producer"):
+        if metadata.get(key):
+            meta_text.append(f"{key}: {metadata[key]}")
+    return "\n".join(meta_text)
+
+def extract_pdf_content(source: Source, filename: str) -> List[str]:
     pages = []
     try:
-        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-            metadata = pdf.metadata or {}
-            meta_text = [f"Filename: {filename}"]
-            for key in ("Title", "Author", "Subject", "Creator", "Producer"):
-                if metadata.get(key):
-                    meta_text.append(f"{key}: {metadata[key]}")
-            pages.append("\n".join(meta_text))
+        with _open_pdf(source) as pdf:
+            pages.append(_pdf_metadata_page(pdf, filename))
 
             for i, page in enumerate(pdf.pages, start=1):
                 page_text = page.extract_text() or ""
                 pages.append(page_text.strip())
+                page.close()
     except Exception as e:
         pages.append(f"Error processing PDF file {filename}: {str(e)}")
     return pages
 
-def extract_docx_content(file_bytes: bytes, filename: str) -> List[str]:
+def inspect_pdf(source: Source, filename: str, parallel_threshold: int) -> Tuple[List[str], int]:
+    """Return (pages, page_count).
+
+    PDFs up to `parallel_threshold` pages are extracted completely in this
+    call; for larger ones only the metadata page is returned so the pages
+    can be split across workers with `extract_pdf_page_range`.
+    """
+    try:
+        with _open_pdf(source) as pdf:
+            page_count = len(pdf.pages)
+            if page_count > parallel_threshold:
+                return [_pdf_metadata_page(pdf, filename)], page_count
+    except Exception as e:
+        return [f"Error processing PDF file {filename}: {str(e)}"], 0
+    return extract_pdf_content(source, filename), page_count
+
+def extract_pdf_page_range(source: Source, filename: str, start: int, stop: int) -> Tuple[List[str], bool]:
+    """Extract pages [start, stop) opening the PDF once.
+
+    Returns (pages, complete); on failure the pages end with an error message page.
+    """
+    pages = []
+    try:
+        with _open_pdf(source) as pdf:
+            for page in pdf.pages[start:stop]:
+                page_text = page.extract_text() or ""
+                pages.append(page_text.strip())
+                # Drop the parsed objects of finished pages to keep worker memory flat
+                page.close()
+    except Exception as e:
+        pages.append(f"Error processing PDF file {filename} (pages {start + 1}-{stop}): {str(e)}")
+        return pages, False
+    return pages, True
+
+def split_page_ranges(page_count: int, max_ranges: int, min_pages_per_range: int) -> List[Tuple[int, int]]:
+    ranges_count = max(1, min(max_ranges, math.ceil(page_count / max(1, min_pages_per_range))))
+    size = math.ceil(page_count / ranges_count)
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+async def extract_pdf_parallel(
+    source: Source,
+    filename: str,
+    pool: ExtractionPool,
+    limiter: Optional[asyncio.Semaphore] = None,
+    parallel_threshold: int = 100,
+    min_pages_per_job: int = 25,
+) -> Tuple[List[str], bool]:
+    """Extract a PDF, splitting large ones into page ranges extracted in parallel workers.
+
+    Each range is one job, so every worker opens the PDF once. The ranges
+    are merged back in page order. Returns (pages, complete): when a range
+    fails, its pages are replaced by an error message page and `complete`
+    is False.
+    """
+    limiter = limiter or pool.request_limiter()
+
+    async def run(fn, *args):
+        async with limiter:
+            return await pool.run(fn, *args)
+
+    pages, page_count = await run(inspect_pdf, source, filename, parallel_threshold)
+    if page_count <= parallel_threshold:
+        return pages, True
+
+    ranges = split_page_ranges(page_count, pool.per_request_limit, min_pages_per_job)
+    chunks = await asyncio.gather(
+        *(run(extract_pdf_page_range, source, filename, start, stop) for start, stop in ranges)
+    )
+    for chunk, _ in chunks:
+        pages.extend(chunk)
+    return pages, all(complete for _, complete in chunks)
+
+def extract_docx_content(source: Source, filename: str) -> List[str]:
     """Extrae el texto de un archivo .docx."""
+    import docx
+
     try:
-        doc_stream = io.BytesIO(file_bytes)
-        document = docx.Document(doc_stream)
+        document = docx.Document(_open_source(source))
         full_text = "\n".join([para.text for para in document.paragraphs])
         return [full_text]
     except Exception as e:
         return [f"Error processing Word file {filename}: {str(e)}"]
 
+def extraction_failed(pages: List[str]) -> bool:
+    """True when a file's pages hold an error or unsupported type message instead of (all of) its text"""
+    return any(page.startswith("Error processing") or page.endswith(UNSUPPORTED_FILE_TYPE) for page in pages)
+
 async def extract_file_contents(files) -> List[List[str]]:
     if not files or len(files) == 0:
         return []
-    content = []
+    # Uploads are copied to temporary files in chunks and extracted by path, never read fully into memory
+    async with stage_uploads(files) as staged:
+        return await extract_staged_contents(staged)
+
+async def extract_staged_contents(staged: List[StagedUpload]) -> List[List[str]]:
+    """Extract uploads already copied to disk (see `stage_uploads` and `keep_uploads`), in upload order."""
+    settings = get_settings()
+    cache = get_extraction_cache()
+    pool = get_extraction_pool()
+    # Bounds this request's share of the pool so other uploads keep getting slots
+    limiter = pool.request_limiter()
+    # Splitting pages only pays off with several worker processes
+    page_parallel = settings.PDF_PARALLEL_ENABLED and pool.per_request_limit > 1
+
+    async def extract(upload) -> List[str]:
+        filename = upload.filename.lower()
+
+        if not filename.endswith(SUPPORTED_EXTENSIONS):
+            return [f"{upload.filename}\n------------\n\n{UNSUPPORTED_FILE_TYPE}"]
+
+        # Same bytes -> same pages, so repeated uploads skip parsing
+        extracted = cache.get(upload.sha256, upload.filename)
+        if extracted is not None:
+            return extracted
+
+        complete = True
+        try:
+            if filename.endswith(".pdf") and page_parallel:
+                extracted, complete = await extract_pdf_parallel(
+                    upload.path,
+                    upload.filename,
+                    pool,
+                    limiter,
+                    parallel_threshold=settings.PDF_PARALLEL_PAGE_THRESHOLD,
+                    min_pages_per_job=settings.PDF_MIN_PAGES_PER_JOB,
+                )
+            else:
+                extractor = extract_pdf_content if filename.endswith(".pdf") else extract_docx_content
+                async with limiter:
+                    extracted = await pool.run(extractor, upload.path, upload.filename)
+        except Exception as e:
+            return [f"Error processing file {upload.filename}: {str(e)}"]
+        # A failed page range would be served to every later upload of the file; retry it next time
+        if complete:
+            cache.set(upload.sha256, upload.filename, extracted)
+        return extracted
 
-    for file in files:
-        file_bytes = await file.read()
-        filename = file.filename.lower()
+    with stage("extraction"):
+        # gather keeps the output in the same order as the uploaded files
+        return list(await asyncio.gather(*(extract(upload) for upload in staged)))
 
-        if filename.endswith(".pdf"):
-            extracted = await anyio.to_thread.run_sync(extract_pdf_content, file_bytes, file.filename)
-        elif filename.endswith(".docx"): 
-            extracted = await anyio.to_thread.run_sync(extract_docx_content, file_bytes, file.filename)
-        else:
-            extracted = [f"{file.filename}\n------------\n\nUnsupported file type."]
+def normalize_file_contents(data: List[List[str]]) -> List[List[str]]:
+    """Normalize extracted pages (boilerplate, hyphenation, whitespace), keeping them per file and page."""
+    with stage("normalization"):
+        normalized = normalize_contents(data)
+    if normalized.original_chars:
+        logger.info(
+            "Normalized file contents: %d -> %d chars (%d saved)",
+            normalized.original_chars, normalized.normalized_chars, normalized.chars_saved,
+        )
+    return normalized.files
 
-        content.append(extracted)
+def join_pages(files: List[List[str]]) -> str:
+    """Join normalized pages into prompt content."""
+    content = "\n\n".join("\n\n".join(page for page in file_content if page) for file_content in files)
+    observe_chars("extracted", content)
+    return content
 
-    return content
\ No newline at end of file
+def join_file_contents(data: List[List[str]]) -> str:
+    """Normalize extracted pages and join them into prompt content."""
+    return join_pages(normalize_file_contents(data))
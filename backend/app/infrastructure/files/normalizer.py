@@ -0,0 +1,98 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import List
+import re
+
+# Lines at the top/bottom of a page that are candidates for running headers and footers
+EDGE_LINES = 3
+# A line is boilerplate when it appears on at least this share of a file's pages
+REPEAT_RATIO = 0.5
+MIN_PAGES_FOR_REPEATS = 3
+# Running headers and footers are short; longer lines are always kept
+MAX_BOILERPLATE_CHARS = 100
+
+# Page references inside a running header/footer line ("Course notes - Page 3 of 10")
+_PAGE_REFERENCE = re.compile(
+    r"(?:(?:page|p[aá]g(?:ina)?|p\.)\s*\d+(?:\s*(?:of|de|/)\s*\d+)?|\b\d+\s*(?:of|de|/)\s*\d+\b)",
+    re.IGNORECASE,
+)
+_PAGE_NUMBER = re.compile(
+    r"^\s*(?:[-–—]\s*)?(?:(?:page|p[aá]g(?:ina)?|p\.)\s*)?\d+(?:\s*(?:of|de|/)\s*\d+)?(?:\s*[-–—])?\s*$",
+    re.IGNORECASE,
+)
+_HYPHENATED_BREAK = re.compile(r"(?<=[^\W\d_])-\n(?=[a-zà-ÿ])")
+_SPACES = re.compile(r"[ \t\f\v ]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+@dataclass
+class NormalizedContent:
+    files: List[List[str]]
+    original_chars: int
+    normalized_chars: int
+
+    @property
+    def chars_saved(self) -> int:
+        return self.original_chars - self.normalized_chars
+
+
+def _line_key(line: str) -> str:
+    # "Notes - Page 3 of 10" and "Notes - Page 4 of 10" are the same running footer, but other
+    # numbers are content: "Exercise 1" and "Exercise 2" are different headings
+    return _PAGE_REFERENCE.sub("#", " ".join(line.split()))
+
+
+def _edge_indexes(lines: List[str]) -> List[int]:
+    non_empty = [i for i, line in enumerate(lines) if line.strip()]
+    # Short pages (slides) get a narrower window so body lines are not mistaken for headers
+    width = max(1, min(EDGE_LINES, len(non_empty) // 4))
+    edges = set(non_empty[:width] + non_empty[-width:])
+    return sorted(i for i in edges if len(lines[i]) <= MAX_BOILERPLATE_CHARS)
+
+
+def remove_repeated_lines(pages: List[str]) -> List[str]:
+    """Drop running headers/footers: edge lines repeated across many pages, and page numbers.
+
+    Single-page input (DOCX, one-page PDFs) has no running headers, and a bare
+    number at its edges is content (e.g. a numbered list), so it is left as is.
+    """
+    if len(pages) < 2:
+        return list(pages)
+    split_pages = [page.split("\n") for page in pages]
+
+    repeated = set()
+    if len(pages) >= MIN_PAGES_FOR_REPEATS:
+        counts = Counter()
+        for lines in split_pages:
+            counts.update({_line_key(lines[i]) for i in _edge_indexes(lines)})
+        min_count = max(2, int(len(pages) * REPEAT_RATIO))
+        repeated = {key for key, count in counts.items() if count >= min_count}
+
+    cleaned = []
+    for lines in split_pages:
+        drop = {
+            i for i in _edge_indexes(lines)
+            if _PAGE_NUMBER.match(lines[i]) or _line_key(lines[i]) in repeated
+        }
+        cleaned.append("\n".join(line for i, line in enumerate(lines) if i not in drop))
+    return cleaned
+
+
+def normalize_text(text: str) -> str:
+    """Join words hyphenated across line breaks and compact whitespace."""
+    text = _HYPHENATED_BREAK.sub("", text)
+    text = _SPACES.sub(" ", text)
+    text = "\n".join(line.strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def normalize_pages(pages: List[str]) -> List[str]:
+    return [normalize_text(page) for page in remove_repeated_lines(pages)]
+
+
+def normalize_contents(data: List[List[str]]) -> NormalizedContent:
+    """Normalize the pages of every extracted file (as returned by extract_file_contents)."""
+    original = sum(len(page) for pages in data for page in pages)
+    files = [normalize_pages(pages) for pages in data]
+    normalized = sum(len(page) for pages in files for page in pages)
+    return NormalizedContent(files=files, original_chars=original, normalized_chars=normalized)
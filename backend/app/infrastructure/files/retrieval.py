@@ -0,0 +1,113 @@
+"""BM25 retrieval over document content, to keep only the relevant parts in prompts.
+
+Content is split into chunks of about RETRIEVAL_CHUNK_TOKENS tokens (paragraphs
+kept whole when possible) and indexed with Okapi BM25. `focus_content()`
+narrows content above RETRIEVAL_CONTENT_BUDGET_TOKENS to the chunks that best
+match a query (a flashcard focus area, an exercise topic, a learning path
+session), in document order, within the budget. Smaller content, or a query
+that matches nothing, is returned unchanged.
+"""
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, Tuple
+import asyncio
+import heapq
+import logging
+import math
+import re
+
+from app.core.settings import get_settings
+from app.infrastructure.files.chunking import estimate_tokens, split_into_chunks
+from app.infrastructure.metrics import stage
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+# Very common English and Spanish words; they match every chunk and only add noise
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was were will with
+al como con de del el en es la las lo los para por que se su sus un una y
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(text.casefold()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 over a list of chunks, with an inverted index so a query only visits matching chunks"""
+
+    def __init__(self, chunks: List[str], k1: float = 1.5, b: float = 0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+        for index, chunk in enumerate(chunks):
+            counts = Counter(tokenize(chunk))
+            self._lengths.append(sum(counts.values()))
+            for term, frequency in counts.items():
+                self._postings[term].append((index, frequency))
+        self._average_length = (sum(self._lengths) / len(chunks) if chunks else 0) or 1
+
+    def idf(self, term: str) -> float:
+        matching = len(self._postings.get(term, ()))
+        return math.log(1 + (len(self.chunks) - matching + 0.5) / (matching + 0.5))
+
+    def scores(self, query: str) -> List[float]:
+        scores = [0.0] * len(self.chunks)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for index, frequency in postings:
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[index] / self._average_length)
+                scores[index] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+        return scores
+
+    def top(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """The `k` best matching chunks as (chunk index, score), best first; chunks scoring 0 are left out"""
+        scored = ((score, index) for index, score in enumerate(self.scores(query)) if score > 0)
+        return [(index, score) for score, index in heapq.nlargest(k, scored)]
+
+
+@lru_cache(maxsize=4)
+def build_index(content: str, chunk_tokens: int) -> BM25Index:
+    # Cached: learning path sessions query the same document once each
+    return BM25Index(split_into_chunks(content, chunk_tokens))
+
+
+def select_relevant(content: str, query: str, budget_tokens: int, chunk_tokens: int) -> str:
+    """The chunks of `content` most relevant to `query` that fit in `budget_tokens`, in document order"""
+    if estimate_tokens(content) <= budget_tokens:
+        return content
+    index = build_index(content, chunk_tokens)
+    ranked = index.top(query, len(index.chunks))
+    if not ranked:
+        return content
+
+    selected = []
+    used = 0
+    for chunk_index, _ in ranked:
+        cost = estimate_tokens(index.chunks[chunk_index])
+        # A large chunk that does not fit may leave room for smaller, lower ranked ones
+        if used + cost <= budget_tokens:
+            selected.append(chunk_index)
+            used += cost
+    return "\n\n".join(index.chunks[chunk_index] for chunk_index in sorted(selected))
+
+
+async def focus_content(content: str, query: str) -> str:
+    """`content` narrowed to what is relevant to `query` when it exceeds the retrieval budget"""
+    settings = get_settings()
+    budget = settings.RETRIEVAL_CONTENT_BUDGET_TOKENS
+    if not settings.RETRIEVAL_ENABLED or not query.strip() or estimate_tokens(content) <= budget:
+        return content
+
+    with stage("retrieval"):
+        # Indexing a large document takes tens of milliseconds; keep it off the event loop
+        focused = await asyncio.to_thread(select_relevant, content, query, budget, settings.RETRIEVAL_CHUNK_TOKENS)
+    logger.info("Retrieval for %r: %d -> %d tokens", query[:80], estimate_tokens(content), estimate_tokens(focused))
+    return focused
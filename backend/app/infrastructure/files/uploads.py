@@ -0,0 +1,173 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Tuple
+import hashlib
+import os
+import tempfile
+import threading
+
+import anyio
+from fastapi import HTTPException
+
+from app.core.settings import get_settings
+from app.infrastructure.metrics import UPLOAD_BYTES, current_endpoint
+
+CHUNK_SIZE = 1024 * 1024
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+
+@dataclass
+class StagedUpload:
+    """An uploaded file copied to a temporary path, ready to be handed to the extractors."""
+    filename: str
+    path: Optional[str]  # None for unsupported file types, which are not staged
+    size: int = 0
+    sha256: str = ""
+
+
+class UploadBudget:
+    """Limits on upload bytes: per request (413) and held by all requests at once (503).
+
+    Starlette has already received (and spooled) the whole request body when
+    an endpoint runs, so these limits protect the temporary-file copies and
+    extraction, not receiving the request. Bytes stay reserved from copying
+    until the request's extraction finishes.
+    """
+
+    def __init__(self, max_request_bytes: int, max_inflight_bytes: int):
+        self.max_request_bytes = max_request_bytes
+        self.max_inflight_bytes = max_inflight_bytes
+        self.inflight_bytes = 0
+        self._lock = threading.Lock()
+
+    def too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"Upload too large: limit is {self.max_request_bytes} bytes per request",
+        )
+
+    def reserve(self, nbytes: int) -> None:
+        with self._lock:
+            if self.inflight_bytes + nbytes > self.max_inflight_bytes:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Server is busy processing other uploads, try again shortly",
+                    headers={"Retry-After": "5"},
+                )
+            self.inflight_bytes += nbytes
+
+    def release(self, nbytes: int) -> None:
+        with self._lock:
+            self.inflight_bytes = max(0, self.inflight_bytes - nbytes)
+
+
+@lru_cache()
+def get_upload_budget() -> UploadBudget:
+    settings = get_settings()
+    return UploadBudget(settings.MAX_UPLOAD_BYTES_PER_REQUEST, settings.MAX_INFLIGHT_UPLOAD_BYTES)
+
+
+def _copy_to_temp(source, suffix: str, directory: Optional[str], max_bytes: int, budget: UploadBudget) -> Tuple[str, int, str]:
+    """Stream `source` into a temporary file in fixed-size chunks, hashing it on the way."""
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as target:
+            source.seek(0)
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise budget.too_large()
+                digest.update(chunk)
+                target.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path, size, digest.hexdigest()
+
+
+@asynccontextmanager
+async def _copy_uploads(files, directory: Optional[str]) -> AsyncIterator[List[StagedUpload]]:
+    """Copy uploads into `directory` in chunks, holding their bytes in the upload budget until the context exits.
+
+    The copies are removed if copying fails; otherwise the caller removes them.
+    """
+    budget = get_upload_budget()
+    copied: List[StagedUpload] = []
+    reserved = 0
+
+    try:
+        try:
+            # Fail fast on the sizes the multipart parser already knows
+            declared = sum(getattr(file, "size", None) or 0 for file in files)
+            if declared > budget.max_request_bytes:
+                raise budget.too_large()
+            budget.reserve(declared)
+            reserved = declared
+
+            remaining = budget.max_request_bytes
+            for file in files:
+                name = file.filename or ""
+                if not name.lower().endswith(SUPPORTED_EXTENSIONS):
+                    copied.append(StagedUpload(filename=name, path=None))
+                    continue
+
+                suffix = os.path.splitext(name)[1].lower()
+                path, size, digest = await anyio.to_thread.run_sync(
+                    _copy_to_temp, file.file, suffix, directory, remaining, budget
+                )
+                copied.append(StagedUpload(filename=name, path=path, size=size, sha256=digest))
+                UPLOAD_BYTES.observe(size, endpoint=current_endpoint())
+                remaining -= size
+
+                # The size was unknown or understated: reserve the difference now
+                extra = size - (getattr(file, "size", None) or 0)
+                if extra > 0:
+                    budget.reserve(extra)
+                    reserved += extra
+        except BaseException:
+            remove_uploads(copied)
+            raise
+
+        yield copied
+    finally:
+        budget.release(reserved)
+
+
+async def keep_uploads(files, directory: str) -> List[StagedUpload]:
+    """Copy uploads to files under `directory` that outlive the request (e.g. for a background job).
+
+    The upload limits apply while copying; the caller removes the files with `remove_uploads`.
+    """
+    os.makedirs(directory, exist_ok=True)
+    async with _copy_uploads(files, directory) as kept:
+        return kept
+
+
+def remove_uploads(uploads: List[StagedUpload]) -> None:
+    for upload in uploads:
+        if upload.path:
+            try:
+                os.unlink(upload.path)
+            except FileNotFoundError:
+                pass
+
+
+@asynccontextmanager
+async def stage_uploads(files) -> AsyncIterator[List[StagedUpload]]:
+    """Copy uploads to temporary files in chunks, for the extractors to read by path.
+
+    The temporary files are removed and the reserved bytes released when the
+    context exits.
+    """
+    async with _copy_uploads(files, get_settings().UPLOAD_TMP_DIR) as staged:
+        try:
+            yield staged
+        finally:
+            remove_uploads(staged)
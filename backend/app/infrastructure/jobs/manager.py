@@ -0,0 +1,125 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+from app.infrastructure.jobs.store import JobStore
+
+logger = logging.getLogger(__name__)
+
+
+class JobProgress:
+    """Handed to job handlers to report progress and partial output.
+
+    Writes run on a thread, off the event loop. Partial output can be large
+    and is re-serialized whole on every write, so it is saved at most every
+    `partial_interval` seconds; the result replaces it when the job ends.
+    """
+
+    def __init__(self, store: JobStore, job_id: str, partial_interval: float = 1.0):
+        self.store = store
+        self.job_id = job_id
+        self.partial_interval = partial_interval
+        self._partial_saved_at = float("-inf")
+
+    async def update(self, progress: Optional[dict] = None, partial: Any = None) -> None:
+        now = time.monotonic()
+        if partial is not None:
+            if now - self._partial_saved_at < self.partial_interval:
+                partial = None
+            else:
+                self._partial_saved_at = now
+        await asyncio.to_thread(self.store.update_progress, self.job_id, progress, partial)
+
+
+JobHandler = Callable[[dict, JobProgress], Awaitable[Any]]
+
+
+class JobManager:
+    """Runs jobs in the background on a bounded number of asyncio workers.
+
+    Jobs are persisted in a `JobStore` before they are queued, so jobs that
+    were queued or running when the process stopped are queued again on
+    `start()`. Finished jobs are deleted once they expire.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        handlers: Dict[str, JobHandler],
+        max_workers: int = 2,
+        cleanup_interval: float = 300,
+        partial_interval: float = 1.0,
+    ):
+        self.store = store
+        self.handlers = handlers
+        self.max_workers = max(1, max_workers)
+        self.cleanup_interval = cleanup_interval
+        self.partial_interval = partial_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        for job_id in self.store.unfinished():
+            self._queue.put_nowait(job_id)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.max_workers)]
+        self._tasks.append(asyncio.create_task(self._cleanup()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, kind: str, params: dict) -> str:
+        if kind not in self.handlers:
+            raise ValueError(f"Unsupported job kind: {kind}")
+        if self._queue is None:
+            raise RuntimeError("Job manager is not running")
+        job_id = self.store.create(kind, params)
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        job = await asyncio.to_thread(self.store.get, job_id)
+        if job is None:
+            return
+
+        await asyncio.to_thread(self.store.mark_running, job_id)
+        progress = JobProgress(self.store, job_id, self.partial_interval)
+        try:
+            result = await self.handlers[job["kind"]](job["params"], progress)
+        except asyncio.CancelledError:
+            # Shutting down: the job stays "running" and is queued again on the next start
+            raise
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job_id, job["kind"])
+            await asyncio.to_thread(self.store.fail, job_id, str(e))
+        else:
+            await asyncio.to_thread(self.store.complete, job_id, result)
+
+    async def _cleanup(self) -> None:
+        while True:
+            try:
+                deleted = await asyncio.to_thread(self.store.delete_expired)
+                if deleted:
+                    logger.info("Deleted %d expired jobs", deleted)
+            except Exception:
+                logger.exception("Job cleanup failed")
+            await asyncio.sleep(self.cleanup_interval)
@@ -0,0 +1,154 @@
+from typing import Any, List, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    progress TEXT,
+    partial TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_expires_at ON jobs (expires_at);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+"""
+
+
+def _dumps(value: Any) -> Optional[str]:
+    return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _loads(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
+
+
+class JobStore:
+    """SQLite persistence for jobs, so state and results survive restarts.
+
+    Each job keeps its parameters (to run it again after a restart), its
+    progress and partial output, and its result or error. Jobs expire
+    `ttl_seconds` after they were last updated.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def _execute(self, sql: str, args: tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._db.execute(sql, args)
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        now = time.time()
+        fields.update(updated_at=now, expires_at=now + self.ttl_seconds)
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self._execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def create(self, kind: str, params: dict) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._execute(
+            "INSERT INTO jobs (id, kind, status, params, created_at, updated_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, kind, QUEUED, _dumps(params), now, now, now + self.ttl_seconds),
+        )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[dict]:
+        row = self._execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "params": _loads(row["params"]),
+            "progress": _loads(row["progress"]),
+            "partial": _loads(row["partial"]),
+            "result": _loads(row["result"]),
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "expires_at": row["expires_at"],
+        }
+
+    def get_status(self, job_id: str) -> Optional[dict]:
+        """The job without its parameters, partial output and result, which can be large (for status polls)."""
+        row = self._execute(
+            "SELECT id, kind, status, progress, error, created_at, updated_at, expires_at FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {**dict(row), "progress": _loads(row["progress"])}
+
+    def get_partial(self, job_id: str) -> Optional[dict]:
+        """Status, progress and partial output; the result once the job succeeded."""
+        row = self._execute(
+            "SELECT id, status, progress, CASE WHEN status = ? THEN result ELSE partial END AS partial FROM jobs WHERE id = ?",
+            (SUCCEEDED, job_id),
+        ).fetchone()
+        if row is None:
+            return None
+        return {**dict(row), "progress": _loads(row["progress"]), "partial": _loads(row["partial"])}
+
+    def mark_running(self, job_id: str) -> None:
+        self._update(job_id, status=RUNNING)
+
+    def update_progress(self, job_id: str, progress: Optional[dict] = None, partial: Any = None) -> None:
+        fields = {}
+        if progress is not None:
+            fields["progress"] = _dumps(progress)
+        if partial is not None:
+            fields["partial"] = _dumps(partial)
+        if fields:
+            self._update(job_id, **fields)
+
+    def complete(self, job_id: str, result: Any) -> None:
+        self._update(job_id, status=SUCCEEDED, result=_dumps(result), partial=None)
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._update(job_id, status=FAILED, error=error)
+
+    def unfinished(self) -> List[str]:
+        """IDs of jobs that were queued or running, oldest first."""
+        rows = self._execute(
+            "SELECT id FROM jobs WHERE status IN (?, ?) ORDER BY created_at", (QUEUED, RUNNING)
+        ).fetchall()
+        return [row["id"] for row in rows]
+
+    def delete_expired(self) -> int:
+        cursor = self._execute(
+            "DELETE FROM jobs WHERE expires_at < ? AND status IN (?, ?)", (time.time(), SUCCEEDED, FAILED)
+        )
+        return cursor.rowcount
+
+    def count_by_status(self) -> dict:
+        rows = self._execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,266 @@
+"""In-process metrics in the Prometheus text format.
+
+Counters, gauges and histograms with labels, kept in a process-wide
+registry and rendered by `registry.render()` (served at /metrics).
+Collectors registered with `registry.register_collector()` add samples
+computed at scrape time (cache, rate limiter and pool statistics).
+
+`MetricsMiddleware` times every HTTP request. `stage()` times a step of
+the request (extraction, prompt rendering, the Gemini call, ...) and
+labels it with the endpoint being served, or "background" outside a
+request (jobs, pool refills).
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import bisect
+import math
+import threading
+import time
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+SIZE_BUCKETS = (1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+
+LabelValues = Tuple[str, ...]
+# (name, type, help, [(labels, value)]) as produced by collectors
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _labels(self, key: LabelValues, **extra: str) -> Dict[str, str]:
+        return {**dict(zip(self.label_names, key)), **extra}
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self._lock:
+            lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}" for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = "+Inf" if math.isinf(bound) else _format_value(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(self._labels(key, le=le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self._labels(key))} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self._labels(key))} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labels, buckets))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, type_, help, samples in collector():
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {type_}")
+                lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_DURATION = registry.histogram(
+    "learngo_request_duration_seconds", "HTTP request latency, including streamed bodies.", ["endpoint", "method", "status"]
+)
+REQUESTS_IN_FLIGHT = registry.gauge("learngo_requests_in_flight", "HTTP requests being served.")
+REQUEST_ERRORS = registry.counter("learngo_request_errors_total", "HTTP requests answered with a 5xx status.", ["endpoint", "status"])
+
+STAGE_DURATION = registry.histogram(
+    "learngo_stage_duration_seconds", "Time spent in each stage of a request.", ["endpoint", "stage"]
+)
+STAGES_IN_FLIGHT = registry.gauge("learngo_stages_in_flight", "Stages currently running.", ["stage"])
+STAGE_ERRORS = registry.counter("learngo_stage_errors_total", "Stages that raised an error.", ["endpoint", "stage"])
+
+LLM_RETRIES = registry.counter("learngo_llm_retries_total", "Model calls retried after a throttling error.", ["model"])
+UPLOAD_BYTES = registry.histogram("learngo_upload_bytes", "Size of each uploaded file.", ["endpoint"], SIZE_BUCKETS)
+TEXT_CHARS = registry.histogram(
+    "learngo_text_chars", "Text sizes: extracted content, rendered prompts and model outputs.", ["endpoint", "kind"], SIZE_BUCKETS
+)
+
+
+class _RequestContext:
+    def __init__(self, scope: dict):
+        self.scope = scope
+
+    @property
+    def endpoint(self) -> str:
+        # The router stores the matched route in the scope; its path template keeps the label set small
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or "unmatched"
+
+
+_request: ContextVar[Optional[_RequestContext]] = ContextVar("metrics_request", default=None)
+
+
+def current_endpoint() -> str:
+    context = _request.get()
+    return context.endpoint if context is not None else "background"
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a stage of the current request (works in sync and async code)"""
+    endpoint = current_endpoint()
+    STAGES_IN_FLIGHT.inc(stage=name)
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.inc(endpoint=endpoint, stage=name)
+        raise
+    finally:
+        STAGES_IN_FLIGHT.dec(stage=name)
+        STAGE_DURATION.observe(time.perf_counter() - start, endpoint=endpoint, stage=name)
+
+
+def observe_chars(kind: str, text: Optional[str]) -> None:
+    if text:
+        TEXT_CHARS.observe(len(text), endpoint=current_endpoint(), kind=kind)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency, in-flight requests and 5xx responses"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context = _RequestContext(scope)
+        token = _request.set(context)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            _request.reset(token)
+            endpoint = context.endpoint
+            REQUEST_DURATION.observe(time.perf_counter() - start, endpoint=endpoint, method=scope["method"], status=str(status))
+            if status >= 500:
+                REQUEST_ERRORS.inc(endpoint=endpoint, status=str(status))
@@ -1,23 +1,107 @@
-from app.core.settings import get_settings 
-from langchain_google_genai import ChatGoogleGenerativeAI
-
-settings = get_settings()
+from app.core.settings import get_settings
+from app.infrastructure.cache.response_cache import ResponseCache, get_response_cache
+from app.infrastructure.metrics import LLM_RETRIES, observe_chars, stage
+from app.integrations.model_pool import ModelPool, get_model_pool
+from app.integrations.rate_limiter import AdaptiveRateLimiter, get_rate_limiter, is_throttling_error, is_transient_error
+import asyncio
 
 class AIClient:
     def __init__(self):
+        settings = get_settings()
         self.model_name = settings.GEMINI_MODEL
         self.api_key = settings.GEMINI_API_KEY
+        # Retries on 429/503 go through the shared rate limiter (with jittered backoff), so
+        # throttling lowers its limits. The Google SDK would retry 429/503 itself while
+        # holding a limiter slot (its attempts include them), so its retries are disabled
+        # (1 attempt) and call_model also retries transient server errors, once.
         self.max_retries = 7
+        self.transient_max_retries = 1
+        self.transport_max_retries = 1
+        self.cache: ResponseCache = get_response_cache()
+        self.pool: ModelPool = get_model_pool()
+
+    def new_model(self, **model_kwargs):
+        # Pooled per event loop (a model shared across loops is what caused the vercel error)
+        # model_kwargs select a model variant, e.g. response_mime_type="application/json"
+        return self.pool.get(self.model_name, self.api_key, self.transport_max_retries, **model_kwargs)
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        return get_rate_limiter(self.model_name)
+
+    async def call_model(self, runnable, prompt):
+        """Invoke `runnable` through the model's rate limiter, retrying throttling and transient errors with backoff"""
+        limiter = self.rate_limiter
+        attempt = 0
+        transient_attempts = 0
+        with stage("llm_call"):
+            while True:
+                try:
+                    async with limiter.slot():
+                        return await runnable.ainvoke(prompt)
+                except Exception as e:
+                    if is_transient_error(e) and transient_attempts < self.transient_max_retries:
+                        transient_attempts += 1
+                    elif not is_throttling_error(e) or attempt >= self.max_retries:
+                        raise
+                LLM_RETRIES.inc(model=self.model_name)
+                await asyncio.sleep(limiter.backoff(attempt))
+                attempt += 1
+
+    @staticmethod
+    def render_prompt(instructions, payload: dict):
+        with stage("prompt_render"):
+            prompt = instructions.invoke(payload)
+        observe_chars("prompt", prompt.to_string())
+        return prompt
+
+    async def invoke_structured(self, instructions, structure, payload: dict, model=None, use_cache: bool = True):
+        """Run `instructions | model.with_structured_output(structure)`, reusing cached responses.
+
+        Returns an instance of `structure`, or None when the model produced nothing.
+        `use_cache=False` always calls the model (e.g. to get several different answers).
+        """
+        key = self.cache.make_key(self.model_name, instructions, structure, payload)
+        cached = self.cache.get(key) if use_cache else None
+        if cached is not None:
+            return structure.model_validate_json(cached)
+
+        model = model or self.new_model()
+        prompt = self.render_prompt(instructions, payload)
+        result = await self.call_model(model.with_structured_output(structure), prompt)
+
+        if result:
+            output = result.model_dump_json()
+            observe_chars("output", output)
+            self.cache.set(key, output)
+        return result
+
+    async def invoke_text(self, instructions, payload: dict, model=None, variant: str = "", parse=None):
+        """Run `instructions | model` and return the raw response text, reusing cached responses.
+
+        `variant` must identify any model setting that changes the output (e.g. the response MIME type).
+        With `parse`, returns the parsed output instead: `parse(text)` returns `(value, complete)`
+        or raises, and only complete output is cached, so a truncated or unparseable response
+        is generated again on the next request instead of being served from the cache.
+        Parsing (and repairing) long responses is CPU-bound, so `parse` runs on a worker thread.
+        """
+        key = self.cache.make_key(self.model_name, instructions, None, payload, variant)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return (await asyncio.to_thread(parse, cached))[0] if parse else cached
+
+        model = model or self.new_model()
+        prompt = self.render_prompt(instructions, payload)
+        response = await self.call_model(model, prompt)
 
-        self.model = ChatGoogleGenerativeAI(
-            model=self.model_name,
-            api_key=self.api_key,
-            max_retries=self.max_retries
-        )
-
-    def new_model(self):
-        return ChatGoogleGenerativeAI(
-            model=self.model_name,
-            api_key=self.api_key,
-            max_retries=self.max_retries
-        )
+        content = response.content
+        if not content:
+            return (await asyncio.to_thread(parse, content))[0] if parse else content
+        observe_chars("output", content)
+        if parse is None:
+            self.cache.set(key, content)
+            return content
+        value, complete = await asyncio.to_thread(parse, content)
+        if complete:
+            self.cache.set(key, content)
+        return value
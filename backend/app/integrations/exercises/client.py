@@ -1,41 +1,49 @@
-from typing import List
+from typing import Dict, List
+import asyncio
 from app.domain.exercises_models import ExerciseType
 import app.integrations.exercises.templates as templates
 import app.integrations.exercises.structures as structures
 
 from app.integrations.ai_client import AIClient
 
+# Prompt template and structured output for each exercise type
+EXERCISE_SETS = {
+    ExerciseType.multiple_choice: (templates.multiple_choice_exercises_template, structures.MultipleChoiceExerciseSet),
+    ExerciseType.fill_in_the_blank: (templates.fill_in_the_blank_exercises_template, structures.FillInTheBlankExerciseSet),
+    ExerciseType.true_false: (templates.true_false_exercises_template, structures.TrueFalseExerciseSet),
+    ExerciseType.short_answer: (templates.short_answer_exercises_template, structures.ShortAnswerExerciseSet),
+    ExerciseType.matching: (templates.matching_exercises_template, structures.MatchingExerciseSet),
+}
+
 class ExercisesAIClient(AIClient):
     async def generate_exercises(self, content: str, exercises_count: int = 5, exercises_difficulty: str = "medium", exercises_types: ExerciseType = ExerciseType.multiple_choice):
-
-        if exercises_types == ExerciseType.multiple_choice:
-            exercises_template = templates.multiple_choice_exercises_template
-            ExerciseSet = structures.MultipleChoiceExerciseSet
-        elif exercises_types == ExerciseType.fill_in_the_blank:
-            exercises_template = templates.fill_in_the_blank_exercises_template
-            ExerciseSet = structures.FillInTheBlankExerciseSet
-
-        elif exercises_types == ExerciseType.true_false:
-            exercises_template = templates.true_false_exercises_template
-            ExerciseSet = structures.TrueFalseExerciseSet
-
-        elif exercises_types == ExerciseType.short_answer:
-            exercises_template = templates.short_answer_exercises_template
-            ExerciseSet = structures.ShortAnswerExerciseSet
-
-        elif exercises_types == ExerciseType.matching:
-            exercises_template = templates.matching_exercises_template
-            ExerciseSet = structures.MatchingExerciseSet
-        else:
-            raise ValueError(f"Unsupported exercise type: {exercises_types}")   
-        
-        #model instance per req
-        model = self.new_model()
+        if exercises_types not in EXERCISE_SETS:
+            raise ValueError(f"Unsupported exercise type: {exercises_types}")
+        exercises_template, ExerciseSet = EXERCISE_SETS[exercises_types]
 
         instructions = exercises_template()
-        structured_llm = model.with_structured_output(ExerciseSet)
-        chain = instructions | structured_llm
-        result = await chain.ainvoke({"content": content, "exercises_count": exercises_count, "exercises_difficulty": exercises_difficulty})
+        result = await self.invoke_structured(instructions, ExerciseSet, {"content": content, "exercises_count": exercises_count, "exercises_difficulty": exercises_difficulty})
         if result:
             return result.model_dump()
         return []
+
+    async def generate_mixed_exercises(self, content: str, exercises_distribution: Dict[ExerciseType, int], exercises_difficulty: str = "medium"):
+        """Generate several exercise types at once, e.g. {multiple_choice: 5, true_false: 3}.
+
+        Each type is a separate structured call; the calls run concurrently and
+        their exercises are merged in the order of the distribution, each one
+        tagged with its `exercise_type`.
+        """
+        distribution = [(ExerciseType(kind), count) for kind, count in exercises_distribution.items() if count > 0]
+        results = await asyncio.gather(*(
+            self.generate_exercises(content, count, exercises_difficulty, kind) for kind, count in distribution
+        ))
+
+        exercises: List[dict] = []
+        for (kind, _), result in zip(distribution, results):
+            for exercise in (result or {}).get("exercises", []):
+                exercises.append({"exercise_type": kind.value, **exercise})
+        return {
+            "exercises": exercises,
+            "distribution": {kind.value: count for kind, count in distribution},
+        }
@@ -1,10 +1,22 @@
+import asyncio
+import copy
 import app.integrations.games.structures as structures
 from app.domain.games_models import GameOptions
 from app.integrations.games.templates import game_template
+from app.integrations.games.crossword_layout import build_crossword
+from app.integrations.games.word_search_generator import WordSearchGenerator
 from app.integrations.ai_client import AIClient
+from app.infrastructure.metrics import stage
 
 class GameAIClient(AIClient):
     async def generate_game(self, options: GameOptions) -> dict:
+        game = await self.generate_game_words(options)
+        if "error" in game:
+            return game
+        return await self.layout_game(game, options)
+
+    async def generate_game_words(self, options: GameOptions, use_cache: bool = True) -> dict:
+        """Title, category and words (with clues for crosswords), without a grid"""
         if options.game_type == "word_search":
             game_structure = structures.WordSearch
         elif options.game_type == "crossword":
@@ -13,10 +25,6 @@ class GameAIClient(AIClient):
             raise ValueError(f"Unsupported game type: {options.game_type}") 
 
         instructions = game_template()
-        model = self.new_model()
-
-        structured_llm = model.with_structured_output(game_structure)
-        chain = instructions | structured_llm
 
         payload = {
             "topic": options.topic,
@@ -24,9 +32,27 @@ class GameAIClient(AIClient):
             "language": options.language,
         }
 
-        result = await chain.ainvoke(payload)
+        result = await self.invoke_structured(instructions, game_structure, payload, use_cache=use_cache)
 
         if not result:
             return {"error": "No game could be generated."}
-        
         return result.model_dump()
+
+    async def layout_game(self, game: dict, options: GameOptions) -> dict:
+        """Return a copy of a generated game with its ready-to-render grid"""
+        with stage("layout"):
+            # Crossword backtracking and grid building take tens of milliseconds; keep them off the event loop
+            return await asyncio.to_thread(self._layout_game, game, options)
+
+    @staticmethod
+    def _layout_game(game: dict, options: GameOptions) -> dict:
+        game = copy.deepcopy(game)
+        if options.game_type == "crossword":
+            # Ready-to-render layout: grid, numbered placements and unplaced word ids
+            for word_id, word in enumerate(game["words"], start=1):
+                word["id"] = word_id
+            game.update(build_crossword(game["words"]))
+        else:
+            # Ready-to-render grid with every word placed
+            game.update(WordSearchGenerator(options.difficulty, options.language).generate(game["words"]).to_dict())
+        return game
@@ -0,0 +1,242 @@
+"""Crossword layout engine: places a word list on a compact, connected grid.
+
+The grid is sparse (a dict of occupied cells) and grows in any direction, so
+no fixed board size has to be guessed up front; the final layout is cropped
+to its bounding box. Every placed letter is indexed by letter, so candidate
+positions for a word come straight from the cells it can cross instead of a
+scan of the whole board.
+
+Words are placed longest first. For each word, the candidate crossings are
+scored (more crossings, smaller and squarer bounding box first) and tried in
+that order with backtracking, within a node budget; a word that does not fit
+is retried once after the others. The best layout seen is
+kept: most words placed, then highest density (letters / bounding box area).
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+ACROSS = "across"
+DOWN = "down"
+_STEP = {ACROSS: (0, 1), DOWN: (1, 0)}
+_BIT = {ACROSS: 1, DOWN: 2}
+
+Cell = Tuple[int, int]
+
+
+@dataclass
+class Placement:
+    index: int
+    word: str
+    row: int
+    col: int
+    direction: str
+
+
+def normalize_word(word: str) -> str:
+    """Uppercase letters only: spaces, hyphens and punctuation are not part of the grid"""
+    return "".join(ch for ch in word.upper() if ch.isalpha())
+
+
+class _Grid:
+    """Mutable board state with undo, shared by the whole search."""
+
+    def __init__(self):
+        self.letters: Dict[Cell, str] = {}
+        # Directions already running through each cell (bit mask of _BIT)
+        self.used: Dict[Cell, int] = {}
+        self.by_letter: Dict[str, Set[Cell]] = {}
+        self.placements: List[Placement] = []
+
+    def bounds(self) -> Tuple[int, int, int, int]:
+        rows = [r for r, _ in self.letters]
+        cols = [c for _, c in self.letters]
+        return min(rows), min(cols), max(rows), max(cols)
+
+    def crossings(self, word: str, row: int, col: int, direction: str) -> int:
+        """Number of existing letters the word would cross, or -1 if it does not fit."""
+        dr, dc = _STEP[direction]
+        letters = self.letters
+        # The cells right before and after the word must stay empty
+        if (row - dr, col - dc) in letters or (row + dr * len(word), col + dc * len(word)) in letters:
+            return -1
+
+        crossed = 0
+        for i, ch in enumerate(word):
+            cell = (row + dr * i, col + dc * i)
+            existing = letters.get(cell)
+            if existing is not None:
+                if existing != ch or self.used[cell] & _BIT[direction]:
+                    return -1
+                crossed += 1
+            # A new letter must not touch letters on its sides (that would form stray words)
+            elif (cell[0] + dc, cell[1] + dr) in letters or (cell[0] - dc, cell[1] - dr) in letters:
+                return -1
+        return crossed if crossed < len(word) else -1
+
+    def place(self, placement: Placement) -> List[Cell]:
+        dr, dc = _STEP[placement.direction]
+        added = []
+        for i, ch in enumerate(placement.word):
+            cell = (placement.row + dr * i, placement.col + dc * i)
+            if cell not in self.letters:
+                self.letters[cell] = ch
+                self.used[cell] = 0
+                self.by_letter.setdefault(ch, set()).add(cell)
+                added.append(cell)
+            self.used[cell] |= _BIT[placement.direction]
+        self.placements.append(placement)
+        return added
+
+    def undo(self, added: List[Cell]) -> None:
+        placement = self.placements.pop()
+        dr, dc = _STEP[placement.direction]
+        for i in range(len(placement.word)):
+            self.used[(placement.row + dr * i, placement.col + dc * i)] &= ~_BIT[placement.direction]
+        for cell in added:
+            self.by_letter[self.letters.pop(cell)].discard(cell)
+            del self.used[cell]
+
+
+class CrosswordLayout:
+    """Backtracking search for a dense crossword layout.
+
+    `max_size` caps the rows and columns of the layout, `beam` is how many of
+    the best-scored positions are tried per word, and `max_nodes` bounds the
+    number of placements explored before the best layout so far is returned.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, beam: int = 3, max_nodes: int = 400):
+        self.max_size = max_size
+        self.beam = beam
+        self.max_nodes = max_nodes
+
+    def layout(self, words: List[str]) -> Tuple[List[Placement], List[int]]:
+        """Return the placements and the indexes of the words that could not be placed."""
+        entries = [(index, normalize_word(word)) for index, word in enumerate(words)]
+        entries = [(index, word) for index, word in entries if len(word) > 1]
+        # Longest first; among equal lengths, words sharing more letters with the rest go first
+        letter_counts: Dict[str, int] = {}
+        for _, word in entries:
+            for ch in set(word):
+                letter_counts[ch] = letter_counts.get(ch, 0) + 1
+        entries.sort(key=lambda entry: (-len(entry[1]), -sum(letter_counts[ch] for ch in set(entry[1]))))
+
+        self._entries = entries
+        self._grid = _Grid()
+        self._nodes = 0
+        self._best: Tuple[Tuple[int, float], List[Placement]] = ((0, 0.0), [])
+
+        if entries:
+            index, word = entries[0]
+            added = self._grid.place(Placement(index, word, 0, 0, ACROSS))
+            self._search([(index, word, False) for index, word in entries[1:]])
+            self._grid.undo(added)
+
+        placements = self._best[1]
+        placed = {placement.index for placement in placements}
+        unplaced = [index for index, word in enumerate(words) if index not in placed]
+        return placements, unplaced
+
+    def _score(self) -> Tuple[int, float]:
+        top, left, bottom, right = self._grid.bounds()
+        area = (bottom - top + 1) * (right - left + 1)
+        return len(self._grid.placements), len(self._grid.letters) / area
+
+    def _candidates(self, word: str) -> List[Tuple[tuple, str, int, int]]:
+        grid = self._grid
+        top, left, bottom, right = grid.bounds()
+        seen = set()
+        candidates = []
+        for i, ch in enumerate(word):
+            for r, c in grid.by_letter.get(ch, ()):
+                for direction in (ACROSS, DOWN):
+                    dr, dc = _STEP[direction]
+                    row, col = r - dr * i, c - dc * i
+                    if (row, col, direction) in seen:
+                        continue
+                    seen.add((row, col, direction))
+                    crossed = grid.crossings(word, row, col, direction)
+                    if crossed < 1:
+                        continue
+
+                    end_row, end_col = row + dr * (len(word) - 1), col + dc * (len(word) - 1)
+                    height = max(bottom, end_row) - min(top, row) + 1
+                    width = max(right, end_col) - min(left, col) + 1
+                    if self.max_size and max(height, width) > self.max_size:
+                        continue
+                    score = (-crossed, height * width, abs(height - width))
+                    candidates.append((score, direction, row, col))
+        candidates.sort()
+        return candidates[:self.beam]
+
+    def _search(self, queue: List[Tuple[int, str, bool]]) -> bool:
+        """Place the (index, word, deferred) entries in `queue`; returns True when the search should stop."""
+        score = self._score()
+        if score > self._best[0]:
+            self._best = (score, list(self._grid.placements))
+        if not queue:
+            # A complete layout; keep looking for a denser one while the budget lasts
+            return self._nodes >= self.max_nodes
+        if self._nodes >= self.max_nodes:
+            return True
+
+        (index, word, deferred), rest = queue[0], queue[1:]
+        for _, direction, row, col in self._candidates(word):
+            self._nodes += 1
+            added = self._grid.place(Placement(index, word, row, col, direction))
+            stop = self._search(rest)
+            self._grid.undo(added)
+            if stop:
+                return True
+
+        # The word does not fit (or blocks later words): retry it once after the others,
+        # when more letters are on the board, then leave it out
+        self._nodes += 1
+        return self._search(rest + [(index, word, True)] if not deferred else rest)
+
+def build_crossword(words: List[dict], max_size: Optional[int] = None) -> dict:
+    """Lay out `words` ({"word", "clue"} dicts) and return a ready-to-render crossword.
+
+    Returns the cropped grid (rows of letters, None for blocked cells), its
+    size, the numbered placements with their clues, and the ids of the words
+    that could not be placed. Word ids are 1-based positions in `words`.
+    """
+    placements, unplaced = CrosswordLayout(max_size=max_size).layout([entry["word"] for entry in words])
+    if not placements:
+        return {"grid": [], "rows": 0, "cols": 0, "placements": [], "unplaced": [index + 1 for index in unplaced]}
+
+    top = min(p.row for p in placements)
+    left = min(p.col for p in placements)
+    bottom = max(p.row + (len(p.word) - 1 if p.direction == DOWN else 0) for p in placements)
+    right = max(p.col + (len(p.word) - 1 if p.direction == ACROSS else 0) for p in placements)
+
+    grid: List[List[Optional[str]]] = [[None] * (right - left + 1) for _ in range(bottom - top + 1)]
+    for p in placements:
+        dr, dc = _STEP[p.direction]
+        for i, ch in enumerate(p.word):
+            grid[p.row - top + dr * i][p.col - left + dc * i] = ch
+
+    # Clue numbers in reading order, shared by an across and a down word starting on the same cell
+    starts = sorted({(p.row - top, p.col - left) for p in placements})
+    numbers = {cell: number for number, cell in enumerate(starts, start=1)}
+
+    rendered = []
+    for p in sorted(placements, key=lambda p: (numbers[(p.row - top, p.col - left)], p.direction)):
+        row, col = p.row - top, p.col - left
+        rendered.append({
+            "id": p.index + 1,
+            "number": numbers[(row, col)],
+            "word": p.word,
+            "clue": words[p.index].get("clue", ""),
+            "row": row,
+            "col": col,
+            "direction": p.direction,
+        })
+
+    return {
+        "grid": grid,
+        "rows": len(grid),
+        "cols": len(grid[0]),
+        "placements": rendered,
+        "unplaced": [index + 1 for index in unplaced],
+    }
@@ -0,0 +1,209 @@
+"""Word-search grid generator backed by NumPy.
+
+The grid is an int32 array of code points (0 = empty). For each word and
+direction, every valid start position is found at once: the word's letters
+are compared against shifted views of the grid, and the per-letter masks
+are ANDed together. One valid position is then picked at random, with a
+preference for positions that reuse letters already on the grid.
+
+A word that fits nowhere makes the grid grow by one row and column (the
+words already placed stay valid), so every word is always placed.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import math
+import unicodedata
+
+import numpy as np
+
+# (row step, col step) per direction
+DIRECTIONS: Dict[str, Tuple[int, int]] = {
+    "right": (0, 1),
+    "down": (1, 0),
+    "down_right": (1, 1),
+    "up_right": (-1, 1),
+    "left": (0, -1),
+    "up": (-1, 0),
+    "up_left": (-1, -1),
+    "down_left": (1, -1),
+}
+
+DIFFICULTY_DIRECTIONS: Dict[str, List[str]] = {
+    "easy": ["right", "down"],
+    "medium": ["right", "down", "down_right", "up_right"],
+    "hard": list(DIRECTIONS),
+}
+
+_LATIN = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Filler alphabets by language (English or native name, lowercase)
+ALPHABETS: Dict[str, str] = {
+    "english": _LATIN,
+    "spanish": _LATIN + "Ñ",
+    "español": _LATIN + "Ñ",
+    "portuguese": _LATIN + "Ç",
+    "português": _LATIN + "Ç",
+    "french": _LATIN,
+    "français": _LATIN,
+    "german": _LATIN + "ÄÖÜ",
+    "deutsch": _LATIN + "ÄÖÜ",
+    "italian": _LATIN,
+    "italiano": _LATIN,
+}
+
+
+def alphabet_for(language: str) -> str:
+    return ALPHABETS.get(language.strip().lower(), _LATIN)
+
+
+def normalize_word(word: str, alphabet: str) -> str:
+    """Uppercase, without spaces or punctuation; accents are dropped unless the letter is in `alphabet`"""
+    letters = []
+    for ch in word.upper():
+        if ch in alphabet:
+            letters.append(ch)
+        elif ch.isalpha():
+            base = unicodedata.normalize("NFD", ch)[0]
+            if base.isalpha():
+                letters.append(base)
+    return "".join(letters)
+
+
+@dataclass
+class WordSearchPuzzle:
+    grid: List[List[str]]
+    placements: List[dict] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return len(self.grid)
+
+    def to_dict(self) -> dict:
+        return {"size": self.size, "grid": self.grid, "placements": self.placements}
+
+
+class WordSearchGenerator:
+    """Builds word-search puzzles for a language and difficulty.
+
+    `difficulty` selects the directions words may run in (easy: right and
+    down; medium: plus forward diagonals; hard: all 8, backwards included).
+    `size` is the starting grid size; by default it is derived from the word
+    lengths, and it grows when needed to place every word.
+    """
+
+    def __init__(self, difficulty: str = "medium", language: str = "English", size: Optional[int] = None):
+        if difficulty not in DIFFICULTY_DIRECTIONS:
+            raise ValueError(f"Unsupported difficulty: {difficulty}")
+        self.directions = DIFFICULTY_DIRECTIONS[difficulty]
+        self.alphabet = alphabet_for(language)
+        self.size = size
+        self._filler = np.array([ord(ch) for ch in self.alphabet], dtype=np.int32)
+
+    def generate(self, words: List[str], seed: Optional[int] = None) -> WordSearchPuzzle:
+        rng = np.random.default_rng(seed)
+        entries = [(word, normalize_word(word, self.alphabet)) for word in words]
+        entries = [(word, letters) for word, letters in entries if letters]
+        # Longest first: they have the fewest valid positions
+        entries.sort(key=lambda entry: -len(entry[1]))
+
+        grid = np.zeros((self._initial_size(entries),) * 2, dtype=np.int32)
+        placements = []
+        for word, letters in entries:
+            codes = np.array([ord(ch) for ch in letters], dtype=np.int32)
+            while True:
+                position = self._pick_position(grid, codes, rng)
+                if position is not None:
+                    break
+                grid = np.pad(grid, ((0, 1), (0, 1)))
+
+            row, col, direction = position
+            dr, dc = DIRECTIONS[direction]
+            rows = row + dr * np.arange(len(codes))
+            cols = col + dc * np.arange(len(codes))
+            grid[rows, cols] = codes
+            placements.append({
+                "word": word,
+                "letters": letters,
+                "direction": direction,
+                "cells": [[int(r), int(c)] for r, c in zip(rows, cols)],
+            })
+
+        empty = grid == 0
+        grid[empty] = rng.choice(self._filler, size=int(empty.sum()))
+        rendered = [[chr(code) for code in row] for row in grid.tolist()]
+        return WordSearchPuzzle(rendered, placements)
+
+    def generate_batch(self, words: List[str], count: int, seed: Optional[int] = None) -> List[WordSearchPuzzle]:
+        """Build `count` distinct puzzles from the same words.
+
+        Each puzzle uses its own seed derived from `seed`; a puzzle whose grid
+        repeats an earlier one is generated again with the next seed.
+        """
+        seeds = np.random.SeedSequence(seed)
+        puzzles: List[WordSearchPuzzle] = []
+        seen = set()
+        attempts = 0
+        while len(puzzles) < count:
+            attempts += 1
+            puzzle = self.generate(words, seed=seeds.spawn(1)[0])
+            fingerprint = hashlib.sha1("".join("".join(row) for row in puzzle.grid).encode("utf-8")).digest()
+            # Tiny grids have few layouts; give up on distinctness rather than loop forever
+            if fingerprint in seen and attempts < count * 10:
+                continue
+            seen.add(fingerprint)
+            puzzles.append(puzzle)
+        return puzzles
+
+    def _initial_size(self, entries: List[Tuple[str, str]]) -> int:
+        if not entries:
+            return self.size or 1
+        longest = max(len(letters) for _, letters in entries)
+        # Room for about twice the letters, so there is space for filler
+        letters = sum(len(letters) for _, letters in entries)
+        return max(self.size or 0, longest, math.ceil(math.sqrt(letters * 2)))
+
+    def _valid_starts(self, grid: np.ndarray, codes: np.ndarray, direction: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Boolean masks over the grid: where the word can start, and how many letters it reuses there"""
+        size = grid.shape[0]
+        length = len(codes)
+        dr, dc = DIRECTIONS[direction]
+        valid = np.zeros(grid.shape, dtype=bool)
+        overlap = np.zeros(grid.shape, dtype=np.int32)
+
+        # Start positions that keep the whole word inside the grid
+        row_lo, row_hi = (length - 1, size) if dr < 0 else (0, size - (length - 1) * dr)
+        col_lo, col_hi = (length - 1, size) if dc < 0 else (0, size - (length - 1) * dc)
+        if row_lo >= row_hi or col_lo >= col_hi:
+            return valid, overlap
+
+        window = np.ones((row_hi - row_lo, col_hi - col_lo), dtype=bool)
+        shared = np.zeros(window.shape, dtype=np.int32)
+        for i, code in enumerate(codes):
+            cells = grid[row_lo + dr * i:row_hi + dr * i, col_lo + dc * i:col_hi + dc * i]
+            same = cells == code
+            window &= same | (cells == 0)
+            shared += same
+        # A word hidden entirely inside another one would not be a separate find
+        window &= shared < length
+
+        valid[row_lo:row_hi, col_lo:col_hi] = window
+        overlap[row_lo:row_hi, col_lo:col_hi] = shared
+        return valid, overlap
+
+    def _pick_position(self, grid: np.ndarray, codes: np.ndarray, rng: np.random.Generator) -> Optional[Tuple[int, int, str]]:
+        candidates = []
+        for direction in self.directions:
+            valid, overlap = self._valid_starts(grid, codes, direction)
+            rows, cols = np.nonzero(valid)
+            if len(rows):
+                candidates.append((direction, rows, cols, overlap[rows, cols]))
+        if not candidates:
+            return None
+
+        # Choose a direction first, so directions with many positions do not dominate
+        direction, rows, cols, shared = candidates[rng.integers(len(candidates))]
+        # Positions reusing letters are more likely (denser, harder puzzles), without being forced
+        weights = (1 + shared).astype(float)
+        choice = rng.choice(len(rows), p=weights / weights.sum())
+        return int(rows[choice]), int(cols[choice]), direction
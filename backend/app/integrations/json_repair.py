@@ -0,0 +1,378 @@
+"""Tolerant JSON parsing for model output.
+
+Models asked for JSON still produce almost-JSON: code fences or prose
+around it, quotes inside strings left unescaped, raw newlines in strings,
+trailing or missing commas, Python literals, and output cut off when the
+token limit is reached. `loads()` accepts all of that in one pass.
+
+`IncrementalJSONParser` is the same parser fed chunk by chunk (e.g. as
+tokens arrive): each character is consumed once, and `snapshot()` returns
+the value parsed so far with every open string and container closed.
+
+Every decision is local: an unescaped quote ends a string only when the
+next non-blank characters can follow a string there (`:` after a key;
+`,` plus the start of the next key or value, or a closing bracket, after
+a value). Parsing is linear in the input size; only the whitespace after
+a quote is looked ahead.
+"""
+from typing import Any, List, Optional, Tuple
+import copy
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_STRING_CHUNK = re.compile(r'[^"\\]+')
+_NUMBER = re.compile(r"-?\d*(?:\.\d*)?(?:[eE][+-]?\d*)?")
+_WORD = re.compile(r"[A-Za-z_$][\w$-]*")
+_ROOT_START = re.compile(r"[\[{]")
+_HEX4 = re.compile(r"[0-9a-fA-F]{4}")
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "'": "'"}
+_LITERALS = {"true": True, "false": False, "null": None, "True": True, "False": False, "None": None}
+_VALUE_START = set('"{[-0123456789') | set("tfnTFN")
+
+# What a container frame expects next
+_KEY, _COLON, _VALUE, _COMMA = range(4)
+
+_MISSING = object()
+
+
+class _Frame:
+    __slots__ = ("container", "expect", "key")
+
+    def __init__(self, container):
+        self.container = container
+        self.expect = _KEY if isinstance(container, dict) else _VALUE
+        self.key: Optional[str] = None
+
+
+class IncrementalJSONParser:
+    """Push parser for almost-JSON; see the module docstring.
+
+    Text before the first `{` or `[` (prose, a code fence) and anything after
+    the top-level value is ignored.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._root: Any = _MISSING
+        self._done = False
+        # Parts of the string being read, and whether it is an object key
+        self._string: Optional[List[str]] = None
+        self._string_is_key = False
+
+    @property
+    def done(self) -> bool:
+        """True once the top-level value is complete"""
+        return self._done
+
+    def feed(self, chunk: str) -> None:
+        self._buf += chunk
+        self._run(final=False)
+        # Drop consumed text so the buffer does not grow with the whole input
+        if self._pos > 4096 and self._pos * 2 > len(self._buf):
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+    def close(self) -> Any:
+        """Parse what is left as the end of the input and return the value (None if there was none)"""
+        self._run(final=True)
+        if self._string is not None:
+            self._end_string()
+        return None if self._root is _MISSING else self._root
+
+    def snapshot(self) -> Any:
+        """A copy of the value parsed so far, including the string being read"""
+        if self._root is _MISSING:
+            return None
+        memo: dict = {}
+        root = copy.deepcopy(self._root, memo)
+        if self._string is not None and not self._string_is_key and self._stack:
+            frame = self._stack[-1]
+            container = memo[id(frame.container)]
+            partial = "".join(self._string)
+            if isinstance(container, dict):
+                if frame.key is not None:
+                    container[frame.key] = partial
+            else:
+                container.append(partial)
+        return root
+
+    # Parsing
+
+    def _run(self, final: bool) -> None:
+        buf = self._buf
+        n = len(buf)
+        while not self._done:
+            if self._string is not None:
+                if not self._read_string(final):
+                    return
+                continue
+
+            pos = _WHITESPACE.match(buf, self._pos).end()
+            self._pos = pos
+            if pos >= n:
+                return
+
+            if self._root is _MISSING:
+                match = _ROOT_START.search(buf, pos)
+                if match is None:
+                    self._pos = n
+                    return
+                self._pos = match.end()
+                self._open(buf[match.start()])
+                continue
+
+            ch = buf[pos]
+            frame = self._stack[-1]
+            in_object = isinstance(frame.container, dict)
+
+            if ch in "}]":
+                self._pos += 1
+                self._close_container()
+            elif ch == ",":
+                self._pos += 1
+                if frame.expect == _COMMA:
+                    frame.expect = _KEY if in_object else _VALUE
+            elif ch == ":":
+                self._pos += 1
+                if in_object and frame.expect == _COLON:
+                    frame.expect = _VALUE
+            elif in_object and frame.expect in (_KEY, _COMMA):
+                # Also covers a missing comma between members
+                if ch == '"':
+                    self._pos += 1
+                    self._start_string(is_key=True)
+                elif _WORD.match(buf, pos):
+                    # Unquoted key
+                    match = _WORD.match(buf, pos)
+                    if match.end() >= n and not final:
+                        return
+                    self._pos = match.end()
+                    frame.key = match.group()
+                    frame.expect = _COLON
+                else:
+                    self._pos += 1
+            elif in_object and frame.expect == _COLON and ch not in _VALUE_START:
+                self._pos += 1
+            else:
+                # A value (also after a missing colon or comma)
+                if not self._read_value(ch, final):
+                    return
+
+    def _read_value(self, ch: str, final: bool) -> bool:
+        """Start or read the value at the current position; False when more input is needed"""
+        buf = self._buf
+        pos = self._pos
+        if ch == '"':
+            self._pos += 1
+            self._start_string(is_key=False)
+        elif ch in "{[":
+            self._pos += 1
+            self._open(ch)
+        elif ch == "-" or ch.isdigit():
+            match = _NUMBER.match(buf, pos)
+            if match.end() >= len(buf) and not final:
+                return False
+            self._pos = max(match.end(), pos + 1)
+            number = _parse_number(match.group())
+            if number is not None:
+                self._attach(number)
+        elif ch.isalpha() or ch in "_$":
+            match = _WORD.match(buf, pos)
+            if match.end() >= len(buf) and not final:
+                return False
+            self._pos = match.end()
+            if match.group() in _LITERALS:
+                self._attach(_LITERALS[match.group()])
+        else:
+            self._pos += 1
+        return True
+
+    def _read_string(self, final: bool) -> bool:
+        """Read string characters; False when more input is needed"""
+        buf = self._buf
+        n = len(buf)
+        parts = self._string
+        pos = self._pos
+        while True:
+            match = _STRING_CHUNK.match(buf, pos)
+            if match:
+                parts.append(match.group())
+                pos = match.end()
+            if pos >= n:
+                self._pos = pos
+                if final:
+                    self._end_string()
+                    return True
+                return False
+
+            if buf[pos] == "\\":
+                consumed = self._read_escape(pos, final)
+                if consumed == 0:
+                    self._pos = pos
+                    return False
+                pos += consumed
+                continue
+
+            closes = self._quote_closes_string(pos + 1, final)
+            if closes is None:
+                self._pos = pos
+                return False
+            pos += 1
+            if closes:
+                self._pos = pos
+                self._end_string()
+                return True
+            # An unescaped quote inside the string
+            parts.append('"')
+
+    def _read_escape(self, pos: int, final: bool) -> int:
+        """Append the escape at `pos` to the string; returns the characters consumed (0: need more input)"""
+        buf = self._buf
+        parts = self._string
+        if pos + 1 >= len(buf):
+            if not final:
+                return 0
+            return 1
+
+        escape = buf[pos + 1]
+        if escape in _ESCAPES:
+            parts.append(_ESCAPES[escape])
+            return 2
+        if escape != "u":
+            # Not a JSON escape (e.g. LaTeX "\(" ): keep the backslash
+            parts.append("\\" + escape)
+            return 2
+
+        if len(buf) < pos + 6 and not final:
+            return 0
+        if not _HEX4.fullmatch(buf, pos + 2, pos + 6):
+            parts.append("\\u")
+            return 2
+        code = int(buf[pos + 2:pos + 6], 16)
+        if 0xD800 <= code < 0xDC00:
+            # A surrogate pair is two escapes
+            if len(buf) < pos + 12 and not final:
+                return 0
+            if buf.startswith("\\u", pos + 6) and _HEX4.fullmatch(buf, pos + 8, pos + 12):
+                low = int(buf[pos + 8:pos + 12], 16)
+                if 0xDC00 <= low < 0xE000:
+                    parts.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                    return 12
+        parts.append(chr(code))
+        return 6
+
+    def _quote_closes_string(self, after: int, final: bool) -> Optional[bool]:
+        """Whether the quote before `after` ends the current string (None: need more input)"""
+        buf = self._buf
+        n = len(buf)
+        j = _WHITESPACE.match(buf, after).end()
+        if j >= n:
+            return True if final else None
+
+        ch = buf[j]
+        if self._string_is_key:
+            return ch in ":}"
+        if not self._stack:
+            return True
+        if ch in "}]":
+            return True
+        if ch != ",":
+            return False
+
+        k = _WHITESPACE.match(buf, j + 1).end()
+        if k >= n:
+            return True if final else None
+        following = buf[k]
+        if isinstance(self._stack[-1].container, dict):
+            return following in '"}'
+        return following in _VALUE_START or following == "]"
+
+    # Building the value
+
+    def _start_string(self, is_key: bool) -> None:
+        self._string = []
+        self._string_is_key = is_key
+
+    def _end_string(self) -> None:
+        value = "".join(self._string)
+        is_key = self._string_is_key
+        self._string = None
+        if is_key:
+            frame = self._stack[-1]
+            frame.key = value
+            frame.expect = _COLON
+        else:
+            self._attach(value)
+
+    def _open(self, bracket: str) -> None:
+        container: Any = {} if bracket == "{" else []
+        if self._root is _MISSING:
+            self._root = container
+        else:
+            # Attached right away, so snapshots include containers still being read
+            self._attach(container)
+        self._stack.append(_Frame(container))
+
+    def _close_container(self) -> None:
+        self._stack.pop()
+        if self._stack:
+            self._stack[-1].expect = _COMMA
+        else:
+            self._done = True
+
+    def _attach(self, value: Any) -> None:
+        frame = self._stack[-1]
+        if isinstance(frame.container, dict):
+            if frame.key is not None:
+                frame.container[frame.key] = value
+            frame.key = None
+        else:
+            frame.container.append(value)
+        frame.expect = _COMMA
+
+
+def _parse_number(text: str) -> Any:
+    # A truncated number ("12.", "1e", "-") keeps its valid prefix
+    text = text.rstrip("eE+-.")
+    if not text or text == "-":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def loads_with_status(text: str) -> Tuple[Any, bool]:
+    """Like `loads`, but also returns whether the output was complete.
+
+    Output is complete when its top-level value was closed (it may still have
+    needed other repairs); truncated output parses to the partial value.
+    """
+    try:
+        return json.loads(text), True
+    except ValueError:
+        pass
+
+    parser = IncrementalJSONParser()
+    parser.feed(text)
+    value = parser.close()
+    if value is None:
+        raise ValueError("No JSON object or array found in model output")
+    return value, parser.done
+
+
+def loads(text: str) -> Any:
+    """Parse model output as JSON, repairing it if needed.
+
+    Valid JSON takes the fast path through `json.loads`. Raises ValueError
+    when the text contains no object or array.
+    """
+    return loads_with_status(text)[0]
@@ -1,16 +1,23 @@
 from app.integrations.learning_path.templates import (
     learning_path_generation_template,
+    session_content_template,
     get_structure_instructions,
     get_content_instructions
 )
 from app.integrations.learning_path.structures import LearningPathOutput
 from app.integrations.ai_client import AIClient
+from app.integrations import json_repair
+from app.infrastructure.files.retrieval import focus_content
+from app.infrastructure.metrics import stage
+from app.core.settings import get_settings
 from datetime import datetime
+from typing import AsyncIterator
+import asyncio
 import uuid
 
 class LearningPathAIClient(AIClient):
     """AI Client for learning paths - exactly like SummarizeAIClient"""
-    
+
     async def generate_learning_path(
         self,
         content: str,
@@ -30,228 +37,368 @@ class LearningPathAIClient(AIClient):
         generate_full_content: bool = False
     ) -> dict:
         """Generate learning path with advanced customization"""
-        
+
+        params = self._build_params(
+            content, difficulty, modules_count, sessions_per_module, topics_per_session,
+            flashcards_per_topic, questions_per_topic, language, auto_structure,
+            learning_approach, language_register, detail_level
+        )
+
+        try:
+            if generate_full_content and get_settings().LEARNING_PATH_FANOUT_ENABLED:
+                # Two phases: a fast outline, then every session's content concurrently
+                outline = await self._generate_outline(params)
+                if "error" in outline:
+                    return outline
+                await self._generate_sessions_content(outline, params)
+                data = outline
+            elif generate_full_content:
+                data = await self._generate_full_single_call(params)
+            else:
+                data = await self._generate_outline(params)
+
+            if "error" in data:
+                return data
+
+            # Add IDs and format for frontend
+            with stage("format_output"):
+                # Full-content paths have hundreds of topics and flashcards; keep the walk off the event loop
+                return await asyncio.to_thread(self._format_output, data, total_duration, difficulty)
+        except Exception as e:
+            import traceback
+            print(f"[ERROR] Failed to generate learning path: {e}")
+            traceback.print_exc()
+            return {"error": f"Failed to generate learning path: {str(e)}"}
+
+    async def stream_learning_path(
+        self,
+        content: str,
+        difficulty: str,
+        total_duration: str,
+        modules_count: int,
+        sessions_per_module: int,
+        topics_per_session: int,
+        flashcards_per_topic: int,
+        questions_per_topic: int,
+        include_theory: bool,
+        language: str,
+        auto_structure: bool = False,
+        learning_approach: str = "balanced",
+        language_register: str = "neutral",
+        detail_level: str = "intermediate",
+        generate_full_content: bool = False
+    ) -> AsyncIterator[dict]:
+        """Generate a learning path as a sequence of events, each {"event": ..., "data": ...}.
+
+        - path: the header (id, title, description, ...) as soon as the outline exists
+        - module: a module with its id and session headers (id, title, description, duration)
+        - session: {"moduleId", "session"} with full content, in completion order
+        - done / error
+
+        IDs are the same ones _format_output assigns.
+        """
+        params = self._build_params(
+            content, difficulty, modules_count, sessions_per_module, topics_per_session,
+            flashcards_per_topic, questions_per_topic, language, auto_structure,
+            learning_approach, language_register, detail_level
+        )
+        fanout = generate_full_content and get_settings().LEARNING_PATH_FANOUT_ENABLED
+
+        try:
+            if generate_full_content and not fanout:
+                data = await self._generate_full_single_call(params)
+            else:
+                data = await self._generate_outline(params)
+        except Exception as e:
+            yield {"event": "error", "data": {"detail": f"Failed to generate learning path: {str(e)}"}}
+            return
+        if "error" in data:
+            yield {"event": "error", "data": {"detail": data["error"]}}
+            return
+
+        yield {"event": "path", "data": self._path_header(data, total_duration, difficulty)}
+
+        pending = []
+        sessions_count = 0
+        for module_idx, module in enumerate(data.get("modules", [])):
+            if not isinstance(module, dict):
+                continue
+            module["id"] = f"module_{module_idx + 1}"
+
+            sessions = []
+            for session_idx, session in enumerate(module.get("sessions", [])):
+                if isinstance(session, dict):
+                    self._assign_session_ids(session, f"{module['id']}_session_{session_idx + 1}")
+                    sessions.append(session)
+
+            yield {"event": "module", "data": {
+                **{key: value for key, value in module.items() if key != "sessions"},
+                "sessions": [
+                    {key: session.get(key) for key in ("id", "title", "description", "estimatedDuration")}
+                    for session in sessions
+                ],
+            }}
+
+            for session in sessions:
+                sessions_count += 1
+                if fanout:
+                    pending.append((module, session))
+                else:
+                    yield {"event": "session", "data": {"moduleId": module["id"], "session": session}}
+
+        if pending:
+            semaphore = asyncio.Semaphore(get_settings().LEARNING_PATH_SESSION_CONCURRENCY)
+            module_ids = {id(session): module["id"] for module, session in pending}
+            tasks = [
+                asyncio.create_task(self._fill_session(data, module, session, params, semaphore))
+                for module, session in pending
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    session = await next_done
+                    # Generated topics/flashcards/practice need their IDs again
+                    self._assign_session_ids(session, session["id"])
+                    yield {"event": "session", "data": {"moduleId": module_ids[id(session)], "session": session}}
+            finally:
+                # The client went away: stop generating the remaining sessions
+                for task in tasks:
+                    task.cancel()
+
+        yield {"event": "done", "data": {"modules": len(data.get("modules", [])), "sessions": sessions_count}}
+
+    def _build_params(
+        self, content, difficulty, modules_count, sessions_per_module, topics_per_session,
+        flashcards_per_topic, questions_per_topic, language, auto_structure,
+        learning_approach, language_register, detail_level
+    ) -> dict:
+        """Prompt values shared by every phase"""
+        return {
+            "content": content,
+            "difficulty": difficulty,
+            "modules_count": modules_count,
+            "sessions_per_module": sessions_per_module,
+            "topics_per_session": topics_per_session,
+            "flashcards_per_topic": flashcards_per_topic,
+            "questions_per_topic": questions_per_topic,
+            "language": language,
+            "auto_structure": auto_structure,
+            "learning_approach": learning_approach,
+            "language_register": language_register,
+            "detail_level": detail_level,
+        }
+
+    def _path_payload(self, params: dict, generate_full_content: bool) -> dict:
+        """Payload for learning_path_generation_template"""
+        auto_structure = params["auto_structure"]
+
         # Get dynamic instructions
         structure_instr = get_structure_instructions(
-            auto_structure, modules_count, sessions_per_module,
-            topics_per_session, flashcards_per_topic, questions_per_topic
+            auto_structure, params["modules_count"], params["sessions_per_module"],
+            params["topics_per_session"], params["flashcards_per_topic"], params["questions_per_topic"]
         )
-        content_instr = get_content_instructions(generate_full_content, learning_approach, detail_level)
-        
-        instructions = learning_path_generation_template()
-        
+        content_instr = get_content_instructions(generate_full_content, params["learning_approach"], params["detail_level"])
+
         # Determine output format based on mode
         if generate_full_content:
             output_format_text = """Respond with a JSON object: {"title": "...", "description": "...", "modules": [...]}"""
         else:
             output_format_text = """Respond with: {"title": "...", "description": "...", "modules_json": "[...]"}"""
-        
-        # Create a model per request with JSON mode for full content generation
-        # When generating full content, use JSON mode instead of structured output
-        # to avoid escaping issues with complex content
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        
-        if generate_full_content:
-            # Use JSON mode for full content - directly request JSON without structured output
-            model = ChatGoogleGenerativeAI(
-                model=self.model_name,
-                api_key=self.api_key,
-                max_retries=self.max_retries,
-                response_mime_type="application/json"  # Force valid JSON output
-            )
-            
-            # Use the model directly (no structured output)
-            chain = instructions | model
-            
-            response = await chain.ainvoke({
-                "content": content,
-                "difficulty": difficulty,
-                "modules_count": modules_count,
-                "sessions_per_module": sessions_per_module,
-                "topics_per_session": topics_per_session,
-                "flashcards_per_topic": flashcards_per_topic,
-                "questions_per_topic": questions_per_topic,
-                "language": language,
-                "auto_structure": "YES - Analyze and decide optimal structure" if auto_structure else "NO - Use specified counts",
-                "learning_approach": learning_approach,
-                "language_register": language_register,
-                "detail_level": detail_level,
-                "generate_full_content": "YES - Generate complete content" if generate_full_content else "NO - Generate structure only",
-                "structure_instructions": structure_instr,
-                "content_instructions": content_instr,
-                "content_field": "Complete detailed content with examples and explanations",
-                "output_format": output_format_text
-            })
-            
-            # Parse the JSON response manually
-            import json
-            try:
-                result_dict = json.loads(response.content)
-                # Create a mock result object with the expected structure
-                class MockResult:
-                    def __init__(self, data):
-                        self.title = data.get("title", "Learning Path")
-                        self.description = data.get("description", "")
-                        self.modules_json = json.dumps(data.get("modules", []))
-                
-                result = MockResult(result_dict)
-            except Exception as e:
-                print(f"[ERROR] Failed to parse JSON mode response: {e}")
-                return {"error": f"Failed to parse response: {e}"}
-                
-        else:
-            # Use standard structured output for structure-only (faster)
-            model = self.new_model()
-            structured_llm = model.with_structured_output(LearningPathOutput)
-            chain = instructions | structured_llm
-            
-            result = await chain.ainvoke({
-                "content": content,
-                "difficulty": difficulty,
-                "modules_count": modules_count,
-                "sessions_per_module": sessions_per_module,
-                "topics_per_session": topics_per_session,
-                "flashcards_per_topic": flashcards_per_topic,
-                "questions_per_topic": questions_per_topic,
-                "language": language,
-                "auto_structure": "YES - Analyze and decide optimal structure" if auto_structure else "NO - Use specified counts",
-                "learning_approach": learning_approach,
-                "language_register": language_register,
-                "detail_level": detail_level,
-                "generate_full_content": "NO - Generate structure only",
-                "structure_instructions": structure_instr,
-                "content_instructions": content_instr,
-                "content_field": "Brief description",
-                "output_format": output_format_text
-            })
-        
+
+        return {
+            "content": params["content"],
+            "difficulty": params["difficulty"],
+            "modules_count": params["modules_count"],
+            "sessions_per_module": params["sessions_per_module"],
+            "topics_per_session": params["topics_per_session"],
+            "flashcards_per_topic": params["flashcards_per_topic"],
+            "questions_per_topic": params["questions_per_topic"],
+            "language": params["language"],
+            "auto_structure": "YES - Analyze and decide optimal structure" if auto_structure else "NO - Use specified counts",
+            "learning_approach": params["learning_approach"],
+            "language_register": params["language_register"],
+            "detail_level": params["detail_level"],
+            "generate_full_content": "YES - Generate complete content" if generate_full_content else "NO - Generate structure only",
+            "structure_instructions": structure_instr,
+            "content_instructions": content_instr,
+            "content_field": "Complete detailed content with examples and explanations" if generate_full_content else "Brief description",
+            "output_format": output_format_text
+        }
+
+    def _json_model(self):
+        # JSON mode instead of structured output to avoid escaping issues with complex content
+        return self.new_model(response_mime_type="application/json")
+
+    async def _generate_outline(self, params: dict) -> dict:
+        """Structure-only path: modules, sessions and topics with brief content"""
+        # Use standard structured output for structure-only (faster)
+        result = await self.invoke_structured(
+            learning_path_generation_template(), LearningPathOutput, self._path_payload(params, False)
+        )
+
         if not result:
             return {"error": "No learning path could be generated."}
-        
+
+        return {
+            "title": result.title,
+            "description": result.description,
+            "modules": await self._parse_modules_json(result.modules_json if result.modules_json else "[]")
+        }
+
+    async def _generate_full_single_call(self, params: dict) -> dict:
+        """Whole course with full content in one JSON-mode call (used when fan-out is disabled)"""
+        # Parse the JSON response manually
         try:
-            # Parse JSON and add IDs
-            import json
-            import re
-            
-            modules_json = result.modules_json if result.modules_json else "[]"
-            
-            # Clean JSON string before parsing (common AI mistakes)
-            def clean_json(json_str: str) -> str:
-                """Clean and fix common JSON formatting issues from AI output"""
-                # Remove any markdown code blocks
-                json_str = re.sub(r'```json\s*', '', json_str)
-                json_str = re.sub(r'```\s*$', '', json_str)
-                
-                # Remove any leading/trailing whitespace
-                json_str = json_str.strip()
-                
-                # Fix unescaped quotes in string values using a more sophisticated approach
-                # This regex finds "key": "value" pairs and escapes quotes inside the value
-                def fix_value_quotes(match):
-                    key = match.group(1)
-                    value = match.group(2)
-                    # Escape unescaped quotes in the value
-                    # But be careful not to double-escape already escaped quotes
-                    value = value.replace('\\"', '___ALREADY_ESCAPED___')
-                    value = value.replace('"', '\\"')
-                    value = value.replace('___ALREADY_ESCAPED___', '\\"')
-                    return f'"{key}": "{value}"'
-                
-                # Pattern to match "key": "value" where value might contain unescaped quotes
-                # This is a simplified approach - match field: string pairs
-                pattern = r'"(content|question|answer|title|description)"\s*:\s*"((?:[^"\\]|\\.)*)(?<!\\)"'
-                
-                try:
-                    # Try to fix quote issues in content fields
-                    json_str = re.sub(pattern, fix_value_quotes, json_str)
-                except:
-                    pass  # If regex fails, continue with original
-                
-                return json_str
-            
-            # Clean the JSON first
-            modules_json = clean_json(modules_json)
-            
-            # Parse with fallback
+            result_dict = await self.invoke_text(
+                learning_path_generation_template(),
+                self._path_payload(params, True),
+                model=self._json_model(),
+                variant="application/json",
+                parse=self._parse_json_output
+            )
+        except ValueError as e:
+            print(f"[ERROR] Failed to parse JSON mode response: {e}")
+            return {"error": f"Failed to parse response: {e}"}
+
+        if not result_dict or not isinstance(result_dict, dict):
+            return {"error": "No learning path could be generated."}
+
+        modules = result_dict.get("modules", [])
+        return {
+            "title": result_dict.get("title", "Learning Path"),
+            "description": result_dict.get("description", ""),
+            "modules": modules if isinstance(modules, list) else []
+        }
+
+    async def _generate_sessions_content(self, outline: dict, params: dict) -> None:
+        """Fill every session of the outline with full content, generating sessions concurrently.
+
+        At most LEARNING_PATH_SESSION_CONCURRENCY sessions are generated at once. A session
+        whose generation fails keeps its outline content.
+        """
+        semaphore = asyncio.Semaphore(get_settings().LEARNING_PATH_SESSION_CONCURRENCY)
+
+        await asyncio.gather(*(
+            self._fill_session(outline, module, session, params, semaphore)
+            for module in outline.get("modules", []) if isinstance(module, dict)
+            for session in module.get("sessions", []) if isinstance(session, dict)
+        ))
+
+    async def _fill_session(self, outline: dict, module: dict, session: dict, params: dict, semaphore: asyncio.Semaphore) -> dict:
+        """Replace the outline content of `session` with generated full content; returns the session"""
+        async with semaphore:
             try:
-                decoder = json.JSONDecoder()
-                modules, _ = decoder.raw_decode(modules_json)
-            except json.JSONDecodeError as e:
-                print(f"[WARNING] JSONDecoder failed: {e}")
-                print(f"[DEBUG] First 500 chars of JSON: {modules_json[:500]}")
-                print(f"[DEBUG] Problem area: {modules_json[max(0, e.pos-100):e.pos+100]}")
-                
-                # Try standard json.loads
-                try:
-                    modules = json.loads(modules_json)
-                except json.JSONDecodeError as e2:
-                    print(f"[ERROR] json.loads also failed: {e2}")
-                    # Last resort: try to extract array from the string
-                    match = re.search(r'\[.*\]', modules_json, re.DOTALL)
-                    if match:
-                        modules = json.loads(match.group(0))
-                    else:
-                        raise
-            
-            # Ensure it's a list
-            modules = modules if isinstance(modules, list) else []
-            
-            # Add IDs and format for frontend
-            return self._format_output({
-                "title": result.title,
-                "description": result.description,
-                "modules": modules
-            }, total_duration, difficulty)
-        except Exception as e:
-            import traceback
-            print(f"[ERROR] Failed to format learning path: {e}")
-            traceback.print_exc()
-            return {"error": f"Failed to format learning path: {str(e)}"}
-    
+                generated = await self._generate_session_content(outline, module, session, params)
+            except Exception as e:
+                print(f"[WARNING] Session '{session.get('title', '')}' content generation failed: {e}")
+                return session
+        for key in ("topics", "flashcards", "practice"):
+            if isinstance(generated.get(key), list) and generated[key]:
+                session[key] = generated[key]
+        return session
+
+    async def _generate_session_content(self, outline: dict, module: dict, session: dict, params: dict) -> dict:
+        """Full content (topics, flashcards, practice) for one session of the outline"""
+        topics = [topic for topic in session.get("topics", []) if isinstance(topic, dict)]
+        topic_titles = [topic.get("title", "") for topic in topics] or [session.get("title", "")]
+        # Only the parts of a large document about this session
+        query = [module.get("title"), session.get("title"), session.get("description"), *topic_titles]
+        content = await focus_content(params["content"], "\n".join(str(part) for part in query if part))
+
+        generated = await self.invoke_text(
+            session_content_template(),
+            {
+                "content": content,
+                "language": params["language"],
+                "difficulty": params["difficulty"],
+                "learning_approach": params["learning_approach"],
+                "language_register": params["language_register"],
+                "detail_level": params["detail_level"],
+                "path_title": outline.get("title", ""),
+                "module_title": module.get("title", ""),
+                "module_description": module.get("description", ""),
+                "session_title": session.get("title", ""),
+                "session_description": session.get("description", ""),
+                "topic_titles": "\n".join(f"- {title}" for title in topic_titles),
+                "flashcards_count": params["flashcards_per_topic"] * len(topic_titles),
+                "questions_count": params["questions_per_topic"] * len(topic_titles),
+                "content_instructions": get_content_instructions(True, params["learning_approach"], params["detail_level"]),
+            },
+            model=self._json_model(),
+            variant="application/json",
+            parse=self._parse_json_output
+        )
+        return generated if isinstance(generated, dict) else {}
+
+    @staticmethod
+    def _parse_json(json_str: str):
+        """Parse model JSON output, repairing common formatting mistakes (fences, stray quotes, truncation)"""
+        with stage("output_parse"):
+            return json_repair.loads(json_str)
+
+    @staticmethod
+    def _parse_json_output(json_str: str):
+        """Parse a JSON-mode response; returns (value, complete), where only a complete object is worth caching"""
+        with stage("output_parse"):
+            value, complete = json_repair.loads_with_status(json_str)
+        return value, complete and isinstance(value, dict)
+
+    async def _parse_modules_json(self, modules_json: str) -> list:
+        modules = await asyncio.to_thread(self._parse_json, modules_json)
+        # Ensure it's a list
+        return modules if isinstance(modules, list) else []
+
     def _format_output(self, data: dict, total_duration: str, difficulty: str) -> dict:
         """Add IDs and metadata to the output"""
-        
-        learning_path_id = str(uuid.uuid4())
+
         modules = data.get("modules", [])
-        
+
         # Add IDs to all nested structures
         for module_idx, module in enumerate(modules):
             if not isinstance(module, dict):
                 continue
-                
+
             module["id"] = f"module_{module_idx + 1}"
-            
+
             for session_idx, session in enumerate(module.get("sessions", [])):
                 if not isinstance(session, dict):
                     continue
-                    
-                session["id"] = f"{module['id']}_session_{session_idx + 1}"
-                
-                # Add IDs to topics (topics only have title and content now)
-                for topic_idx, topic in enumerate(session.get("topics", [])):
-                    if not isinstance(topic, dict):
-                        continue
-                        
-                    topic["id"] = f"{session['id']}_topic_{topic_idx + 1}"
-                
-                # Add IDs to flashcards (at session level)
-                for fc_idx, flashcard in enumerate(session.get("flashcards", [])):
-                    if isinstance(flashcard, dict):
-                        flashcard["id"] = f"{session['id']}_flashcard_{fc_idx + 1}"
-                
-                # Add IDs to practice questions (at session level)
-                for q_idx, question in enumerate(session.get("practice", [])):
-                    if isinstance(question, dict):
-                        question["id"] = f"{session['id']}_question_{q_idx + 1}"
-        
+
+                self._assign_session_ids(session, f"{module['id']}_session_{session_idx + 1}")
+
         return {
-            "id": learning_path_id,
+            **self._path_header(data, total_duration, difficulty),
+            "modules": modules
+        }
+
+    @staticmethod
+    def _path_header(data: dict, total_duration: str, difficulty: str) -> dict:
+        """Learning path metadata (everything but the modules)"""
+        return {
+            "id": str(uuid.uuid4()),
             "title": data.get("title", "Learning Path"),
             "description": data.get("description", ""),
             "totalDuration": total_duration,
             "difficulty": difficulty,
             "createdAt": datetime.utcnow().isoformat() + "Z",
-            "modules": modules
         }
 
+    @staticmethod
+    def _assign_session_ids(session: dict, session_id: str) -> None:
+        session["id"] = session_id
+
+        # Add IDs to topics (topics only have title and content now)
+        for topic_idx, topic in enumerate(session.get("topics", [])):
+            if not isinstance(topic, dict):
+                continue
+
+            topic["id"] = f"{session['id']}_topic_{topic_idx + 1}"
+
+        # Add IDs to flashcards (at session level)
+        for fc_idx, flashcard in enumerate(session.get("flashcards", [])):
+            if isinstance(flashcard, dict):
+                flashcard["id"] = f"{session['id']}_flashcard_{fc_idx + 1}"
 
+        # Add IDs to practice questions (at session level)
+        for q_idx, question in enumerate(session.get("practice", [])):
+            if isinstance(question, dict):
+                question["id"] = f"{session['id']}_question_{q_idx + 1}"
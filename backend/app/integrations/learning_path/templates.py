@@ -164,3 +164,49 @@ def get_content_instructions(generate_full_content: bool, learning_approach: str
         """
 
 
+def session_content_template():
+    return PromptTemplate.from_template("""
+    You are an expert educational content creator. Write the complete content of ONE session of a learning path, based on the document content.
+    
+    CONFIGURATION:
+    - Language: {language}
+    - Difficulty: {difficulty}
+    - Learning Approach: {learning_approach}
+    - Language Register: {language_register}
+    - Detail Level: {detail_level}
+    
+    CONTEXT:
+    - Learning path: {path_title}
+    - Module: {module_title} - {module_description}
+    - Session: {session_title} - {session_description}
+    
+    TOPICS OF THIS SESSION (keep these titles and this order):
+    {topic_titles}
+    
+    CONTENT GENERATION:
+    {content_instructions}
+    
+    Generate EXACTLY {flashcards_count} flashcards and {questions_count} practice questions covering ALL topics of this session.
+    
+    OUTPUT FORMAT:
+    Respond with a JSON object with this EXACT structure:
+    {{
+      "topics": [
+        {{"title": "Topic Title", "content": "Complete detailed content with examples and explanations"}}
+      ],
+      "flashcards": [
+        {{"question": "Question about ANY topic in this session?", "answer": "Answer without newlines"}}
+      ],
+      "practice": [
+        {{"question": "Question about ANY topic in this session?", "options": ["Option A", "Option B", "Option C", "Option D"], "correctAnswer": 0}}
+      ]
+    }}
+    
+    CRITICAL JSON FORMATTING RULES:
+    - Use \\n for line breaks inside strings, NEVER actual newlines
+    - Escape quotes inside strings as \\"
+    - Do NOT use single quotes - only double quotes
+    
+    Content to analyze:
+    {content}
+    """)
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import threading
+
+from app.core.settings import get_settings
+
+
+def _gemini_factory(model_name: str, api_key: str, max_retries: int, **variant: Any):
+    # The Google SDK takes about half a second to import; only pay for it once a model is needed
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        api_key=api_key,
+        max_retries=max_retries,
+        **variant
+    )
+
+
+class ModelPool:
+    """Reuses chat model clients instead of building one per request.
+
+    There is one client per (model name, variant), where the variant is the
+    extra constructor arguments (e.g. response_mime_type="application/json").
+    Clients are stateless between calls, so concurrent requests share them,
+    and so do their HTTP connections (keep-alive, no new TLS handshake).
+
+    Google's async transport binds to the event loop it first runs on. Using a
+    client from another loop is what caused the serverless shutdown errors, so
+    the pool is tied to one loop and starts empty when the running loop
+    changes.
+    """
+
+    def __init__(self, factory: Callable[..., Any] = _gemini_factory, enabled: bool = True):
+        self.factory = factory
+        self.enabled = enabled
+        self._models: Dict[Tuple, Any] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def get(self, model_name: str, api_key: str, max_retries: int, **variant: Any):
+        if not self.enabled:
+            self.created += 1
+            return self.factory(model_name, api_key, max_retries, **variant)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (model_name, max_retries, tuple(sorted(variant.items())))
+
+        with self._lock:
+            if loop is not self._loop:
+                self._models.clear()
+                self._loop = loop
+
+            model = self._models.get(key)
+            if model is None:
+                model = self.factory(model_name, api_key, max_retries, **variant)
+                self._models[key] = model
+                self.created += 1
+            else:
+                self.reused += 1
+            return model
+
+    def close(self) -> None:
+        """Drop every pooled client (called on app shutdown)."""
+        with self._lock:
+            self._models.clear()
+            self._loop = None
+
+    def stats(self) -> dict:
+        return {"models": len(self._models), "created": self.created, "reused": self.reused}
+
+
+@lru_cache()
+def get_model_pool() -> ModelPool:
+    return ModelPool(enabled=get_settings().MODEL_POOL_ENABLED)
@@ -0,0 +1,188 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+import asyncio
+import random
+import threading
+import time
+
+from app.core.settings import get_settings
+
+# Status codes and gRPC/HTTP status names Gemini uses when it is overloaded or over quota
+THROTTLING_STATUS_CODES = {429, 503}
+THROTTLING_MARKERS = ("429", "503", "RESOURCE_EXHAUSTED", "ResourceExhausted", "UNAVAILABLE",
+                      "ServiceUnavailable", "TooManyRequests", "rate limit", "quota")
+TRANSIENT_STATUS_CODES = {408, 500, 502, 504}
+TRANSIENT_MARKERS = ("INTERNAL", "DEADLINE_EXCEEDED", "InternalServerError", "GatewayTimeout", "ReadTimeout", "ConnectTimeout")
+
+
+def _matches(error: BaseException, status_codes, markers) -> bool:
+    """True when the error (or one it was raised from) has one of `status_codes` or mentions one of `markers`."""
+    while error is not None:
+        for attr in ("status_code", "code", "status"):
+            value = getattr(error, attr, None)
+            if callable(value):
+                # gRPC errors expose code() as a method
+                try:
+                    value = value()
+                except Exception:
+                    continue
+            if value in status_codes or getattr(value, "value", None) in status_codes:
+                return True
+        text = f"{type(error).__name__}: {error}"
+        if any(marker in text for marker in markers):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """True when the error means "slow down" (HTTP 429/503)."""
+    return _matches(error, THROTTLING_STATUS_CODES, THROTTLING_MARKERS)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """True for server and timeout errors worth one more try, that say nothing about load (HTTP 408/500/502/504)."""
+    return not is_throttling_error(error) and _matches(error, TRANSIENT_STATUS_CODES, TRANSIENT_MARKERS)
+
+
+class AdaptiveRateLimiter:
+    """Concurrency limit plus token bucket for calls to one model, adjusted with AIMD.
+
+    Every throttling error halves the concurrency limit and the request rate
+    (multiplicative decrease); every success raises them back gradually
+    (additive increase) up to the configured maximums. Callers wait in FIFO
+    order, and `queue_depth` is the number waiting.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, requests_per_minute: float):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_rate = max(requests_per_minute, 1) / 60.0
+        self.concurrency_limit = float(self.max_concurrency)
+        self.rate = self.max_rate
+
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.throttled = 0
+        self.completed = 0
+
+        self._tokens = float(self.max_concurrency)
+        self._last_refill = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._condition: Optional[asyncio.Condition] = None
+        self._bucket_lock: Optional[asyncio.Lock] = None
+
+    def _primitives(self):
+        # asyncio primitives are bound to the loop that first uses them
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._bucket_lock = asyncio.Lock()
+            self.in_flight = 0
+        return self._condition, self._bucket_lock
+
+    async def _take_token(self, bucket_lock: asyncio.Lock) -> None:
+        async with bucket_lock:
+            while True:
+                now = time.monotonic()
+                # Burst capacity follows the current concurrency limit
+                capacity = max(1.0, self.concurrency_limit)
+                self._tokens = min(capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def acquire(self) -> None:
+        condition, bucket_lock = self._primitives()
+        self.queue_depth += 1
+        try:
+            async with condition:
+                await condition.wait_for(lambda: self.in_flight < int(self.concurrency_limit))
+                self.in_flight += 1
+            try:
+                await self._take_token(bucket_lock)
+            except BaseException:
+                await self._release(condition)
+                raise
+        finally:
+            self.queue_depth -= 1
+
+    async def _release(self, condition: asyncio.Condition) -> None:
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    async def release(self, throttled: Optional[bool]) -> None:
+        """Free the slot; `throttled` None (e.g. cancelled call) leaves the limits unchanged."""
+        if throttled:
+            self.throttled += 1
+            self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+        elif throttled is not None:
+            self.completed += 1
+            # About +1 concurrent call per window of successful calls
+            self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + 1 / self.concurrency_limit)
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+        condition, _ = self._primitives()
+        await self._release(condition)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one call slot; a throttling error raised inside reduces the limits."""
+        await self.acquire()
+        throttled: Optional[bool] = False
+        try:
+            yield
+        except asyncio.CancelledError:
+            throttled = None
+            raise
+        except BaseException as e:
+            throttled = is_throttling_error(e)
+            raise
+        finally:
+            await asyncio.shield(self.release(throttled))
+
+    @staticmethod
+    def backoff(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+        """Exponential backoff with full jitter, so throttled callers do not retry in lockstep."""
+        return random.uniform(0, min(cap, base * 2 ** attempt))
+
+    def stats(self) -> dict:
+        return {
+            "model": self.name,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "concurrency_limit": int(self.concurrency_limit),
+            "requests_per_minute": round(self.rate * 60, 1),
+            "throttled": self.throttled,
+            "completed": self.completed,
+        }
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model_name: str) -> AdaptiveRateLimiter:
+    """Process-wide limiter for `model_name`, shared by every AIClient."""
+    with _limiters_lock:
+        limiter = _limiters.get(model_name)
+        if limiter is None:
+            settings = get_settings()
+            if model_name == settings.GEMINI_MODEL_PRO:
+                limiter = AdaptiveRateLimiter(
+                    model_name, settings.GEMINI_MODEL_PRO_MAX_CONCURRENCY, settings.GEMINI_MODEL_PRO_RPM
+                )
+            else:
+                limiter = AdaptiveRateLimiter(
+                    model_name, settings.GEMINI_MODEL_MAX_CONCURRENCY, settings.GEMINI_MODEL_RPM
+                )
+            _limiters[model_name] = limiter
+        return limiter
+
+
+def rate_limiter_stats() -> list:
+    return [limiter.stats() for limiter in _limiters.values()]
@@ -1,18 +1,30 @@
+from typing import List
+import asyncio
+
+from app.core.settings import get_settings
 from app.domain.models import SummaryOptions
-from app.integrations.summaries.templates import summarize_template
+from app.infrastructure.files.chunking import estimate_tokens, split_into_chunks
+from app.integrations.summaries.templates import (
+    summarize_template,
+    summarize_chunk_template,
+    reduce_summaries_template,
+)
 from app.integrations.summaries.structures import Summary
 from app.integrations.ai_client import AIClient
 
+# Map passes over partial summaries that are still too large for the reduce prompt
+MAX_REDUCE_PASSES = 3
+
 class SummarizeAIClient(AIClient):
     async def summarize_text(self, content: str, options: SummaryOptions) -> dict:
-        instructions = summarize_template()
+        settings = get_settings()
+        # Large documents are summarized in chunks (map) and then merged (reduce)
+        if estimate_tokens(content) > settings.SUMMARY_CHUNKING_THRESHOLD_TOKENS:
+            return await self.summarize_chunked(content, options)
 
-        # Create a model per request (no global model that open and close (that cause the vercel error))
-        model = self.new_model()
+        instructions = summarize_template()
 
-        structured_llm = model.with_structured_output(Summary)
-        chain = instructions | structured_llm
-        result = await chain.ainvoke({
+        result = await self.invoke_structured(instructions, Summary, {
             "content": content,
             "character": options.character,
             "language_register": options.language_register,
@@ -26,3 +38,72 @@ class SummarizeAIClient(AIClient):
         if not result:
             return {"error": "No summary could be generated."}
         return result.model_dump()
+
+    async def summarize_chunked(self, content: str, options: SummaryOptions) -> dict:
+        """Map-reduce summarization for content larger than the prompt budget.
+
+        Chunks are summarized concurrently (at most SUMMARY_MAP_CONCURRENCY at a
+        time) and the partial summaries are merged into the final Summary. If
+        the partial summaries are still too large they are summarized again, for
+        at most MAX_REDUCE_PASSES passes and only while each pass shrinks them.
+        """
+        settings = get_settings()
+        semaphore = asyncio.Semaphore(settings.SUMMARY_MAP_CONCURRENCY)
+        option_values = {
+            "character": options.character,
+            "language_register": options.language_register,
+            "language": options.language,
+            "include_references": options.include_references,
+            "include_examples": options.include_examples,
+            "include_conclusions": options.include_conclusions,
+        }
+
+        async def summarize_chunk(part: int, parts: int, chunk: str) -> str:
+            async with semaphore:
+                result = await self.invoke_structured(summarize_chunk_template(), Summary, {
+                    **option_values,
+                    "content": chunk,
+                    "part": part,
+                    "parts": parts,
+                })
+            return self._render_partial(result) if result else ""
+
+        text = content
+        for _ in range(MAX_REDUCE_PASSES):
+            previous_length = len(text)
+            chunks = split_into_chunks(text, settings.SUMMARY_CHUNK_TOKENS)
+            partials = await asyncio.gather(
+                *(summarize_chunk(i, len(chunks), chunk) for i, chunk in enumerate(chunks, start=1))
+            )
+            text = "\n\n".join(
+                f"--- Part {i} ---\n{partial}" for i, partial in enumerate(partials, start=1) if partial
+            )
+            # Stop when the partials fit in one prompt, or when this pass did not shrink them
+            # (another one would most likely not either, and every pass is paid model calls)
+            if (
+                estimate_tokens(text) <= settings.SUMMARY_CHUNKING_THRESHOLD_TOKENS
+                or len(chunks) == 1
+                or len(text) >= previous_length
+            ):
+                break
+
+        result = await self.invoke_structured(reduce_summaries_template(), Summary, {
+            **option_values,
+            "extension": options.extension,
+            "content": text,
+        })
+
+        if not result:
+            return {"error": "No summary could be generated."}
+        return result.model_dump()
+
+    @staticmethod
+    def _render_partial(summary: Summary) -> str:
+        sections: List[str] = [summary.summary]
+        if summary.examples:
+            sections.append("Examples:\n" + "\n".join(f"- {example}" for example in summary.examples))
+        if summary.references:
+            sections.append("References:\n" + "\n".join(f"- {reference}" for reference in summary.references))
+        if summary.conclusions:
+            sections.append(f"Conclusions: {summary.conclusions}")
+        return "\n\n".join(sections)
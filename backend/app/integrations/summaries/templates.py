@@ -13,3 +13,34 @@ def summarize_template():
     Content:
     {content}
     """)
+
+
+def summarize_chunk_template():
+    return PromptTemplate.from_template("""
+    You are an expert AI assistant specialized in summarizing documents.
+    The following content is part {part} of {parts} of a larger document.
+    Your task is to summarize this part, keeping every main point, definition and key fact, because it will later be merged with the summaries of the other parts.
+    The summary should be written in {language} with a {language_register} tone and a {character} style.
+    ️### ADDITIONAL INSTRUCTIONS:
+    - If {include_references} is true, include a list of references found in this part.
+    - If {include_examples} is true, keep the relevant examples found in this part.
+    - If {include_conclusions} is true, note the conclusions of this part.
+    Content:
+    {content}
+    """)
+
+
+def reduce_summaries_template():
+    return PromptTemplate.from_template("""
+    You are an expert AI assistant specialized in summarizing documents.
+    The following are summaries of consecutive parts of one document, in order.
+    Your task is to merge them into a single summary of the whole document that captures the main points and key information, without repeating content.
+    The summary should be written in {language} with a {language_register} tone and a {character} style.
+    The summary should be of {extension} length.
+    ️### ADDITIONAL INSTRUCTIONS:
+    - If {include_references} is true, include a list of references used in the summary.
+    - If {include_examples} is true, provide relevant examples to illustrate key points.
+    - If {include_conclusions} is true, add a conclusion section summarizing the overall insights.
+    Partial summaries:
+    {content}
+    """)
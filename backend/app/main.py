@@ -1,9 +1,75 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from app.api.routes import router as api_router
+from app.infrastructure.cache.response_cache import get_response_cache
+from app.infrastructure.files.document_store import get_document_store
+from app.infrastructure.files.extraction_cache import get_extraction_cache
+from app.infrastructure.files.extraction_pool import get_extraction_pool
+from app.infrastructure.metrics import MetricsMiddleware, registry
+from app.integrations.model_pool import get_model_pool
+from app.integrations.rate_limiter import rate_limiter_stats
+from app.core.settings import get_settings
+from app.services.job_service import get_job_manager
+from app.services.game_generation_service import get_game_pool
+from app.services.single_flight import single_flight
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Model clients are reused for the lifetime of the app (and its event loop)
+    model_pool = get_model_pool()
+    # Background job workers (resume jobs interrupted by a restart)
+    job_manager = get_job_manager() if get_settings().JOBS_ENABLED else None
+    if job_manager:
+        await job_manager.start()
+    # Keep the pools of popular games topped up
+    game_pool = get_game_pool()
+    if game_pool.keys:
+        await game_pool.start()
+    yield
+    await game_pool.stop()
+    if job_manager:
+        await job_manager.stop()
+    model_pool.close()
+    # Stop the document extraction worker processes
+    get_extraction_pool().shutdown()
+
+def collect_runtime_stats():
+    """Scrape-time gauges from the caches, pools and limiters (see app.infrastructure.metrics)"""
+    caches = {
+        "response": get_response_cache().stats(),
+        "extraction": get_extraction_cache().stats(),
+        "documents": get_document_store().stats(),
+    }
+    for stat in ("entries", "bytes", "hits", "misses", "evictions"):
+        kind = "gauge" if stat in ("entries", "bytes") else "counter"
+        yield (f"learngo_cache_{stat}", kind, f"Cache {stat}.", [({"cache": name}, values[stat]) for name, values in caches.items()])
+
+    limiters = rate_limiter_stats()
+    for stat, kind in (("queue_depth", "gauge"), ("in_flight", "gauge"), ("concurrency_limit", "gauge"), ("throttled", "counter"), ("completed", "counter")):
+        yield (f"learngo_llm_{stat}", kind, f"Model rate limiter {stat.replace('_', ' ')}.", [({"model": limiter["model"]}, limiter[stat]) for limiter in limiters])
+
+    yield ("learngo_model_pool_clients", "gauge", "Pooled model clients.", [({}, get_model_pool().stats()["models"])])
+    yield ("learngo_coalesced_requests_in_flight", "gauge", "Distinct generations shared by concurrent identical requests.", [({}, single_flight.in_flight)])
+
+    if get_settings().JOBS_ENABLED:
+        job_manager = get_job_manager()
+        yield ("learngo_jobs", "gauge", "Stored jobs by status.", [({"status": status}, count) for status, count in job_manager.store.count_by_status().items()])
+        yield ("learngo_jobs_queue_depth", "gauge", "Jobs waiting for a worker.", [({}, job_manager.queue_depth())])
+
+    game_pool = get_game_pool().stats()
+    yield ("learngo_game_pool_available", "gauge", "Pre-generated games ready to serve.", [
+        ({"topic": pool["topic"], "game_type": pool["game_type"], "language": pool["language"]}, pool["available"]) for pool in game_pool["pools"]
+    ])
+    yield ("learngo_game_pool_requests_total", "counter", "Pooled game requests by outcome.", [
+        ({"outcome": "hit"}, game_pool["hits"]), ({"outcome": "miss"}, game_pool["misses"])
+    ])
+
+registry.register_collector(collect_runtime_stats)
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Chrome IA System", version="1.0.0")
+    app = FastAPI(title="Chrome IA System", version="1.0.0", lifespan=lifespan)
 
     # CORS settings
     app.add_middleware(
@@ -13,11 +79,17 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Latency, in-flight and error counts per endpoint, scraped at /metrics
+    app.add_middleware(MetricsMiddleware)
 
     @app.get("/")
     async def home():
         return {"message": "Welcome to the Chrome IA System API"}
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
     app.include_router(api_router, prefix="/api")
     
     return app
@@ -0,0 +1,17 @@
+from functools import lru_cache
+from typing import Any, Callable
+import importlib
+
+def lazy_client(path: str) -> Callable[[], Any]:
+    """Getter for one shared instance of the AI client class at "module:Class".
+
+    The class is imported on the first call: LangChain is most of the app's
+    import time, so a process only pays for it once a request needs a model.
+    """
+    module_name, class_name = path.split(":")
+
+    @lru_cache()
+    def get_client():
+        return getattr(importlib.import_module(module_name), class_name)()
+
+    return get_client
@@ -0,0 +1,67 @@
+from typing import AsyncIterator, Awaitable, Callable, Dict, List
+import asyncio
+from app.domain.models import FlashcardRequest, SummaryOptions
+from app.domain.exercises_models import ExerciseType
+from app.services.summarize_service import summarize_content
+from app.services.flashcar_generation_service import generate_flashcards
+from app.services.exercise_generation_service import generate_exercises
+
+ARTIFACTS = ("summary", "flashcards", "exercises")
+
+def _artifact_calls(
+    content: str,
+    artifacts: List[str],
+    summary_options: SummaryOptions,
+    flashcards_count: int,
+    difficulty_level: str,
+    focus_area: str,
+    exercises_count: int,
+    exercises_difficulty: str,
+    exercises_types: ExerciseType,
+) -> Dict[str, Callable[[], Awaitable]]:
+    calls = {
+        "summary": lambda: summarize_content(content, summary_options),
+        "flashcards": lambda: generate_flashcards(FlashcardRequest(
+            content=content,
+            flashcards_count=flashcards_count,
+            difficulty_level=difficulty_level,
+            focus_area=focus_area
+        )),
+        "exercises": lambda: generate_exercises(content, exercises_count, exercises_difficulty, exercises_types),
+    }
+    return {name: calls[name] for name in ARTIFACTS if name in artifacts}
+
+async def generate_bundle(content: str, artifacts: List[str], **options) -> dict:
+    """Generate the requested artifacts concurrently from the same content.
+
+    A failing artifact is reported as {"error": ...} without discarding the others.
+    """
+    calls = _artifact_calls(content, artifacts, **options)
+    results = await asyncio.gather(*(call() for call in calls.values()), return_exceptions=True)
+
+    bundle = {}
+    for name, result in zip(calls, results):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+        bundle[name] = {"error": str(result)} if isinstance(result, Exception) else result
+    return bundle
+
+async def stream_bundle(content: str, artifacts: List[str], **options) -> AsyncIterator[dict]:
+    """Yield each artifact as {"event": name, "data": ...} as soon as it is ready, then a done event"""
+    calls = _artifact_calls(content, artifacts, **options)
+    tasks = {asyncio.ensure_future(call()): name for name, call in calls.items()}
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks[task]
+                if task.exception() is not None:
+                    yield {"event": "error", "data": {"artifact": name, "detail": str(task.exception())}}
+                else:
+                    yield {"event": name, "data": task.result()}
+        yield {"event": "done", "data": {"artifacts": list(calls)}}
+    finally:
+        # The client went away: stop the generations that are still running
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,83 @@
+from typing import List, Optional
+import asyncio
+from fastapi import HTTPException
+from app.infrastructure.files.chunking import estimate_tokens
+from app.infrastructure.files.document_store import get_document_store
+from app.infrastructure.files.file_manager import (
+    extract_file_contents,
+    extraction_failed,
+    join_file_contents,
+    join_pages,
+    normalize_file_contents,
+)
+from app.infrastructure.files.uploads import SUPPORTED_EXTENSIONS
+
+def _describe(document_id: str, filenames: List[str], content: str) -> dict:
+    return {
+        "document_id": document_id,
+        "filenames": filenames,
+        "chars": len(content),
+        "tokens": estimate_tokens(content),
+    }
+
+def _has_text(filename: str, pages: List[str]) -> bool:
+    # PDFs start with a metadata page, which every PDF has
+    text_pages = pages[1:] if filename.lower().endswith(".pdf") else pages
+    return any(page.strip() for page in text_pages)
+
+async def create_document(files) -> dict:
+    """Extract and normalize the files once and store them under their content hash.
+
+    Every file must extract: a stored document is sent to the model on every
+    use, so error messages or empty files are rejected up front.
+    """
+    unsupported = [upload.filename for upload in files if not (upload.filename or "").lower().endswith(SUPPORTED_EXTENSIONS)]
+    if unsupported:
+        raise HTTPException(status_code=415, detail=f"Unsupported file type: {', '.join(unsupported)} (PDF or DOCX only)")
+
+    data = await extract_file_contents(files)
+    failed = [
+        upload.filename for upload, pages in zip(files, data) if extraction_failed(pages) or not _has_text(upload.filename, pages)
+    ]
+    if failed:
+        raise HTTPException(status_code=422, detail=f"Could not extract text from: {', '.join(failed)}")
+
+    store = get_document_store()
+    normalized = normalize_file_contents(data)
+    document_id = store.make_id(normalized)
+    filenames = [upload.filename for upload in files]
+    await asyncio.to_thread(store.put, document_id, filenames, normalized)
+    return _describe(document_id, filenames, join_pages(normalized))
+
+async def describe_document(document_id: str) -> Optional[dict]:
+    store = get_document_store()
+    document = await asyncio.to_thread(store.load, document_id)
+    if document is None:
+        return None
+    content = await asyncio.to_thread(store.get, document_id)
+    return _describe(document_id, document["filenames"], content)
+
+def check_source(files, document_id: Optional[str], required: bool = True) -> None:
+    """Reject requests that send both files and a document_id, or (when `required`) neither"""
+    if files and document_id:
+        raise HTTPException(status_code=422, detail="Send either files or document_id, not both")
+    if required and not files and not document_id:
+        raise HTTPException(status_code=422, detail="Send files or a document_id")
+
+def document_not_found(document_id: str) -> HTTPException:
+    return HTTPException(status_code=404, detail=f"Document {document_id} not found; upload it again to /documents")
+
+async def get_document_content(document_id: str) -> Optional[str]:
+    return await asyncio.to_thread(get_document_store().get, document_id)
+
+async def resolve_content(files, document_id: Optional[str], required: bool = True) -> str:
+    """The prompt content of the uploaded files, or of a document stored with /documents"""
+    check_source(files, document_id, required)
+
+    if document_id:
+        content = await get_document_content(document_id)
+        if content is None:
+            raise document_not_found(document_id)
+        return content
+
+    return join_file_contents(await extract_file_contents(files))
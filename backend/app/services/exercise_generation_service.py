@@ -1,7 +1,32 @@
+from typing import Dict, Optional
 from app.domain.exercises_models import ExerciseType
-from app.integrations.exercises.client import ExercisesAIClient
+from app.infrastructure.files.retrieval import focus_content
+from app.services.ai_clients import lazy_client
+from app.services.single_flight import coalesce
 
-ai_client = ExercisesAIClient()
+get_ai_client = lazy_client("app.integrations.exercises.client:ExercisesAIClient")
 
-async def generate_exercises(content: str, exercises_count: int = 5, exercises_difficulty: str = "medium", exercises_types: ExerciseType = ExerciseType.multiple_choice):
-    return await ai_client.generate_exercises(content, exercises_count, exercises_difficulty, exercises_types)
\ No newline at end of file
+async def generate_exercises(content: str, exercises_count: int = 5, exercises_difficulty: str = "medium", exercises_types: ExerciseType = ExerciseType.multiple_choice, topic: Optional[str] = None):
+    async def generate():
+        # With a topic, large documents are narrowed to the parts about it
+        focused = await focus_content(content, topic) if topic else content
+        return await get_ai_client().generate_exercises(focused, exercises_count, exercises_difficulty, exercises_types)
+
+    return await coalesce(
+        "exercises",
+        {"exercises_count": exercises_count, "exercises_difficulty": exercises_difficulty, "exercises_types": exercises_types, "topic": topic},
+        content=content,
+        run=generate,
+    )
+
+async def generate_mixed_exercises(content: str, exercises_distribution: Dict[ExerciseType, int], exercises_difficulty: str = "medium", topic: Optional[str] = None):
+    async def generate():
+        focused = await focus_content(content, topic) if topic else content
+        return await get_ai_client().generate_mixed_exercises(focused, exercises_distribution, exercises_difficulty)
+
+    return await coalesce(
+        "mixed_exercises",
+        {"exercises_distribution": exercises_distribution, "exercises_difficulty": exercises_difficulty, "topic": topic},
+        content=content,
+        run=generate,
+    )
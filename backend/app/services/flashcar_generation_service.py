@@ -1,7 +1,23 @@
-from app.integrations.flashcards.client import FlashcardsAIClient
 from app.domain.models import FlashcardRequest
+from app.infrastructure.files.retrieval import focus_content
+from app.services.ai_clients import lazy_client
+from app.services.single_flight import coalesce
 
-ai_client = FlashcardsAIClient()
+# The default focus area covers the whole document, so there is nothing to retrieve for it
+DEFAULT_FOCUS_AREA = FlashcardRequest.model_fields["focus_area"].default
+
+get_ai_client = lazy_client("app.integrations.flashcards.client:FlashcardsAIClient")
+
+async def _generate(flashcard_request: FlashcardRequest) -> list:
+    if flashcard_request.focus_area != DEFAULT_FOCUS_AREA:
+        content = await focus_content(flashcard_request.content, flashcard_request.focus_area)
+        flashcard_request = flashcard_request.model_copy(update={"content": content})
+    return await get_ai_client().generate_flashcards(flashcard_request)
 
 async def generate_flashcards(flashcard_request) -> list:
-    return await ai_client.generate_flashcards(flashcard_request)
\ No newline at end of file
+    return await coalesce(
+        "flashcards",
+        flashcard_request.model_dump(exclude={"content"}),
+        content=flashcard_request.content,
+        run=lambda: _generate(flashcard_request),
+    )
\ No newline at end of file
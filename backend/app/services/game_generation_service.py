@@ -1,7 +1,38 @@
-from app.domain.games_models import GameOptions
-from app.integrations.games.client import GameAIClient
+from functools import lru_cache
+import asyncio
+from app.core.settings import get_settings
+from app.domain.games_models import GameOptions, WordSearchBatchRequest
+from app.services.game_pool import GamePool, parse_pool_keys
+from app.services.ai_clients import lazy_client
+from app.services.single_flight import coalesce
 
-ai_client = GameAIClient()
+get_ai_client = lazy_client("app.integrations.games.client:GameAIClient")
+
+@lru_cache()
+def get_game_pool() -> GamePool:
+    settings = get_settings()
+    # Pooled games must differ from each other, so they skip the response cache
+    return GamePool(
+        lambda options: get_ai_client().generate_game_words(options, use_cache=False),
+        parse_pool_keys(settings.GAME_POOL_KEYS) if settings.GAME_POOL_ENABLED else [],
+        size=settings.GAME_POOL_SIZE,
+        low_water=settings.GAME_POOL_LOW_WATER,
+        concurrency=settings.GAME_POOL_REFILL_CONCURRENCY,
+        refill_interval=settings.GAME_POOL_REFILL_INTERVAL_SECONDS,
+    )
 
 async def generate_game(options: GameOptions):
-    return await ai_client.generate_game(options)
+    # Popular games are served from the pre-generated pool
+    pooled = get_game_pool().take(options)
+    if pooled is not None:
+        return await get_ai_client().layout_game(pooled, options)
+
+    return await coalesce("game", options, run=lambda: get_ai_client().generate_game(options))
+
+async def generate_word_search_batch(request: WordSearchBatchRequest) -> list:
+    from app.integrations.games.word_search_generator import WordSearchGenerator
+
+    generator = WordSearchGenerator(request.difficulty, request.language, request.size)
+    # CPU-bound grid building stays off the event loop
+    puzzles = await asyncio.to_thread(generator.generate_batch, request.words, request.count, request.seed)
+    return [puzzle.to_dict() for puzzle in puzzles]
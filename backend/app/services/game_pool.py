@@ -0,0 +1,139 @@
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import random
+
+from app.domain.games_models import GameOptions
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, str, str]
+
+
+def pool_key(options: GameOptions) -> PoolKey:
+    # Same normalization as request coalescing: case and spacing do not change the game
+    return (" ".join(options.topic.split()).casefold(), options.game_type, options.language.strip().casefold())
+
+
+def parse_pool_keys(entries: List[str]) -> List[GameOptions]:
+    """Parse "topic|game_type|language" entries (language defaults to the GameOptions default)"""
+    options = []
+    for entry in entries:
+        parts = [part.strip() for part in entry.split("|")]
+        try:
+            fields = dict(zip(("topic", "game_type", "language"), parts))
+            options.append(GameOptions(**fields))
+        except ValueError:
+            logger.warning("Ignoring invalid GAME_POOL_KEYS entry: %r", entry)
+    return options
+
+
+class GamePool:
+    """Pre-generated games for popular (topic, game_type, language) keys.
+
+    `take()` serves a random game from the key's pool and removes it, so
+    consecutive requests get different games. A background task tops a pool
+    back up to `size` once it drops to `low_water`. It also checks every
+    `refill_interval` seconds, which retries refills that failed.
+
+    Only the generated words are pooled; the grid is laid out per request,
+    so the requested difficulty still applies.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[GameOptions], Awaitable[dict]],
+        keys: List[GameOptions],
+        size: int = 10,
+        low_water: int = 3,
+        concurrency: int = 2,
+        refill_interval: float = 60,
+    ):
+        self.generate = generate
+        self.keys: Dict[PoolKey, GameOptions] = {pool_key(options): options for options in keys}
+        self.size = size
+        self.low_water = min(low_water, size)
+        self.concurrency = max(1, concurrency)
+        self.refill_interval = refill_interval
+        self._games: Dict[PoolKey, List[dict]] = {key: [] for key in self.keys}
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        self.failures = 0
+
+    def take(self, options: GameOptions) -> Optional[dict]:
+        key = pool_key(options)
+        games = self._games.get(key)
+        if games is None:
+            return None
+        if not games:
+            self.misses += 1
+            self._request_refill()
+            return None
+
+        # Random pick; swap with the last one so removal is O(1)
+        index = random.randrange(len(games))
+        games[index], games[-1] = games[-1], games[index]
+        game = games.pop()
+        self.hits += 1
+        if len(games) <= self.low_water:
+            self._request_refill()
+        return game
+
+    async def start(self) -> None:
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._refill_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _request_refill(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _refill_loop(self) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        while True:
+            self._wake.clear()
+            low = [key for key, games in self._games.items() if len(games) <= self.low_water]
+            await asyncio.gather(*(self._refill(key, semaphore) for key in low))
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.refill_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _refill(self, key: PoolKey, semaphore: asyncio.Semaphore) -> None:
+        games = self._games[key]
+        while len(games) < self.size:
+            async with semaphore:
+                try:
+                    game = await self.generate(self.keys[key])
+                except Exception:
+                    logger.exception("Game pool refill failed for %s", key)
+                    game = None
+            if not game or "error" in game:
+                # Try again on the next round instead of hammering the API
+                self.failures += 1
+                return
+            self.generated += 1
+            games.append(game)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "low_water": self.low_water,
+            "hits": self.hits,
+            "misses": self.misses,
+            "generated": self.generated,
+            "failures": self.failures,
+            "pools": [
+                {"topic": topic, "game_type": game_type, "language": language, "available": len(self._games[(topic, game_type, language)])}
+                for topic, game_type, language in self._games
+            ],
+        }
+
@@ -0,0 +1,102 @@
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Optional
+import asyncio
+from app.core.settings import get_settings
+from app.domain.models import SummaryOptions
+from app.infrastructure.files.file_manager import extract_staged_contents, join_file_contents
+from app.infrastructure.files.uploads import StagedUpload, keep_uploads, remove_uploads
+from app.infrastructure.jobs.manager import JobHandler, JobManager, JobProgress
+from app.infrastructure.jobs.store import JobStore
+from app.services.document_service import check_source, document_not_found, get_document_content
+from app.services.summarize_service import summarize_content
+from app.services.learning_path_service import stream_learning_path
+
+async def keep_job_input(files, document_id: Optional[str]) -> dict:
+    """Job parameters for the request's content: the uploads kept on disk, or the document_id.
+
+    Extraction happens in the job, so submitting a large upload returns right away.
+    """
+    check_source(files, document_id)
+    if document_id:
+        if await get_document_content(document_id) is None:
+            raise document_not_found(document_id)
+        return {"document_id": document_id}
+    uploads = await keep_uploads(files, get_settings().JOBS_UPLOAD_DIR)
+    return {"uploads": [asdict(upload) for upload in uploads]}
+
+async def job_content(params: dict, progress: JobProgress) -> str:
+    if "document_id" in params:
+        content = await get_document_content(params["document_id"])
+        if content is None:
+            raise RuntimeError(f"Document {params['document_id']} is no longer stored")
+        return content
+    await progress.update({"stage": "extracting"})
+    data = await extract_staged_contents([StagedUpload(**upload) for upload in params["uploads"]])
+    return join_file_contents(data)
+
+def removing_uploads(handler: JobHandler) -> JobHandler:
+    """Remove the job's kept uploads once it succeeded or failed"""
+    async def run(params: dict, progress: JobProgress):
+        uploads = [StagedUpload(**upload) for upload in params.get("uploads", [])]
+        try:
+            return await handler(params, progress)
+        except asyncio.CancelledError:
+            # Shutting down: the job runs again on the next start and still needs them
+            uploads = []
+            raise
+        finally:
+            if uploads:
+                await asyncio.to_thread(remove_uploads, uploads)
+    return run
+
+async def summarize_job(params: dict, progress: JobProgress) -> dict:
+    content = await job_content(params, progress)
+    await progress.update({"stage": "summarizing"})
+    summary = await summarize_content(content, SummaryOptions(**params["options"]))
+    return {"summary": summary}
+
+async def learning_path_job(params: dict, progress: JobProgress) -> dict:
+    """Build the learning path from its stream, saving it as partial output as it grows"""
+    learning_path = None
+    modules = []
+    sessions_done = 0
+    sessions_total = 0
+
+    content = await job_content(params, progress)
+    async for event in stream_learning_path(content=content, **params["options"]):
+        kind, data = event["event"], event["data"]
+        if kind == "error":
+            raise RuntimeError(data["detail"])
+
+        if kind == "path":
+            learning_path = {**data, "modules": modules}
+        elif kind == "module":
+            modules.append(data)
+            sessions_total += len(data["sessions"])
+        elif kind == "session":
+            # Replace the session header sent with its module by the full session
+            session = data["session"]
+            for module in modules:
+                if module["id"] == data["moduleId"]:
+                    module["sessions"] = [session if s["id"] == session["id"] else s for s in module["sessions"]]
+            sessions_done += 1
+
+        await progress.update(
+            {"stage": kind, "sessions_done": sessions_done, "sessions_total": sessions_total},
+            partial=learning_path
+        )
+
+    return {"learning_path": learning_path}
+
+@lru_cache()
+def get_job_manager() -> JobManager:
+    settings = get_settings()
+    store = JobStore(settings.JOBS_DB_PATH, settings.JOBS_TTL_SECONDS)
+    return JobManager(
+        store,
+        {"summarize": removing_uploads(summarize_job), "learning_path": removing_uploads(learning_path_job)},
+        max_workers=settings.JOBS_MAX_WORKERS,
+        cleanup_interval=settings.JOBS_CLEANUP_INTERVAL_SECONDS,
+        partial_interval=settings.JOBS_PARTIAL_INTERVAL_SECONDS,
+    )
@@ -1,7 +1,8 @@
-from app.integrations.roadmap.client import RoadmapAIClient
 from app.domain.models import RoadmapOptions
+from app.services.ai_clients import lazy_client
+from app.services.single_flight import coalesce
 
-ai_client = RoadmapAIClient()
+get_ai_client = lazy_client("app.integrations.roadmap.client:RoadmapAIClient")
 
 async def generate_roadmap(options: RoadmapOptions) -> str:
-    return await ai_client.generate_roadmap(options)
\ No newline at end of file
+    return await coalesce("roadmap", options, run=lambda: get_ai_client().generate_roadmap(options))
\ No newline at end of file
@@ -0,0 +1,87 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+import asyncio
+import copy
+import hashlib
+import json
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+# Options whose case does not change what the model generates ("Spanish" / "spanish")
+CASE_INSENSITIVE_OPTIONS = frozenset({"language", "difficulty", "difficulty_level", "exercises_difficulty", "complexity_level"})
+
+
+def _normalize(value: Any, name: Optional[str] = None) -> Any:
+    """Normalize request options so trivially different requests share a key.
+
+    Whitespace is collapsed everywhere, but only the options named in
+    CASE_INSENSITIVE_OPTIONS are casefolded. Dict and list order is kept:
+    it can matter (e.g. the order of an exercise distribution), and options
+    built by the services always come in the same order.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if isinstance(value, str):
+        value = " ".join(value.split())
+        return value.casefold() if name in CASE_INSENSITIVE_OPTIONS else value
+    if isinstance(value, dict):
+        return {str(key): _normalize(item, str(key)) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def request_key(operation: str, *options: Any, content: Optional[str] = None) -> str:
+    """Key of a request from its options (normalized) and document content (exact: case matters in code)."""
+    data = json.dumps(_normalize(list(options)), ensure_ascii=False, default=str)
+    digest = hashlib.sha256(data.encode("utf-8"))
+    if content is not None:
+        digest.update(b"\x00")
+        digest.update(content.encode("utf-8"))
+    return f"{operation}:{digest.hexdigest()}"
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls into one in-flight call.
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it runs await the same task. Every caller gets its own deep copy of
+    the result. Waiters are shielded from the task, so a caller that is
+    cancelled (e.g. the client disconnected) does not cancel the call for the
+    others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        # Tasks belong to one event loop; never share them across loops
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved when every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+single_flight = SingleFlight()
+
+
+async def coalesce(operation: str, *options: Any, content: Optional[str] = None, run: Callable[[], Awaitable[T]]) -> T:
+    """Run `run()`, sharing one call among identical concurrent requests (see `request_key`)."""
+    return await single_flight.do(request_key(operation, *options, content=content), run)
@@ -1,7 +1,8 @@
-from app.integrations.summaries.client import SummarizeAIClient
 from app.domain.models import SummaryOptions
+from app.services.ai_clients import lazy_client
+from app.services.single_flight import coalesce
 
-ai_client = SummarizeAIClient()
+get_ai_client = lazy_client("app.integrations.summaries.client:SummarizeAIClient")
 
 async def summarize_content(content: str, options: SummaryOptions):
-    return await ai_client.summarize_text(content, options)
\ No newline at end of file
+    return await coalesce("summary", options, content=content, run=lambda: get_ai_client().summarize_text(content, options))
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""Cold start: import time per module and time to the first served requests.
+
+Usage (from backend/):
+    python -m benchmarks.bench_cold_start [--runs 5] [--top 15]
+
+Each run starts a fresh interpreter (as a serverless cold start does) that
+imports app.main, runs the app lifespan, then serves a health check and a
+first model-backed request (/api/roadmap/, answered instantly by
+benchmarks.fake_chat_model). The wall time from process start is included,
+so interpreter startup counts too.
+
+A separate run with `python -X importtime` lists the modules that take the
+longest to import (cumulative, including what they import), for the app's
+own modules and for top-level third-party packages.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ENVIRONMENT = {
+    "GEMINI_API_KEY": "benchmark-dummy-key",
+    "GEMINI_MODEL": "gemini-2.5-flash",
+    "GEMINI_MODEL_PRO": "gemini-2.5-pro",
+    "RESPONSE_CACHE_ENABLED": "false",
+    "JOBS_ENABLED": "false",
+    "GAME_POOL_KEYS": "[]",
+}
+
+CHILD = """
+import asyncio, json, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+async def serve():
+    import httpx
+    from benchmarks.fake_chat_model import FakeChatModel, install
+
+    install(FakeChatModel(latency="0"))
+    timings = {}
+    async with app.router.lifespan_context(app):
+        timings["lifespan"] = time.perf_counter()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            (await client.get("/api/learning-path/health")).raise_for_status()
+            timings["health"] = time.perf_counter()
+            (await client.post("/api/roadmap/", json={
+                "topic": "python", "complexity_level": "beginner", "duration": "2 weeks", "include_resources": False,
+            })).raise_for_status()
+            timings["model_request"] = time.perf_counter()
+    return timings
+
+timings = asyncio.run(serve())
+print(json.dumps({
+    "import": imported - start,
+    "first health check": timings["health"] - start,
+    "first model request": timings["model_request"] - start,
+}))
+"""
+
+
+def child_environment() -> dict:
+    env = dict(os.environ)
+    for name, value in ENVIRONMENT.items():
+        env.setdefault(name, value)
+    return env
+
+
+def cold_start(env: dict) -> dict:
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True).stdout
+    total = time.perf_counter() - start
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings["process wall time"] = total
+    return timings
+
+
+def import_times(env: dict) -> list:
+    """(module, self seconds, cumulative seconds) from -X importtime"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"], env=env, capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="modules listed per import time table")
+    args = parser.parse_args()
+
+    env = child_environment()
+    runs = [cold_start(env) for _ in range(args.runs)]
+    print(f"cold start, median of {args.runs} fresh processes (phases from the first line run; wall time from launch)")
+    for phase in runs[0]:
+        values = [run[phase] for run in runs]
+        print(f"  {phase:22s} {statistics.median(values) * 1e3:8.0f} ms   (min {min(values) * 1e3:.0f}, max {max(values) * 1e3:.0f})")
+
+    rows = import_times(env)
+    app_modules = sorted((row for row in rows if row[0].startswith("app.")), key=lambda row: -row[2])
+    # The first time a third-party package is imported is where its whole cost is charged
+    packages = {}
+    for name, _, cumulative in rows:
+        top = name.split(".")[0]
+        if top != "app" and "." not in name:
+            packages[top] = max(packages.get(top, 0), cumulative)
+
+    print("\nslowest app modules to import (cumulative)")
+    for name, own, cumulative in app_modules[:args.top]:
+        print(f"  {name:50s} {cumulative * 1e3:8.1f} ms   (self {own * 1e3:.1f} ms)")
+    print("\nslowest third-party packages to import (cumulative)")
+    for name, cumulative in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:50s} {cumulative * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Crossword layout time and quality for 10-30 word puzzles.
+
+Usage (from backend/):
+    python -m benchmarks.bench_crossword_layout [--runs 20]
+
+Each run lays out a random sample of vocabulary words and reports the time
+per layout, how many words were left unplaced and the grid density
+(letters / grid cells).
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.integrations.games.crossword_layout import build_crossword
+
+VOCABULARY = """
+PYTHON ALGORITHM VARIABLE FUNCTION COMPILER DATABASE NETWORK INTERFACE PROTOCOL
+MEMORY PROCESSOR KERNEL THREAD BINARY STRING INTEGER BOOLEAN ARRAY POINTER
+RECURSION ITERATOR LAMBDA CLOSURE DECORATOR GENERATOR EXCEPTION MODULE PACKAGE
+SYNTAX RUNTIME CACHE QUEUE STACK GRAPH TREE HASH SOCKET SERVER CLIENT ROUTER
+""".split()
+
+
+def run(words_per_puzzle: int, runs: int, seed: int) -> None:
+    rng = random.Random(seed)
+    timings, unplaced, densities = [], [], []
+    for _ in range(runs):
+        words = [{"word": word, "clue": ""} for word in rng.sample(VOCABULARY, words_per_puzzle)]
+        start = time.perf_counter()
+        crossword = build_crossword(words)
+        timings.append(time.perf_counter() - start)
+
+        filled = sum(1 for row in crossword["grid"] for cell in row if cell)
+        unplaced.append(len(crossword["unplaced"]))
+        densities.append(filled / (crossword["rows"] * crossword["cols"]))
+
+    print(
+        f"{words_per_puzzle:>3} words: "
+        f"mean {statistics.mean(timings) * 1000:7.1f} ms, max {max(timings) * 1000:7.1f} ms, "
+        f"unplaced {statistics.mean(unplaced):.2f}/puzzle, density {statistics.mean(densities):.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for words_per_puzzle in (10, 15, 20, 25, 30):
+        run(words_per_puzzle, args.runs, args.seed)
+
+
+if __name__ == "__main__":
+    main()
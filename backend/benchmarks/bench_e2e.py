@@ -0,0 +1,230 @@
+"""End-to-end latency and throughput of every API router, without network or Gemini quota.
+
+Usage (from backend/):
+    python -m benchmarks.bench_e2e [--requests 40] [--concurrency 8]
+        [--latency lognormal:0.8,0.5] [--failure-rate 0] [--throttle-rate 0]
+        [--only summarize,games] [--pages 20]
+
+The app runs in-process (httpx over ASGI, lifespan included) with every model
+call answered by benchmarks.fake_chat_model. Uploads are real PDF and DOCX
+files from benchmarks.fixtures, extracted by the real extraction pool.
+
+Each scenario sends --requests requests, --concurrency at a time, and
+reports p50/p95/p99 latency, requests per second and non-2xx responses. Job
+scenarios measure submission to result (polling the job status).
+
+The response and extraction caches are disabled and every concurrent request
+uses a different fixture or topic, so requests are neither cached nor
+coalesced. The model rate limits are raised so they do not cap the fake
+model; pass --rpm to keep a realistic limit.
+"""
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.fixtures import make_docx, make_pdf
+
+PDF = "application/pdf"
+DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def configure_environment(args) -> None:
+    """Settings are read once, so this runs before anything imports the app"""
+    defaults = {
+        "GEMINI_API_KEY": "benchmark-dummy-key",
+        "GEMINI_MODEL": "gemini-2.5-flash",
+        "GEMINI_MODEL_PRO": "gemini-2.5-pro",
+        "GEMINI_MODEL_RPM": str(args.rpm),
+        "GEMINI_MODEL_PRO_RPM": str(args.rpm),
+        "GEMINI_MODEL_MAX_CONCURRENCY": "1000",
+        "GEMINI_MODEL_PRO_MAX_CONCURRENCY": "1000",
+        "RESPONSE_CACHE_ENABLED": "false",
+        "EXTRACTION_CACHE_ENABLED": "false",
+        "JOBS_DB_PATH": os.path.join(tempfile.mkdtemp(prefix="bench-e2e-"), "jobs.sqlite3"),
+        "JOBS_UPLOAD_DIR": tempfile.mkdtemp(prefix="bench-e2e-job-uploads-"),
+        "DOCUMENT_STORE_DIR": tempfile.mkdtemp(prefix="bench-e2e-documents-"),
+        "GAME_POOL_KEYS": "[]",
+    }
+    for name, value in defaults.items():
+        os.environ.setdefault(name, value)
+
+
+@dataclass
+class Fixtures:
+    pdfs: List[bytes]
+    docxs: List[bytes]
+    # PDF fixture index -> document_id, uploaded on first use
+    document_ids: Dict[int, str] = field(default_factory=dict)
+
+    def pdf(self, i: int):
+        return ("files", (f"course-{i % len(self.pdfs)}.pdf", self.pdfs[i % len(self.pdfs)], PDF))
+
+    def docx(self, i: int):
+        return ("files", (f"notes-{i % len(self.docxs)}.docx", self.docxs[i % len(self.docxs)], DOCX))
+
+    async def document_id(self, client, i: int) -> str:
+        index = i % len(self.pdfs)
+        if index not in self.document_ids:
+            response = await client.post("/api/documents/", files=[self.pdf(index)])
+            self.document_ids[index] = response.json()["document_id"]
+        return self.document_ids[index]
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Sends request number i; returns the HTTP status
+    send: Callable[..., Awaitable[int]]
+
+
+async def _status(response_awaitable) -> int:
+    response = await response_awaitable
+    await response.aread()
+    return response.status_code
+
+
+async def _with_document(client, fx: Fixtures, i: int, url: str) -> int:
+    document_id = await fx.document_id(client, i)
+    return await _status(client.post(url, data={"document_id": document_id}))
+
+
+async def _run_job(client, submit) -> int:
+    response = await submit
+    if response.status_code != 202:
+        return response.status_code
+    status_url = response.json()["status_url"]
+    while True:
+        job = (await client.get(status_url)).json()
+        if job["status"] in ("succeeded", "failed"):
+            break
+        await asyncio.sleep(0.05)
+    return (await client.get(f"{status_url}/result")).status_code
+
+
+LEARNING_PATH_FORM = {"modules_count": "2", "sessions_per_module": "2", "topics_per_session": "2", "generate_full_content": "true"}
+
+
+def scenarios(fx: Fixtures) -> List[Scenario]:
+    return [
+        Scenario("summarize", lambda c, i: _status(c.post("/api/summarize/", files=[fx.pdf(i)]))),
+        Scenario("documents", lambda c, i: _status(c.post("/api/documents/", files=[fx.pdf(i)]))),
+        # The same PDFs as "summarize", uploaded once and then sent by document_id
+        Scenario("summarize/document_id", lambda c, i: _with_document(c, fx, i, "/api/summarize/")),
+        Scenario("flashcards", lambda c, i: _status(c.post("/api/flashcard/", files=[fx.docx(i)]))),
+        Scenario("flashcards/by_topic", lambda c, i: _status(c.post("/api/flashcard/by_topic", json={"topic": f"topic {i}"}))),
+        Scenario("exercises", lambda c, i: _status(c.post(
+            "/api/generate-exercises/", files=[fx.pdf(i)], data={"exercises_distribution": '{"multiple_choice": 3, "true_false": 2}'}
+        ))),
+        Scenario("exercises/by_topic", lambda c, i: _status(c.post("/api/generate-exercises/by_topic", json={"topic": f"topic {i}"}))),
+        Scenario("roadmap", lambda c, i: _status(c.post("/api/roadmap/", json={
+            "topic": f"topic {i}", "complexity_level": "intermediate", "duration": "4 weeks", "include_resources": True
+        }))),
+        Scenario("games/word_search", lambda c, i: _status(c.post("/api/games/", json={"topic": f"topic {i}", "game_type": "word_search"}))),
+        Scenario("games/crossword", lambda c, i: _status(c.post("/api/games/", json={"topic": f"topic {i}", "game_type": "crossword"}))),
+        Scenario("games/word-search/batch", lambda c, i: _status(c.post("/api/games/word-search/batch", json={
+            "words": ["PYTHON", "ALGORITHM", "VARIABLE", "FUNCTION", "COMPILER", "DATABASE"], "count": 10, "seed": i
+        }))),
+        Scenario("learning-path", lambda c, i: _status(c.post("/api/learning-path/generate", files=[fx.pdf(i)], data=LEARNING_PATH_FORM))),
+        Scenario("learning-path/stream", lambda c, i: _status(c.post(
+            "/api/learning-path/generate/stream", files=[fx.docx(i)], data=LEARNING_PATH_FORM
+        ))),
+        Scenario("bundle", lambda c, i: _status(c.post("/api/bundle/", files=[fx.pdf(i)]))),
+        Scenario("bundle/stream", lambda c, i: _status(c.post("/api/bundle/stream", files=[fx.docx(i)]))),
+        Scenario("jobs/summarize", lambda c, i: _run_job(c, c.post("/api/jobs/summarize", files=[fx.pdf(i)]))),
+        Scenario("jobs/learning-path", lambda c, i: _run_job(c, c.post("/api/jobs/learning-path", files=[fx.docx(i)], data=LEARNING_PATH_FORM))),
+    ]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, scenario: Scenario, requests: int, concurrency: int) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                status = await scenario.send(client, i)
+            except Exception:
+                status = 599
+            latencies.append(time.perf_counter() - start)
+            if not 200 <= status < 300:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "mean": statistics.mean(latencies),
+        "rps": requests / elapsed,
+        "errors": errors,
+    }
+
+
+async def run(args) -> None:
+    import httpx
+
+    from app.main import app
+    from benchmarks.fake_chat_model import FakeChatModel, install
+
+    model = install(FakeChatModel(args.latency, args.failure_rate, args.throttle_rate, seed=args.seed))
+    # One distinct document per concurrent request, so identical uploads are never coalesced
+    count = max(1, args.concurrency)
+    fixtures = Fixtures(
+        pdfs=[make_pdf(args.pages, seed=i) for i in range(count)],
+        docxs=[make_docx(args.pages * 10, seed=i) for i in range(count)],
+    )
+
+    selected = [scenario for scenario in scenarios(fixtures) if not args.only or scenario.name in args.only]
+    print(f"fake model latency {args.latency}, failure rate {args.failure_rate}, throttle rate {args.throttle_rate}")
+    print(f"{args.requests} requests per scenario, {args.concurrency} concurrent\n")
+    print(f"{'scenario':26s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'mean':>8s} {'req/s':>8s} {'errors':>7s}")
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for scenario in selected:
+                result = await run_scenario(client, scenario, args.requests, args.concurrency)
+                print(
+                    f"{scenario.name:26s} {result['p50'] * 1e3:6.0f}ms {result['p95'] * 1e3:6.0f}ms {result['p99'] * 1e3:6.0f}ms "
+                    f"{result['mean'] * 1e3:6.0f}ms {result['rps']:8.1f} {result['errors']:7d}"
+                )
+
+    print(f"\nfake model: {model.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=40, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", default="lognormal:0.8,0.5", help="fake model latency distribution (see fake_chat_model.parse_latency)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of model calls that fail")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of model calls answered with a 429")
+    parser.add_argument("--rpm", type=int, default=1_000_000, help="model requests per minute allowed by the rate limiter")
+    parser.add_argument("--pages", type=int, default=20, help="pages per PDF fixture (DOCX fixtures get 10 paragraphs per page)")
+    parser.add_argument("--only", type=lambda value: value.split(","), default=None, help="comma-separated scenario names")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    configure_environment(args)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
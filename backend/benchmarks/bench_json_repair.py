@@ -0,0 +1,199 @@
+"""Throughput and fuzzing of the tolerant JSON parser used for learning path output.
+
+Usage (from backend/):
+    python -m benchmarks.bench_json_repair [--sizes 0.1,1,4] [--fuzz 500]
+
+Throughput is measured on synthetic learning paths (MB of JSON) for valid
+JSON, fenced output with unescaped quotes and raw newlines, and incremental
+parsing in 32-character chunks. The previous regex-based cleanup is timed
+on the same inputs for comparison.
+
+--fuzz N mutates N random documents (code fences, trailing commas, raw
+newlines, unescaped quotes, truncation, random chunking) and checks that
+parsing never raises, that lossless mutations give back the original
+value, and that truncated output parses to a prefix of it. The exit code
+is 1 if any check fails.
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import time
+
+from app.integrations.json_repair import IncrementalJSONParser, loads
+
+WORDS = "the a of learning path module session topic example function value data model \"quoted\" it's".split()
+
+
+def sample_sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def make_learning_path(rng: random.Random, target_bytes: int) -> dict:
+    path = {"title": sample_sentence(rng, 4), "description": sample_sentence(rng, 20), "modules": []}
+    size = 0
+    while size < target_bytes:
+        module = {"title": sample_sentence(rng, 3), "description": sample_sentence(rng, 15), "sessions": []}
+        for _ in range(3):
+            module["sessions"].append({
+                "title": sample_sentence(rng, 3),
+                "duration": rng.randint(30, 120),
+                "topics": [
+                    {"title": sample_sentence(rng, 3), "content": "\n".join(sample_sentence(rng, 30) for _ in range(4))}
+                    for _ in range(3)
+                ],
+                "flashcards": [{"question": sample_sentence(rng, 8), "answer": sample_sentence(rng, 8)} for _ in range(3)],
+                "practice": [{"question": sample_sentence(rng, 10), "options": [sample_sentence(rng, 2) for _ in range(4)], "correct": 0}],
+            })
+        path["modules"].append(module)
+        size += len(json.dumps(module))
+    return path
+
+
+def legacy_parse(json_str: str):
+    """The regex cleanup LearningPathAIClient used before json_repair (logging removed)"""
+    json_str = re.sub(r'```json\s*', '', json_str)
+    json_str = re.sub(r'```\s*$', '', json_str)
+    json_str = json_str.strip()
+
+    def fix_value_quotes(match):
+        value = match.group(2).replace('\\"', '___ALREADY_ESCAPED___').replace('"', '\\"').replace('___ALREADY_ESCAPED___', '\\"')
+        return f'"{match.group(1)}": "{value}"'
+
+    pattern = r'"(content|question|answer|title|description)"\s*:\s*"((?:[^"\\]|\\.)*)(?<!\\)"'
+    json_str = re.sub(pattern, fix_value_quotes, json_str)
+    try:
+        return json.JSONDecoder().raw_decode(json_str)[0]
+    except json.JSONDecodeError:
+        match = re.search(r'\[.*\]', json_str, re.DOTALL) or re.search(r'\{.*\}', json_str, re.DOTALL)
+        if match:
+            return json.loads(match.group(0))
+        raise
+
+
+# Mutations: each returns the mutated text
+
+def fenced(text: str, rng: random.Random) -> str:
+    return f"Here is the learning path:\n```json\n{text}\n```\nLet me know if you need changes."
+
+
+def trailing_commas(text: str, rng: random.Random) -> str:
+    return re.sub(r"([}\]])", lambda m: "," + m.group(1) if rng.random() < 0.5 else m.group(1), text)
+
+
+def raw_newlines(text: str, rng: random.Random) -> str:
+    return text.replace("\\n", "\n")
+
+
+def unescaped_quotes(text: str, rng: random.Random) -> str:
+    return text.replace('\\"', '"')
+
+
+def truncated(text: str, rng: random.Random) -> str:
+    return text[:rng.randint(1, len(text) - 1)]
+
+
+def incremental(text: str, chunk: int) -> object:
+    parser = IncrementalJSONParser()
+    for start in range(0, len(text), chunk):
+        parser.feed(text[start:start + chunk])
+    return parser.close()
+
+
+def is_prefix(partial, full) -> bool:
+    """Whether `partial` is what a truncated serialization of `full` can parse to"""
+    if isinstance(full, dict):
+        if not isinstance(partial, dict) or any(key not in full for key in partial):
+            return False
+        keys = list(partial)
+        return all(partial[key] == full[key] for key in keys[:-1]) and (not keys or is_prefix(partial[keys[-1]], full[keys[-1]]))
+    if isinstance(full, list):
+        if not isinstance(partial, list) or len(partial) > len(full):
+            return False
+        return all(a == b for a, b in zip(partial[:-1], full)) and (not partial or is_prefix(partial[-1], full[len(partial) - 1]))
+    if isinstance(full, str):
+        return isinstance(partial, str) and full.startswith(partial)
+    if isinstance(full, (int, float)) and not isinstance(full, bool):
+        return isinstance(partial, (int, float)) and str(full).startswith(str(partial).rstrip("0").rstrip("."))
+    return partial == full
+
+
+def fuzz(documents: int, seed: int) -> bool:
+    rng = random.Random(seed)
+    failures = 0
+    recovered_quotes = 0
+    lossless = (fenced, trailing_commas, raw_newlines)
+
+    for i in range(documents):
+        value = make_learning_path(rng, rng.randint(200, 5000))
+        text = json.dumps(value, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 2]))
+        checks = [(mutation.__name__, mutation(text, rng), "equal") for mutation in lossless]
+        checks.append(("unescaped_quotes", unescaped_quotes(text, rng), "quotes"))
+        checks.append(("truncated", truncated(text, rng), "prefix"))
+
+        for name, mutated, expect in checks:
+            try:
+                parsed = loads(mutated) if expect != "prefix" else incremental(mutated, len(mutated))
+                chunked = incremental(mutated, rng.randint(1, 64))
+            except Exception as e:
+                failures += 1
+                print(f"[{i}] {name}: raised {e!r}")
+                continue
+
+            if chunked != parsed:
+                failures += 1
+                print(f"[{i}] {name}: chunked parse differs from one-shot parse")
+            elif expect == "equal" and parsed != value:
+                failures += 1
+                print(f"[{i}] {name}: value changed")
+            elif expect == "prefix" and parsed is not None and not is_prefix(parsed, value):
+                failures += 1
+                print(f"[{i}] {name}: not a prefix of the original")
+            elif expect == "quotes" and parsed == value:
+                recovered_quotes += 1
+
+    print(f"fuzz: {documents} documents, {documents * 5} mutations, {failures} failures")
+    print(f"unescaped quotes fully recovered in {recovered_quotes}/{documents} documents (heuristic, not checked)")
+    return failures == 0
+
+
+def throughput(label: str, fn, text: str, repeat: int = 3) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            fn(text)
+            status = "ok"
+        except Exception as e:
+            status = f"failed ({type(e).__name__})"
+        best = min(best, time.perf_counter() - start)
+    mb = len(text.encode("utf-8")) / 1e6
+    print(f"  {label:<34} {mb / best:8.1f} MB/s  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="0.1,1,4", help="document sizes in MB")
+    parser.add_argument("--fuzz", type=int, default=0, help="number of documents to fuzz (0: only measure throughput)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.fuzz:
+        sys.exit(0 if fuzz(args.fuzz, args.seed) else 1)
+
+    rng = random.Random(args.seed)
+    for size in (float(s) for s in args.sizes.split(",")):
+        value = make_learning_path(rng, int(size * 1e6))
+        text = json.dumps(value)
+        broken = unescaped_quotes(raw_newlines(fenced(text, rng), rng), rng)
+        print(f"{len(text) / 1e6:.2f} MB learning path")
+        throughput("valid, json_repair.loads", loads, text)
+        throughput("valid, legacy cleanup", legacy_parse, text)
+        throughput("fenced + quotes + newlines, repair", loads, broken)
+        throughput("fenced + quotes + newlines, legacy", legacy_parse, broken)
+        throughput("incremental, 32-char chunks", lambda t: incremental(t, 32), broken)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""CPU cost of learning path post-processing, which runs on the event loop thread.
+
+Usage (from backend/):
+    python -m benchmarks.bench_learning_path_postprocess [--shapes 2x2x2,5x4x3,10x8x5,20x8x5] [--budget-ms 20]
+
+Synthetic learning paths with full content are built for each shape
+(modules x sessions x topics). For each one the benchmark times:
+- parse: LearningPathAIClient._parse_json on valid JSON (json.loads fast path)
+- parse (repair): the same on output with a code fence and raw newlines,
+  which goes through the tolerant parser
+- format: _format_output (IDs on every module, session, topic, flashcard
+  and question)
+- encode: FastAPI's jsonable_encoder plus json.dumps, as the response is sent
+
+It also reports the peak memory of repair + format (tracemalloc) and the
+longest event loop stall seen by a 1 ms ticker while repair + format runs on
+the loop, compared with running it through asyncio.to_thread.
+
+A shape is flagged OFF-LOOP when repair + format + encode, all of which run
+on the event loop, take longer than --budget-ms: every other request on the
+worker waits that long, so such responses should be processed in a thread.
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import random
+import time
+import tracemalloc
+
+
+def configure_environment() -> None:
+    # Importing the AI clients reads the settings; no API call is made
+    for name, value in {"GEMINI_API_KEY": "benchmark-dummy-key", "GEMINI_MODEL": "gemini-2.5-flash", "GEMINI_MODEL_PRO": "gemini-2.5-pro"}.items():
+        os.environ.setdefault(name, value)
+
+
+def make_path(modules: int, sessions: int, topics: int, seed: int) -> dict:
+    from benchmarks.fake_chat_model import CannedOutputs
+
+    outputs = CannedOutputs(random.Random(seed))
+    return {"title": outputs.text(4), "description": outputs.text(), "modules": outputs.modules(True, modules, sessions, topics)}
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def max_loop_stall(work, offload: bool) -> float:
+    """Longest gap between ticks of a 1 ms ticker while `work` runs"""
+    stall = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    if offload:
+        await asyncio.to_thread(work)
+    else:
+        work()
+    await asyncio.sleep(0.01)
+    running = False
+    await task
+    return stall
+
+
+def run_shape(shape: str, repeat: int, budget: float, seed: int) -> None:
+    from fastapi.encoders import jsonable_encoder
+    from app.integrations.learning_path.client import LearningPathAIClient
+
+    client = LearningPathAIClient()
+    modules, sessions, topics = (int(part) for part in shape.split("x"))
+    data = make_path(modules, sessions, topics, seed)
+    text = json.dumps(data, ensure_ascii=False)
+    broken = "```json\n" + text.replace("\\n", "\n") + "\n```"
+
+    def parse():
+        return client._parse_json(text)
+
+    def parse_repair():
+        return client._parse_json(broken)
+
+    def process():
+        return client._format_output(client._parse_json(broken), "4 weeks", "intermediate")
+
+    formatted = process()
+    parse_time = best_of(parse, repeat)
+    repair_time = best_of(parse_repair, repeat)
+    # _format_output mutates its input, so each run gets a fresh copy (not timed)
+    copies = [copy.deepcopy(data) for _ in range(repeat)]
+    format_time = best_of(lambda: client._format_output(copies.pop(), "4 weeks", "intermediate"), repeat)
+    encode_time = best_of(lambda: json.dumps(jsonable_encoder(formatted)), repeat)
+
+    tracemalloc.start()
+    process()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stall_on_loop = asyncio.run(max_loop_stall(process, offload=False))
+    stall_offloaded = asyncio.run(max_loop_stall(process, offload=True))
+
+    on_loop = repair_time + format_time + encode_time
+    flag = "OFF-LOOP" if on_loop > budget else "ok"
+    print(
+        f"{shape:>8s} {len(text) / 1e6:7.2f} {parse_time * 1e3:8.1f} {repair_time * 1e3:9.1f} {format_time * 1e3:8.1f} "
+        f"{encode_time * 1e3:8.1f} {peak / 1e6:8.1f} {stall_on_loop * 1e3:10.1f} {stall_offloaded * 1e3:10.1f}  {flag}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shapes", default="2x2x2,5x4x3,10x8x5,20x8x5", help="comma-separated MODULESxSESSIONSxTOPICS")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=20, help="longest acceptable event loop block")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    configure_environment()
+    print(f"{'shape':>8s} {'MB':>7s} {'parse':>8s} {'repair':>9s} {'format':>8s} {'encode':>8s} {'peak MB':>8s} {'stall loop':>10s} {'stall thr':>10s}")
+    print(f"{'':>8s} {'':>7s} {'ms':>8s} {'ms':>9s} {'ms':>8s} {'ms':>8s} {'':>8s} {'ms':>10s} {'ms':>10s}")
+    for shape in args.shapes.split(","):
+        run_shape(shape, args.repeat, args.budget_ms / 1e3, args.seed)
+    print(f"\nOFF-LOOP: repair + format + encode exceeds {args.budget_ms:g} ms and blocks the event loop; run it in a thread")
+
+
+if __name__ == "__main__":
+    main()
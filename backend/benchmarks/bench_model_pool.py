@@ -0,0 +1,60 @@
+"""Per-request model client overhead: a new ChatGoogleGenerativeAI per request vs the model pool.
+
+Usage (from backend/):
+    python -m benchmarks.bench_model_pool [--requests 200]
+
+Only client construction and lookup are measured (no API calls), with a
+dummy API key. Connection reuse comes on top of this: pooled clients keep
+their HTTP connection, while new clients pay a TLS handshake on first use.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.integrations.model_pool import ModelPool, _gemini_factory
+
+MODEL = "gemini-2.5-flash"
+API_KEY = "benchmark-dummy-key"
+
+
+def per_request(requests: int) -> list:
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        _gemini_factory(MODEL, API_KEY, 7)
+        _gemini_factory(MODEL, API_KEY, 7, response_mime_type="application/json")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def pooled(requests: int) -> list:
+    pool = ModelPool()
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        pool.get(MODEL, API_KEY, 7)
+        pool.get(MODEL, API_KEY, 7, response_mime_type="application/json")
+        timings.append(time.perf_counter() - start)
+    print(f"pool stats: {pool.stats()}")
+    return timings
+
+
+def report(name: str, timings: list) -> float:
+    mean = statistics.mean(timings)
+    print(f"{name:12s} mean {mean * 1e6:10.1f} us   p95 {sorted(timings)[int(len(timings) * 0.95)] * 1e6:10.1f} us")
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    before = report("per-request", per_request(args.requests))
+    after = report("pooled", asyncio.run(pooled(args.requests)))
+    print(f"overhead saved per request: {(before - after) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Speed and correctness of the extracted text normalizer.
+
+Usage (from backend/):
+    python -m benchmarks.bench_normalizer [--pages 300]
+
+Times normalize_contents on a synthetic paginated document (running header,
+"Page N of M" footer and a bare page number on every page), then checks that:
+- running headers, footers and page numbers are removed
+- numbered headings at the top of pages ("Exercise 1", "Exercise 2", ...) are kept
+- a single-page document (as DOCX files are extracted) keeps a numbered list
+  whose numbers sit on their own lines
+The exit code is 1 if any check fails.
+"""
+import argparse
+import random
+import sys
+import time
+
+from app.infrastructure.files.normalizer import normalize_contents
+from benchmarks.fixtures import sample_text
+
+HEADER = "Introduction to Biology"
+
+
+def body(rng: random.Random, lines: int = 12) -> str:
+    return "\n".join(sample_text(rng, 15) for _ in range(lines))
+
+
+def paginated(rng: random.Random, pages: int, heading: str = "Exercise") -> list:
+    """Pages with a running header, a numbered heading, body text and two page number footers"""
+    return [
+        f"{HEADER}\n{heading} {number}\n{body(rng)}\nCourse notes - Page {number} of {pages}\n{number}"
+        for number in range(1, pages + 1)
+    ]
+
+
+def check(failures: list, name: str, ok: bool) -> None:
+    print(f"{'ok  ' if ok else 'FAIL'} {name}")
+    if not ok:
+        failures.append(name)
+
+
+def run_checks(rng: random.Random) -> list:
+    failures = []
+
+    pages = paginated(rng, 6)
+    cleaned = normalize_contents([["Filename: exercises.pdf", *pages]]).files[0][1:]
+    check(failures, "numbered headings kept", all(f"Exercise {n}" in page for n, page in enumerate(cleaned, start=1)))
+    check(failures, "running header removed", not any(HEADER in page for page in cleaned))
+    check(failures, "page footers removed", not any("Page" in page for page in cleaned))
+    check(failures, "bare page numbers removed", all(not page.rstrip().split("\n")[-1].isdigit() for page in cleaned))
+
+    answer_key = "Answer key\n" + "\n".join(f"{n}\n{rng.choice('abcd')}" for n in range(1, 9)) + "\n8"
+    cleaned = normalize_contents([[answer_key]]).files[0]
+    check(failures, "single-page numbered list kept", cleaned == [answer_key])
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    document = ["Filename: bench.pdf", *paginated(rng, args.pages)]
+    start = time.perf_counter()
+    normalized = normalize_contents([document])
+    elapsed = time.perf_counter() - start
+    print(
+        f"{args.pages} pages: {elapsed * 1e3:.1f} ms, "
+        f"{normalized.original_chars} -> {normalized.normalized_chars} chars ({normalized.chars_saved} saved)\n"
+    )
+
+    failures = run_checks(rng)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Sequential vs page-parallel PDF extraction.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pdf_extraction [--pdf path/to/file.pdf] [--pages 300] [--workers 4]
+
+Without --pdf a synthetic PDF with --pages pages is generated.
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from app.infrastructure.files.extraction_pool import ExtractionPool
+from app.infrastructure.files.file_manager import extract_pdf_content, extract_pdf_parallel
+from benchmarks.fixtures import make_pdf
+
+
+async def run_parallel(file_bytes: bytes, workers: int, threshold: int, min_pages: int) -> float:
+    pool = ExtractionPool(workers, per_request_limit=workers)
+    try:
+        # Warm the workers up so process start-up is not part of the measurement
+        await asyncio.gather(*(pool.run(len, b"") for _ in range(workers)))
+        start = time.perf_counter()
+        pages, _ = await extract_pdf_parallel(
+            file_bytes, "bench.pdf", pool, parallel_threshold=threshold, min_pages_per_job=min_pages
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+    print(f"parallel   ({workers} workers): {elapsed:8.3f}s  {len(pages) - 1} pages")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="PDF to extract (default: synthetic)")
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--threshold", type=int, default=100)
+    parser.add_argument("--min-pages", type=int, default=25)
+    args = parser.parse_args()
+
+    if args.pdf:
+        with open(args.pdf, "rb") as f:
+            file_bytes = f.read()
+    else:
+        file_bytes = make_pdf(args.pages)
+
+    start = time.perf_counter()
+    pages = extract_pdf_content(file_bytes, "bench.pdf")
+    sequential = time.perf_counter() - start
+    print(f"sequential (1 worker):  {sequential:8.3f}s  {len(pages) - 1} pages")
+
+    parallel = asyncio.run(run_parallel(file_bytes, args.workers, args.threshold, args.min_pages))
+    print(f"speed-up: {sequential / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
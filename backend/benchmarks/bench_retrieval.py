@@ -0,0 +1,81 @@
+"""BM25 retrieval speed and precision on large documents.
+
+Usage (from backend/):
+    python -m benchmarks.bench_retrieval [--sizes 0.1,1,5] [--budget 12000]
+
+Each synthetic document has 20 sections, each about one subject: common
+filler words plus a few words specific to the subject. Sections are split
+into paragraphs and shuffled, as subjects come back throughout a course.
+One subject is used as the query. The benchmark reports:
+- the time to build the index
+- the time to select the relevant chunks
+- the prompt tokens before and after selection
+- precision: the share of selected paragraphs that are about the queried subject
+"""
+import argparse
+import random
+import time
+
+from app.infrastructure.files.chunking import estimate_tokens, split_into_chunks
+from app.infrastructure.files.retrieval import BM25Index, build_index, select_relevant
+from benchmarks.fixtures import sample_text
+
+SUBJECTS = 20
+CHUNK_TOKENS = 250
+
+
+def make_document(rng: random.Random, target_bytes: int):
+    """Paragraphs as (subject, text), with subject-specific words like "photosynthesis3" """
+    paragraphs = []
+    size = 0
+    while size < target_bytes:
+        subject = rng.randrange(SUBJECTS)
+        specific = [f"{word}{subject}" for word in ("photosynthesis", "mitochondria", "enzyme", "chlorophyll")]
+        words = sample_text(rng, 120).split()
+        for _ in range(6):
+            words.insert(rng.randrange(len(words)), rng.choice(specific))
+        text = f"[s{subject}] " + " ".join(words) + "."
+        paragraphs.append((subject, text))
+        size += len(text) + 2
+    return paragraphs
+
+
+def run(size_mb: float, budget: int, seed: int) -> None:
+    rng = random.Random(seed)
+    paragraphs = make_document(rng, int(size_mb * 1e6))
+    content = "\n\n".join(text for _, text in paragraphs)
+    subject = 7
+    query = f"photosynthesis{subject} and chlorophyll{subject}"
+
+    start = time.perf_counter()
+    BM25Index(split_into_chunks(content, CHUNK_TOKENS))
+    build = time.perf_counter() - start
+
+    build_index.cache_clear()
+    build_index(content, CHUNK_TOKENS)
+    start = time.perf_counter()
+    focused = select_relevant(content, query, budget, CHUNK_TOKENS)
+    select = time.perf_counter() - start
+
+    selected = focused.split("\n\n")
+    relevant = sum(paragraph.startswith(f"[s{subject}] ") for paragraph in selected)
+    print(
+        f"{len(content) / 1e6:6.2f} MB {build * 1e3:9.1f} ms {select * 1e3:9.1f} ms "
+        f"{estimate_tokens(content):>10d} -> {estimate_tokens(focused):>7d} {relevant / len(selected):10.0%}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="0.1,1,5", help="document sizes in MB")
+    parser.add_argument("--budget", type=int, default=12_000, help="content budget in tokens")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'size':>9s} {'index':>12s} {'select':>12s} {'tokens before -> after':>21s} {'precision':>10s}")
+    for size in args.sizes.split(","):
+        run(float(size), args.budget, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""A local stand-in for the Gemini chat model, for benchmarks that must not use the API.
+
+`FakeChatModel` answers the calls AIClient makes:
+- `with_structured_output(structure).ainvoke(prompt)` returns a canned instance of
+  `structure` (Summary, FlashCardSet, the exercise sets, Roadmap, WordSearch,
+  Crossword, LearningPathOutput, ...)
+- `ainvoke(prompt)` returns an AIMessage with a canned JSON learning path, as the
+  JSON-mode learning path and session content calls expect
+
+Each call sleeps for a latency drawn from a configurable distribution and
+fails at configurable rates, either with a throttling error (HTTP 429, retried
+by the rate limiter) or with a plain error. Answers are built from a seeded
+random generator, so runs with the same seed produce the same outputs.
+
+`install()` makes every AIClient use the fake through the model pool.
+"""
+from typing import Any, Callable, Dict, List, Literal, Optional, Union, get_args, get_origin
+import asyncio
+import enum
+import json
+import random
+
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+from app.integrations.learning_path.structures import LearningPathOutput
+
+VOCABULARY = """
+PYTHON ALGORITHM VARIABLE FUNCTION COMPILER DATABASE NETWORK INTERFACE PROTOCOL
+MEMORY PROCESSOR KERNEL THREAD BINARY STRING INTEGER BOOLEAN ARRAY POINTER
+RECURSION ITERATOR LAMBDA CLOSURE DECORATOR GENERATOR EXCEPTION MODULE PACKAGE
+""".split()
+
+TEXT_WORDS = (
+    "learning model data function system process value theory method example "
+    "structure network energy history language analysis result concept student"
+).split()
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse a latency distribution, in seconds.
+
+    - "0.5" or "fixed:0.5"
+    - "uniform:LOW,HIGH"
+    - "lognormal:MEDIAN,SIGMA" (long tail, the closest to real model latency)
+    - "normal:MEAN,STDDEV" (clipped at 0)
+    """
+    kind, _, args = spec.partition(":") if ":" in spec else ("fixed", "", spec)
+    values = [float(value) for value in args.split(",")]
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(*values)
+    if kind == "lognormal" and len(values) == 2:
+        median, sigma = values
+        return lambda rng: median * rng.lognormvariate(0, sigma)
+    if kind == "normal" and len(values) == 2:
+        return lambda rng: max(0.0, rng.gauss(*values))
+    raise ValueError(f"Invalid latency distribution: {spec}")
+
+
+class ThrottledError(Exception):
+    """Looks like a 429 from the API to `is_throttling_error`"""
+    status_code = 429
+
+
+class FakeModelError(Exception):
+    pass
+
+
+class CannedOutputs:
+    """Builds plausible answers for any structure from its pydantic fields"""
+
+    def __init__(self, rng: random.Random, list_items: int = 5, text_words: int = 40):
+        self.rng = rng
+        self.list_items = list_items
+        self.text_words = text_words
+
+    def text(self, words: Optional[int] = None) -> str:
+        return " ".join(self.rng.choice(TEXT_WORDS) for _ in range(words or self.text_words)).capitalize() + "."
+
+    def structured(self, structure: type) -> BaseModel:
+        if structure is LearningPathOutput:
+            return LearningPathOutput(
+                title=self.text(4), description=self.text(), modules_json=json.dumps(self.modules(full_content=False))
+            )
+        return structure.model_validate(self._model(structure))
+
+    def _model(self, structure: type) -> dict:
+        values = {name: self._value(field.annotation, name) for name, field in structure.model_fields.items()}
+        if "choices" in values:
+            # Exactly one correct choice
+            for index, choice in enumerate(values["choices"]):
+                choice["is_correct"] = index == 0
+        if "correct_matches" in values:
+            values["correct_matches"] = dict(zip(values["premises"], values["responses"]))
+        return values
+
+    def _value(self, annotation: Any, name: str) -> Any:
+        origin = get_origin(annotation)
+        args = get_args(annotation)
+        if origin is Union:
+            options = [arg for arg in args if arg is not type(None)]
+            return self._value(self.rng.choice(options), name)
+        if origin is Literal:
+            return self.rng.choice(args)
+        if origin in (list, List):
+            if name == "words" and args[0] is str:
+                return self.rng.sample(VOCABULARY, 8)
+            count = 8 if name == "words" else self.list_items
+            return [self._value(args[0], name) for _ in range(count)]
+        if origin in (dict, Dict):
+            return {}
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return self._model(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+            return self.rng.choice(list(annotation)).value
+        if annotation is bool:
+            return self.rng.random() < 0.5
+        if annotation is int:
+            return self.rng.randint(1, 10)
+        if annotation is float:
+            return self.rng.random()
+        if name == "word":
+            return self.rng.choice(VOCABULARY)
+        if name in ("title", "topic", "subtopic", "category", "difficulty"):
+            return self.text(3)
+        return self.text()
+
+    def modules(self, full_content: bool, count: int = 2, sessions: int = 2, topics: int = 2) -> list:
+        return [
+            {
+                "title": self.text(3),
+                "description": self.text(),
+                "sessions": [self.session(full_content, topics) for _ in range(sessions)],
+            }
+            for _ in range(count)
+        ]
+
+    def session(self, full_content: bool, topics: int = 2) -> dict:
+        words = self.text_words * (10 if full_content else 1)
+        return {
+            "title": self.text(3),
+            "description": self.text(),
+            "estimatedDuration": f"{self.rng.randint(30, 120)} min",
+            "topics": [{"title": self.text(3), "content": self.text(words)} for _ in range(topics)],
+            "flashcards": [{"question": self.text(8), "answer": self.text(8)} for _ in range(topics * 2)],
+            "practice": [
+                {"question": self.text(10), "options": [self.text(2) for _ in range(4)], "correct": 0}
+                for _ in range(topics)
+            ],
+        }
+
+    def json_text(self) -> str:
+        """A full learning path; the session content call reads its top-level topics/flashcards/practice"""
+        return json.dumps({
+            "title": self.text(4),
+            "description": self.text(),
+            "modules": self.modules(full_content=True),
+            **self.session(full_content=True),
+        })
+
+
+class FakeChatModel:
+    def __init__(
+        self,
+        latency: Union[str, Callable[[random.Random], float]] = "lognormal:0.8,0.5",
+        failure_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: Optional[int] = 0,
+        list_items: int = 5,
+        text_words: int = 40,
+    ):
+        self.latency = parse_latency(latency) if isinstance(latency, str) else latency
+        self.failure_rate = failure_rate
+        self.throttle_rate = throttle_rate
+        self.rng = random.Random(seed)
+        self.outputs = CannedOutputs(self.rng, list_items, text_words)
+        self.calls = 0
+        self.failures = 0
+        self.throttled = 0
+
+    async def _respond(self, build: Callable[[], Any]) -> Any:
+        self.calls += 1
+        await asyncio.sleep(self.latency(self.rng))
+        roll = self.rng.random()
+        if roll < self.throttle_rate:
+            self.throttled += 1
+            raise ThrottledError("429 Resource exhausted (fake model)")
+        if roll < self.throttle_rate + self.failure_rate:
+            self.failures += 1
+            raise FakeModelError("Fake model failure")
+        return build()
+
+    async def ainvoke(self, prompt) -> AIMessage:
+        return await self._respond(lambda: AIMessage(content=self.outputs.json_text()))
+
+    def with_structured_output(self, structure: type) -> "_StructuredFake":
+        return _StructuredFake(self, structure)
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "failures": self.failures, "throttled": self.throttled}
+
+
+class _StructuredFake:
+    def __init__(self, model: FakeChatModel, structure: type):
+        self.model = model
+        self.structure = structure
+
+    async def ainvoke(self, prompt) -> BaseModel:
+        return await self.model._respond(lambda: self.model.outputs.structured(self.structure))
+
+
+def install(model: FakeChatModel) -> FakeChatModel:
+    """Serve every model the pool hands out (any name or variant) with `model`"""
+    from app.integrations.model_pool import get_model_pool
+
+    get_model_pool().factory = lambda *args, **variant: model
+    return model
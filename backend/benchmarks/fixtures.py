@@ -0,0 +1,86 @@
+"""Synthetic documents for the benchmarks.
+
+`make_pdf` writes a plain text PDF by hand so the benchmarks do not need a
+PDF authoring library.
+"""
+from typing import List, Optional
+import random
+
+WORDS = (
+    "learning model data function system process value theory method example "
+    "structure network energy history language analysis result concept student "
+    "course module session practice question answer memory algorithm variable"
+).split()
+
+
+def sample_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: int, lines_per_page: int = 40, seed: int = 0, header: Optional[str] = "Course Pack") -> bytes:
+    """Build a PDF with `pages` pages of text, a running header and page numbers."""
+    rng = random.Random(seed)
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog_id = add(b"")  # filled once the page tree exists
+    pages_id = add(b"")
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for number in range(1, pages + 1):
+        lines = []
+        if header:
+            lines.append(header)
+        lines.extend(sample_text(rng, 12) for _ in range(lines_per_page))
+        lines.append(str(number))
+
+        stream = ["BT /F1 10 Tf 14 TL 50 800 Td"]
+        stream.extend(f"({_escape(line)}) Tj T*" for line in lines)
+        stream.append("ET")
+        data = "\n".join(stream).encode("latin-1")
+
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (pages_id, font_id, content_id)
+        ))
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+    objects[catalog_id - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for index, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % index + body + b"\nendobj\n"
+
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog_id, xref_offset
+    )
+    return bytes(out)
+
+
+def make_docx(paragraphs: int, seed: int = 0) -> bytes:
+    import io
+    import docx
+
+    rng = random.Random(seed)
+    document = docx.Document()
+    for _ in range(paragraphs):
+        document.add_paragraph(sample_text(rng, 60))
+    stream = io.BytesIO()
+    document.save(stream)
+    return stream.getvalue()